@@ -0,0 +1,872 @@
+#!python3.9
+
+#  Trick Surf Data Dump
+#
+#  Copyright (C) 2024  anominy
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Final, Optional, Any, TextIO, Callable, Iterator
+from types import MappingProxyType as MappingProxy
+from argparse import ArgumentParser, ArgumentTypeError, Namespace as ArgumentNamespace
+from http.server import ThreadingHTTPServer
+from datetime import datetime, timezone
+from statistics import median
+
+import sys
+import os
+import io
+import json
+import time
+import shlex
+import shutil
+import platform
+import subprocess
+
+import main
+import mock_server
+
+
+_STD_OUT_STREAM: Final[TextIO] = sys.stdout
+_STD_ERR_STREAM: Final[TextIO] = sys.stderr
+
+_OPEN_FILE_WRITE_FLAG: Final[str] = 'w'
+_OPEN_FILE_READ_FLAG: Final[str] = 'r'
+_OPEN_FILE_WRITE_BINARY_FLAG: Final[str] = 'wb'
+
+_JSON_FILE_ENCODING: Final[str] = 'utf-8'
+_JSON_INDENT: Final[int] = 4
+_JSON_MIN_SEPARATORS: Final[tuple[str, str]] = (',', ':')
+
+_CURRENT_PATH: Final[str] = os.path.dirname(__file__)
+_PARENT_PATH: Final[str] = os.path.join(_CURRENT_PATH, '..')
+_MAIN_PATH: Final[str] = os.path.join(_CURRENT_PATH, 'main.py')
+_CACHE_PATH: Final[str] = os.path.join(_PARENT_PATH, '.cache')
+_BENCHMARK_PATH: Final[str] = os.path.join(_CACHE_PATH, 'benchmark')
+_BENCHMARK_RESULTS_PATH: Final[str] = os.path.join(_CACHE_PATH, 'benchmark.json')
+
+_DUMP_TRICK_SURF_DIRECTORY_NAME: Final[str] = 'trick-surf'
+_DUMP_TRICK_GXDS_DIRECTORY_NAME: Final[str] = 'trick-gxds'
+_DUMP_TRICK_SURF_PATH: Final[str] = os.path.join(_PARENT_PATH, _DUMP_TRICK_SURF_DIRECTORY_NAME)
+_DUMP_TRICK_GXDS_PATH: Final[str] = os.path.join(_PARENT_PATH, _DUMP_TRICK_GXDS_DIRECTORY_NAME)
+_DUMP_JSON_FILE_MIN_EXT: Final[str] = '.min.json'
+
+_SCALE_DIRECTORY_NAME_FMT: Final[str] = 'scale-%d'
+_SCALE_API_DIRECTORY_NAME: Final[str] = 'api'
+_SCALE_CRAWL_DIRECTORY_NAME: Final[str] = 'crawl'
+_SCALE_WRITE_DIRECTORY_NAME: Final[str] = 'write'
+_SCALE_SOURCE_DIRECTORY_NAME: Final[str] = 'src'
+
+_STAGE_GXDS_PARSE_NAME: Final[str] = 'gxds_parse'
+_STAGE_GXDS_MERGE_NAME: Final[str] = 'gxds_merge'
+_STAGE_TRICK_SURF_CRAWL_NAME: Final[str] = 'trick_surf_crawl'
+_STAGE_TRICK_SURF_WRITE_NAME: Final[str] = 'trick_surf_write'
+
+_STAGE_NAMES: Final[tuple[str, ...]] = (
+    _STAGE_GXDS_PARSE_NAME,
+    _STAGE_GXDS_MERGE_NAME,
+    _STAGE_TRICK_SURF_CRAWL_NAME,
+    _STAGE_TRICK_SURF_WRITE_NAME
+)
+
+_RESULTS_PYTHON_FIELD_NAME: Final[str] = 'python'
+_RESULTS_PLATFORM_FIELD_NAME: Final[str] = 'platform'
+_RESULTS_TIMESTAMP_FIELD_NAME: Final[str] = 'timestamp'
+_RESULTS_REPEAT_FIELD_NAME: Final[str] = 'repeat'
+_RESULTS_SCALES_FIELD_NAME: Final[str] = 'scales'
+_RESULTS_SECONDS_FIELD_NAME: Final[str] = 'seconds'
+_RESULTS_MEDIAN_SECONDS_FIELD_NAME: Final[str] = 'median_seconds'
+_RESULTS_RUNS_FIELD_NAME: Final[str] = 'runs'
+_RESULTS_SIZE_FIELD_NAME: Final[str] = 'size'
+_RESULTS_SUCCESS_FIELD_NAME: Final[str] = 'success'
+
+# Synthetic data is the dumped data replicated w/ shifted ids, the columns of each table shifted by the stride of the table they point to.
+_TRICK_GXDS_TABLE_ID_COLUMNS: Final[dict[str, dict[int, str]]] = MappingProxy({
+    main._TRICK_GXDS_PLAYER_TABLE_NAME: MappingProxy({
+        0: main._TRICK_GXDS_PLAYER_TABLE_NAME
+    }),
+    main._TRICK_GXDS_ROUTE_TABLE_NAME: MappingProxy({
+        0: main._TRICK_GXDS_ROUTE_TABLE_NAME,
+        1: main._TRICK_GXDS_TRICK_TABLE_NAME,
+        2: main._TRICK_GXDS_TRIGGER_TABLE_NAME
+    }),
+    main._TRICK_GXDS_TRICK_TABLE_NAME: MappingProxy({
+        0: main._TRICK_GXDS_TRICK_TABLE_NAME,
+        5: main._TRICK_GXDS_PLAYER_TABLE_NAME
+    }),
+    main._TRICK_GXDS_TRIGGER_TABLE_NAME: MappingProxy({
+        0: main._TRICK_GXDS_TRIGGER_TABLE_NAME
+    })
+})
+
+_TRICK_GXDS_TABLE_ROWS: Final[dict[str, Callable[[tuple[Any, ...]], Optional[tuple[Any, ...]]]]] = MappingProxy({
+    main._TRICK_GXDS_PLAYER_TABLE_NAME: main._trick_gxds_player_row,
+    main._TRICK_GXDS_ROUTE_TABLE_NAME: main._trick_gxds_route_row,
+    main._TRICK_GXDS_TRICK_TABLE_NAME: main._trick_gxds_trick_row,
+    main._TRICK_GXDS_TRIGGER_TABLE_NAME: main._trick_gxds_trigger_row
+})
+
+_SQL_INSERT_HEADER_FMT: Final[str] = 'INSERT INTO `%s` VALUES\n'
+_SQL_ROW_SEPARATOR: Final[str] = ',\n'
+_SQL_STATEMENT_END: Final[str] = ';\n'
+_SQL_STRING_QUOTE: Final[str] = '\''
+_SQL_STRING_ESCAPES: Final[dict[str, str]] = MappingProxy({
+    '\\': '\\\\',
+    '\'': '\\\'',
+    **{char: '\\' + escaped_char for escaped_char, char in main._SQL_STRING_ESCAPES.items()}
+})
+
+_TRICK_SURF_GAMES_NAME: Final[str] = 'games'
+_TRICK_SURF_MAPS_NAME: Final[str] = 'maps'
+_TRICK_SURF_PLAYERS_NAME: Final[str] = 'players'
+_TRICK_SURF_SERVERS_NAME: Final[str] = 'servers'
+_TRICK_SURF_EVENTS_NAME: Final[str] = 'events'
+_TRICK_SURF_TRICKS_NAME: Final[str] = 'tricks'
+_TRICK_SURF_RANKINGS_NAME: Final[str] = 'rankings'
+_TRICK_SURF_TRIGGERS_NAME: Final[str] = 'triggers'
+_TRICK_SURF_TELEPORTS_NAME: Final[str] = 'teleports'
+
+_TRICK_SURF_ID_FIELD_NAME: Final[str] = 'id'
+_TRICK_SURF_NAME_FIELD_NAME: Final[str] = 'name'
+_TRICK_SURF_MAP_ID_FIELD_NAME: Final[str] = 'map_id'
+_TRICK_SURF_PLAYER_ID_FIELD_NAME: Final[str] = 'player_id'
+_TRICK_SURF_TRIGGER_ID_FIELD_NAME: Final[str] = 'trigger_id'
+_TRICK_SURF_SEQUENCE_FIELD_NAME: Final[str] = 'sequence'
+_TRICK_SURF_RANKINGS_MAP_FIELD_NAME: Final[str] = 'map'
+_TRICK_SURF_RANKINGS_FIELD_NAME: Final[str] = 'rankings'
+
+_TRICK_SURF_REPLICA_NAME_FMT: Final[str] = '%s~%d'
+
+_BYTES_PER_MEBIBYTE: Final[int] = 1024 * 1024
+
+_INFO_MESSAGE_GENERATED_FMT: Final[str] = 'INFO :: Benchmark :: Generated %dx dataset, %d files & %.1f MiB'
+_INFO_MESSAGE_STAGE_FMT: Final[str] = 'INFO :: Benchmark :: %s @ %dx took %.3f s (median %.3f s, size %d)'
+_INFO_MESSAGE_WROTE_RESULTS_FMT: Final[str] = 'INFO :: Benchmark :: Wrote results to %s'
+_FAILURE_MESSAGE_STAGE_FMT: Final[str] = '-- FAILURE :: Benchmark :: %s @ %dx didn\'t succeed'
+_FAILURE_MESSAGE_REGRESSION_FMT: Final[str] = '-- REGRESSION :: Benchmark :: %s @ %dx took %.3f s, %.1f%% slower than %.3f s'
+_FAILURE_MESSAGE_BASELINE_FMT: Final[str] = '-- FAILURE :: Benchmark :: Couldn\'t read baseline results from %s'
+
+_EXIT_CODE_REGRESSION: Final[int] = 1
+_EXIT_CODE_FAILURE: Final[int] = 2
+
+_SCALES_SEPARATOR: Final[str] = ','
+
+_DEFAULT_BENCHMARK_SCALES: Final[tuple[int, ...]] = (1, 10, 100)
+_DEFAULT_BENCHMARK_REPEAT: Final[int] = 3
+_DEFAULT_BENCHMARK_THRESHOLD: Final[float] = 0.1
+_DEFAULT_BENCHMARK_MOCK_LATENCY: Final[float] = 0.0
+
+_DEFAULT_ARGUMENT_SCALES: Final[tuple[int, ...]] = _DEFAULT_BENCHMARK_SCALES
+_DEFAULT_ARGUMENT_STAGES: Final[tuple[str, ...]] = _STAGE_NAMES
+_DEFAULT_ARGUMENT_REPEAT: Final[int] = _DEFAULT_BENCHMARK_REPEAT
+_DEFAULT_ARGUMENT_OUTPUT: Final[str] = _BENCHMARK_RESULTS_PATH
+_DEFAULT_ARGUMENT_BASELINE: Final[Optional[str]] = None
+_DEFAULT_ARGUMENT_THRESHOLD: Final[float] = _DEFAULT_BENCHMARK_THRESHOLD
+_DEFAULT_ARGUMENT_WORK_PATH: Final[str] = _BENCHMARK_PATH
+_DEFAULT_ARGUMENT_MOCK_LATENCY: Final[float] = _DEFAULT_BENCHMARK_MOCK_LATENCY
+_DEFAULT_ARGUMENT_MAIN_ARGS: Final[str] = ''
+
+
+def _json_write_min(
+    file_path: str,
+    json_object: Any
+) -> int:
+    data: Final[bytes] = json.dumps(json_object, ensure_ascii=False, separators=_JSON_MIN_SEPARATORS) \
+        .encode(_JSON_FILE_ENCODING)
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, _OPEN_FILE_WRITE_BINARY_FLAG) as file:
+        file.write(data)
+
+    return len(data)
+
+
+def _json_load(file_path: str) -> Optional[Any]:
+    try:
+        with open(file_path, _OPEN_FILE_READ_FLAG, encoding=_JSON_FILE_ENCODING) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _sql_literal(value: Any) -> str:
+    if value is None:
+        return main._SQL_KEYWORD_NULL
+
+    if isinstance(value, str):
+        return _SQL_STRING_QUOTE + ''.join(_SQL_STRING_ESCAPES.get(char, char) for char in value) + _SQL_STRING_QUOTE
+
+    return repr(value)
+
+
+def _trick_gxds_raw_tables() -> dict[str, list[tuple[Any, ...]]]:
+    raw_tables: Final[dict[str, list[tuple[Any, ...]]]] = {}
+
+    for table_name in _TRICK_GXDS_TABLE_ID_COLUMNS:
+        table_path: str = os.path.join(_DUMP_TRICK_GXDS_PATH, table_name + main._TRICK_GXDS_TABLE_FILE_EXT)
+
+        with open(table_path, _OPEN_FILE_READ_FLAG, encoding=main._TRICK_GXDS_TABLE_FILE_ENCODING) as file:
+            raw_tables[table_name] = [
+                row_values
+                for row_table_name, row_values in main._sql_insert_rows(file)
+                if row_table_name == table_name
+            ]
+
+    return raw_tables
+
+
+def _trick_gxds_scaled_tables(
+    raw_tables: dict[str, list[tuple[Any, ...]]],
+    scale: int
+) -> dict[str, str]:
+    id_strides: Final[dict[str, int]] = {
+        table_name: max((row_values[0] for row_values in rows if main._sql_is_id(row_values[0])), default=0) + 1
+        for table_name, rows in raw_tables.items()
+    }
+
+    scaled_tables: Final[dict[str, str]] = {}
+    for table_name, rows in raw_tables.items():
+        id_columns: dict[int, str] = _TRICK_GXDS_TABLE_ID_COLUMNS[table_name]
+        row_literals: list[str] = []
+
+        for replica in range(scale):
+            for row_values in rows:
+                row_literals.append('(' + ', '.join(
+                    _sql_literal(value + replica * id_strides[id_columns[column_index]]
+                                 if column_index in id_columns and main._sql_is_id(value) else value)
+                    for column_index, value in enumerate(row_values)
+                ) + ')')
+
+        scaled_tables[table_name] = _SQL_INSERT_HEADER_FMT % table_name \
+            + _SQL_ROW_SEPARATOR.join(row_literals) \
+            + _SQL_STATEMENT_END
+
+    return scaled_tables
+
+
+def _trick_surf_replica_map(
+    map_json: dict[str, Any],
+    replica: int,
+    map_id_stride: int
+) -> dict[str, Any]:
+    if not replica:
+        return map_json
+
+    return {
+        **map_json,
+        _TRICK_SURF_ID_FIELD_NAME: map_json[_TRICK_SURF_ID_FIELD_NAME] + replica * map_id_stride,
+        _TRICK_SURF_NAME_FIELD_NAME: _TRICK_SURF_REPLICA_NAME_FMT % (map_json[_TRICK_SURF_NAME_FIELD_NAME], replica)
+    }
+
+
+def _trick_surf_replica_entities(
+    entities_json: list[Any],
+    replica: int,
+    id_stride: int,
+    map_id: Optional[int] = None,
+    field_strides: Optional[dict[str, int]] = None
+) -> list[Any]:
+    replica_entities: Final[list[Any]] = []
+
+    for entity_json in entities_json:
+        replica_entity: dict[str, Any] = dict(entity_json)
+
+        if isinstance(replica_entity.get(_TRICK_SURF_ID_FIELD_NAME), int):
+            replica_entity[_TRICK_SURF_ID_FIELD_NAME] += replica * id_stride
+
+        if map_id is not None \
+                and _TRICK_SURF_MAP_ID_FIELD_NAME in replica_entity:
+            replica_entity[_TRICK_SURF_MAP_ID_FIELD_NAME] = map_id
+
+        for field_name, field_stride in (field_strides or {}).items():
+            if isinstance(replica_entity.get(field_name), int):
+                replica_entity[field_name] += replica * field_stride
+
+        sequence_json: Optional[Any] = replica_entity.get(_TRICK_SURF_SEQUENCE_FIELD_NAME)
+        if isinstance(sequence_json, list) \
+                and field_strides:
+            replica_entity[_TRICK_SURF_SEQUENCE_FIELD_NAME] \
+                = _trick_surf_replica_entities(sequence_json, replica, 0, None, field_strides)
+
+        replica_entities.append(replica_entity)
+
+    return replica_entities
+
+
+def _trick_surf_max_id(entities_json: Optional[Any]) -> int:
+    if not isinstance(entities_json, list):
+        return 0
+
+    return max((
+        entity_json[_TRICK_SURF_ID_FIELD_NAME]
+        for entity_json in entities_json
+        if isinstance(entity_json, dict) and isinstance(entity_json.get(_TRICK_SURF_ID_FIELD_NAME), int)
+    ), default=0)
+
+
+def _trick_surf_generate_tree(
+    api_path: str,
+    scale: int
+) -> tuple[int, int]:
+    # Maps are replicated, so the number of crawled endpoints grows w/ the scale as well as the size of the player lists.
+    def source_path(*names: Any) -> str:
+        return os.path.join(_DUMP_TRICK_SURF_PATH, *map(str, names)) + _DUMP_JSON_FILE_MIN_EXT
+
+    def source_json(*names: Any) -> Optional[Any]:
+        return _json_load(source_path(*names))
+
+    def target_path(*names: Any) -> str:
+        return os.path.join(api_path, *map(str, names)) + _DUMP_JSON_FILE_MIN_EXT
+
+    games_json: Final[list[Any]] = source_json(_TRICK_SURF_GAMES_NAME) or []
+    game_ids: Final[list[int]] = [game_json[_TRICK_SURF_ID_FIELD_NAME] for game_json in games_json]
+
+    # Only maps w/ a dumped subtree are replicated, same as the mock server lists them.
+    # Missing rankings are left missing too, the mock server answers them w/ an empty envelope.
+    def has_map_dump(map_id: int) -> bool:
+        return all(
+            os.path.exists(source_path(_TRICK_SURF_MAPS_NAME, map_id, endpoint_name))
+            for endpoint_name in (_TRICK_SURF_TRIGGERS_NAME, _TRICK_SURF_TELEPORTS_NAME)
+        ) and all(
+            os.path.exists(source_path(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_TRICKS_NAME))
+            for game_id in game_ids
+        )
+
+    maps_json: Final[list[Any]] = [
+        map_json
+        for map_json in source_json(_TRICK_SURF_MAPS_NAME) or []
+        if has_map_dump(map_json[_TRICK_SURF_ID_FIELD_NAME])
+    ]
+
+    players_json: Final[list[Any]] = source_json(_TRICK_SURF_PLAYERS_NAME) or []
+
+    map_id_stride: Final[int] = _trick_surf_max_id(maps_json) + 1
+    player_id_stride: Final[int] = _trick_surf_max_id(players_json) + 1
+
+    trick_id_stride: int = 0
+    trigger_id_stride: int = 0
+    teleport_id_stride: int = 0
+    for map_json in maps_json:
+        map_id: int = map_json[_TRICK_SURF_ID_FIELD_NAME]
+        trigger_id_stride = max(trigger_id_stride, _trick_surf_max_id(source_json(_TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_TRIGGERS_NAME)) + 1)
+        teleport_id_stride = max(teleport_id_stride, _trick_surf_max_id(source_json(_TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_TELEPORTS_NAME)) + 1)
+
+        for game_id in game_ids:
+            trick_id_stride = max(trick_id_stride, _trick_surf_max_id(source_json(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_TRICKS_NAME)) + 1)
+
+    trigger_field_strides: Final[dict[str, int]] = {_TRICK_SURF_TRIGGER_ID_FIELD_NAME: trigger_id_stride}
+    player_field_strides: Final[dict[str, int]] = {_TRICK_SURF_PLAYER_ID_FIELD_NAME: player_id_stride}
+
+    file_count: int = 0
+    file_size: int = 0
+
+    def write(file_path: str, json_object: Any) -> None:
+        nonlocal file_count, file_size
+
+        file_size += _json_write_min(file_path, json_object)
+        file_count += 1
+
+    write(target_path(_TRICK_SURF_GAMES_NAME), games_json)
+    write(target_path(_TRICK_SURF_SERVERS_NAME), source_json(_TRICK_SURF_SERVERS_NAME) or [])
+    write(target_path(_TRICK_SURF_MAPS_NAME), [
+        _trick_surf_replica_map(map_json, replica, map_id_stride)
+        for replica in range(scale)
+        for map_json in maps_json
+    ])
+    write(target_path(_TRICK_SURF_PLAYERS_NAME), [
+        player_json
+        for replica in range(scale)
+        for player_json in _trick_surf_replica_entities(players_json, replica, player_id_stride)
+    ])
+
+    for game_id in game_ids:
+        game_players_json: list[Any] = source_json(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_PLAYERS_NAME) or []
+
+        write(target_path(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_EVENTS_NAME),
+              source_json(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_EVENTS_NAME) or [])
+        write(target_path(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_PLAYERS_NAME), [
+            player_json
+            for replica in range(scale)
+            for player_json in _trick_surf_replica_entities(game_players_json, replica, player_id_stride)
+        ])
+
+    for map_json in maps_json:
+        map_id: int = map_json[_TRICK_SURF_ID_FIELD_NAME]
+
+        triggers_json: list[Any] = source_json(_TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_TRIGGERS_NAME)
+        teleports_json: list[Any] = source_json(_TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_TELEPORTS_NAME)
+        game_jsons: dict[int, tuple[list[Any], dict[str, Any]]] = {
+            game_id: (
+                source_json(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_TRICKS_NAME),
+                source_json(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_MAPS_NAME, map_id, _TRICK_SURF_RANKINGS_NAME)
+            )
+            for game_id in game_ids
+        }
+
+        for replica in range(scale):
+            replica_map_json: dict[str, Any] = _trick_surf_replica_map(map_json, replica, map_id_stride)
+            replica_map_id: int = replica_map_json[_TRICK_SURF_ID_FIELD_NAME]
+
+            write(target_path(_TRICK_SURF_MAPS_NAME, replica_map_id, _TRICK_SURF_TRIGGERS_NAME),
+                  _trick_surf_replica_entities(triggers_json, replica, trigger_id_stride, replica_map_id))
+            write(target_path(_TRICK_SURF_MAPS_NAME, replica_map_id, _TRICK_SURF_TELEPORTS_NAME),
+                  _trick_surf_replica_entities(teleports_json, replica, teleport_id_stride, replica_map_id, trigger_field_strides))
+
+            for game_id, (tricks_json, rankings_json) in game_jsons.items():
+                write(target_path(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_MAPS_NAME, replica_map_id, _TRICK_SURF_TRICKS_NAME),
+                      _trick_surf_replica_entities(tricks_json, replica, trick_id_stride, replica_map_id, trigger_field_strides))
+
+                if rankings_json is None:
+                    continue
+
+                replica_rankings_json: Any = rankings_json
+                if isinstance(rankings_json, dict):
+                    replica_rankings_json = {
+                        **rankings_json,
+                        _TRICK_SURF_RANKINGS_MAP_FIELD_NAME: {
+                            **(rankings_json.get(_TRICK_SURF_RANKINGS_MAP_FIELD_NAME) or {}),
+                            **replica_map_json
+                        },
+                        _TRICK_SURF_RANKINGS_FIELD_NAME: _trick_surf_replica_entities(
+                            rankings_json.get(_TRICK_SURF_RANKINGS_FIELD_NAME) or [],
+                            replica,
+                            0,
+                            replica_map_id,
+                            player_field_strides
+                        )
+                    }
+
+                write(target_path(_TRICK_SURF_GAMES_NAME, game_id, _TRICK_SURF_MAPS_NAME, replica_map_id, _TRICK_SURF_RANKINGS_NAME),
+                      replica_rankings_json)
+
+    return file_count, file_size
+
+
+def _benchmark_time(
+    stage: Callable[[], Any],
+    repeat: int,
+    prepare: Optional[Callable[[], None]] = None
+) -> tuple[list[float], list[Any]]:
+    runs: Final[list[float]] = []
+    results: Final[list[Any]] = []
+
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+
+        start_time: float = time.perf_counter()
+        results.append(stage())
+        runs.append(time.perf_counter() - start_time)
+
+    return runs, results
+
+
+def _benchmark_result(
+    runs: list[float],
+    size: int,
+    is_success: bool = True
+) -> dict[str, Any]:
+    return {
+        _RESULTS_SECONDS_FIELD_NAME: min(runs),
+        _RESULTS_MEDIAN_SECONDS_FIELD_NAME: median(runs),
+        _RESULTS_RUNS_FIELD_NAME: runs,
+        _RESULTS_SIZE_FIELD_NAME: size,
+        _RESULTS_SUCCESS_FIELD_NAME: is_success
+    }
+
+
+def _benchmark_gxds(
+    raw_tables: dict[str, list[tuple[Any, ...]]],
+    scale: int,
+    repeat: int,
+    stage_names: tuple[str, ...]
+) -> dict[str, dict[str, Any]]:
+    scaled_tables: Final[dict[str, str]] = _trick_gxds_scaled_tables(raw_tables, scale)
+
+    def parse() -> dict[str, list[tuple[Any, ...]]]:
+        return {
+            table_name: main._trick_gxds_table_rows(io.StringIO(table_sql), table_name, _TRICK_GXDS_TABLE_ROWS[table_name])
+            for table_name, table_sql in scaled_tables.items()
+        }
+
+    parse_runs, parse_results = _benchmark_time(parse, repeat)
+    table_rows: Final[dict[str, list[tuple[Any, ...]]]] = parse_results[-1]
+    row_count: Final[int] = sum(map(len, table_rows.values()))
+
+    results: Final[dict[str, dict[str, Any]]] = {}
+    if _STAGE_GXDS_PARSE_NAME in stage_names:
+        results[_STAGE_GXDS_PARSE_NAME] = _benchmark_result(parse_runs, row_count)
+
+    if _STAGE_GXDS_MERGE_NAME in stage_names:
+        def merge() -> Optional[tuple[Optional[Any], Optional[Any]]]:
+            route_table_columns: Any = main._table_to_columns(
+                table_rows[main._TRICK_GXDS_ROUTE_TABLE_NAME],
+                main._TRICK_GXDS_ROUTE_TABLE_COLUMN_NAMES,
+                main._TRICK_GXDS_ROUTE_TABLE_COLUMN_TYPES
+            )
+
+            return main._trick_gxds_merge_data(
+                table_rows[main._TRICK_GXDS_PLAYER_TABLE_NAME],
+                route_table_columns,
+                table_rows[main._TRICK_GXDS_TRICK_TABLE_NAME],
+                table_rows[main._TRICK_GXDS_TRIGGER_TABLE_NAME]
+            )
+
+        merge_runs, merge_results = _benchmark_time(merge, repeat)
+        results[_STAGE_GXDS_MERGE_NAME] = _benchmark_result(merge_runs, row_count, bool(merge_results[-1]))
+
+    return results
+
+
+def _benchmark_trick_surf_crawl(
+    scale_path: str,
+    api_url: str,
+    repeat: int,
+    main_args: list[str],
+    file_count: int
+) -> dict[str, Any]:
+    # The dump runs from a copy of the script, so it writes into the benchmark's directory instead of the project's.
+    crawl_path: Final[str] = os.path.join(scale_path, _SCALE_CRAWL_DIRECTORY_NAME)
+    crawl_main_path: Final[str] = os.path.join(crawl_path, _SCALE_SOURCE_DIRECTORY_NAME, os.path.basename(_MAIN_PATH))
+
+    os.makedirs(os.path.dirname(crawl_main_path), exist_ok=True)
+    shutil.copyfile(_MAIN_PATH, crawl_main_path)
+
+    def prepare() -> None:
+        for directory_name in (_DUMP_TRICK_SURF_DIRECTORY_NAME, os.path.basename(_CACHE_PATH)):
+            shutil.rmtree(os.path.join(crawl_path, directory_name), ignore_errors=True)
+
+    def crawl() -> bool:
+        process: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, crawl_main_path, '--dump-trick-surf', '--no-journal', '--api-base-url', api_url] + main_args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+        return process.returncode == 0 \
+            and main._SUCCESS_MESSAGE_DUMP_TRICK_SURF_DATA.encode() in process.stdout
+
+    runs, results = _benchmark_time(crawl, repeat, prepare)
+    return _benchmark_result(runs, file_count, all(results))
+
+
+def _benchmark_trick_surf_write(
+    scale_path: str,
+    repeat: int
+) -> dict[str, Any]:
+    # Documents are loaded up front & written synchronously, only serializing & writing them is timed.
+    api_path: Final[str] = os.path.join(scale_path, _SCALE_API_DIRECTORY_NAME)
+    write_path: Final[str] = os.path.join(scale_path, _SCALE_WRITE_DIRECTORY_NAME)
+
+    def documents() -> Iterator[tuple[str, str, Any]]:
+        for directory_path, _, file_names in os.walk(api_path):
+            for file_name in sorted(file_names):
+                document_path: str = os.path.join(
+                    write_path,
+                    os.path.relpath(directory_path, api_path)
+                )
+
+                yield document_path, file_name[:-len(_DUMP_JSON_FILE_MIN_EXT)], \
+                    _json_load(os.path.join(directory_path, file_name))
+
+    runs: Final[list[float]] = []
+    is_success: bool = True
+    document_count: int = 0
+
+    main._json_writer_configure(0)
+    for _ in range(repeat):
+        shutil.rmtree(write_path, ignore_errors=True)
+
+        run: float = 0.0
+        document_count = 0
+        for document_path, document_name, document_json in documents():
+            start_time: float = time.perf_counter()
+            is_success = main._dump_json(document_path, document_name, document_json) and is_success
+            run += time.perf_counter() - start_time
+
+            document_count += 1
+
+        runs.append(run)
+
+    return _benchmark_result(runs, document_count, is_success)
+
+
+def _benchmark_scale(
+    work_path: str,
+    raw_tables: dict[str, list[tuple[Any, ...]]],
+    scale: int,
+    repeat: int,
+    stage_names: tuple[str, ...],
+    mock_latency: float,
+    main_args: list[str]
+) -> dict[str, dict[str, Any]]:
+    results: Final[dict[str, dict[str, Any]]] = {}
+
+    if _STAGE_GXDS_PARSE_NAME in stage_names \
+            or _STAGE_GXDS_MERGE_NAME in stage_names:
+        results.update(_benchmark_gxds(raw_tables, scale, repeat, stage_names))
+
+    if _STAGE_TRICK_SURF_CRAWL_NAME not in stage_names \
+            and _STAGE_TRICK_SURF_WRITE_NAME not in stage_names:
+        return results
+
+    scale_path: Final[str] = os.path.join(work_path, _SCALE_DIRECTORY_NAME_FMT % scale)
+    api_path: Final[str] = os.path.join(scale_path, _SCALE_API_DIRECTORY_NAME)
+
+    shutil.rmtree(scale_path, ignore_errors=True)
+    file_count, file_size = _trick_surf_generate_tree(api_path, scale)
+    print(_INFO_MESSAGE_GENERATED_FMT % (scale, file_count, file_size / _BYTES_PER_MEBIBYTE), file=_STD_OUT_STREAM)
+
+    if _STAGE_TRICK_SURF_CRAWL_NAME in stage_names:
+        mock_server._mock_configure(api_path, mock_latency)
+        server: ThreadingHTTPServer = mock_server._mock_server_start(port=0)
+
+        try:
+            results[_STAGE_TRICK_SURF_CRAWL_NAME] = _benchmark_trick_surf_crawl(
+                scale_path,
+                'http://%s:%d/' % server.server_address[:2],
+                repeat,
+                main_args,
+                file_count
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    if _STAGE_TRICK_SURF_WRITE_NAME in stage_names:
+        results[_STAGE_TRICK_SURF_WRITE_NAME] = _benchmark_trick_surf_write(scale_path, repeat)
+
+    shutil.rmtree(scale_path, ignore_errors=True)
+    return results
+
+
+def _benchmark_regressions(
+    results_json: dict[str, Any],
+    baseline_json: dict[str, Any],
+    threshold: float
+) -> list[tuple[str, int, float, float]]:
+    # Stages are compared by their fastest run, the least noisy of the repeated timings.
+    # Failed runs are never compared, a run that fails fast would pass for a speed-up.
+    regressions: Final[list[tuple[str, int, float, float]]] = []
+
+    baseline_scales: Final[dict[str, Any]] = baseline_json.get(_RESULTS_SCALES_FIELD_NAME) or {}
+    for scale, stage_results in results_json[_RESULTS_SCALES_FIELD_NAME].items():
+        for stage_name, stage_result in stage_results.items():
+            if not stage_result[_RESULTS_SUCCESS_FIELD_NAME]:
+                continue
+
+            baseline_result: Optional[dict[str, Any]] = (baseline_scales.get(scale) or {}).get(stage_name)
+            if not baseline_result \
+                    or not baseline_result.get(_RESULTS_SUCCESS_FIELD_NAME):
+                continue
+
+            seconds: float = stage_result[_RESULTS_SECONDS_FIELD_NAME]
+            baseline_seconds: float = baseline_result[_RESULTS_SECONDS_FIELD_NAME]
+            if seconds > baseline_seconds * (1 + threshold):
+                regressions.append((stage_name, int(scale), seconds, baseline_seconds))
+
+    return regressions
+
+
+def _str_to_scales(
+    val: Optional[Any]
+) -> tuple[int, ...]:
+    try:
+        scales: Final[set[int]] = {int(scale) for scale in str(val).split(_SCALES_SEPARATOR)}
+    except ValueError:
+        raise ArgumentTypeError(f'Couldn\'t convert "{val}" to integer scales')
+
+    if not all(scale > 0 for scale in scales):
+        raise ArgumentTypeError(f'Expected positive integer scales, got "{val}"')
+
+    return tuple(sorted(scales))
+
+
+def _str_to_stages(
+    val: Optional[Any]
+) -> tuple[str, ...]:
+    stage_names: Final[set[str]] = {stage_name.strip() for stage_name in str(val).split(_SCALES_SEPARATOR)}
+
+    if not stage_names <= set(_STAGE_NAMES):
+        raise ArgumentTypeError(f'Expected stages out of {", ".join(_STAGE_NAMES)}, got "{val}"')
+
+    return tuple(stage_name for stage_name in _STAGE_NAMES if stage_name in stage_names)
+
+
+def _main() -> None:
+    arg_parser: Final[ArgumentParser] = ArgumentParser(
+        description='time the gxds parsing & merging, the trick surf crawl & the writing of dumped files on scaled synthetic data'
+    )
+
+    arg_parser.add_argument(
+        '--scales',
+        help='comma separated multiples of the dumped data to generate synthetic datasets of',
+        dest='scales',
+        action='store',
+        type=_str_to_scales,
+        metavar='<scales>',
+        default=_DEFAULT_ARGUMENT_SCALES
+    )
+
+    arg_parser.add_argument(
+        '--stages',
+        help=f'comma separated stages to time, out of {", ".join(_STAGE_NAMES)}',
+        dest='stages',
+        action='store',
+        type=_str_to_stages,
+        metavar='<stages>',
+        default=_DEFAULT_ARGUMENT_STAGES
+    )
+
+    arg_parser.add_argument(
+        '--repeat',
+        help='number of times every stage is timed, the fastest run is reported',
+        dest='repeat',
+        action='store',
+        type=main._str_to_positive_int,
+        metavar='<count>',
+        default=_DEFAULT_ARGUMENT_REPEAT
+    )
+
+    arg_parser.add_argument(
+        '--output',
+        help='json file to write the results to',
+        dest='output',
+        action='store',
+        metavar='<path>',
+        default=_DEFAULT_ARGUMENT_OUTPUT
+    )
+
+    arg_parser.add_argument(
+        '--baseline',
+        help='json file of previous results to compare the results against',
+        dest='baseline',
+        action='store',
+        metavar='<path>',
+        default=_DEFAULT_ARGUMENT_BASELINE
+    )
+
+    arg_parser.add_argument(
+        '--threshold',
+        help='ratio a stage may be slower than its baseline by before it counts as a regression',
+        dest='threshold',
+        action='store',
+        type=main._str_to_positive_float,
+        metavar='<ratio>',
+        default=_DEFAULT_ARGUMENT_THRESHOLD
+    )
+
+    arg_parser.add_argument(
+        '--work-path',
+        help='directory the synthetic datasets are generated & dumped in',
+        dest='work_path',
+        action='store',
+        metavar='<path>',
+        default=_DEFAULT_ARGUMENT_WORK_PATH
+    )
+
+    arg_parser.add_argument(
+        '--mock-latency',
+        help='delay of every mock server response in seconds during the crawl',
+        dest='mock_latency',
+        action='store',
+        type=mock_server._str_to_non_negative_float,
+        metavar='<seconds>',
+        default=_DEFAULT_ARGUMENT_MOCK_LATENCY
+    )
+
+    arg_parser.add_argument(
+        '--main-args',
+        help='extra arguments passed to main.py during the crawl, e.g. "--max-concurrency=16 --stream"',
+        dest='main_args',
+        action='store',
+        metavar='<args>',
+        default=_DEFAULT_ARGUMENT_MAIN_ARGS
+    )
+
+    args: Final[ArgumentNamespace] = arg_parser.parse_args()
+
+    baseline_json: Optional[Any] = None
+    if args.baseline:
+        baseline_json = _json_load(args.baseline)
+        if not isinstance(baseline_json, dict):
+            print(_FAILURE_MESSAGE_BASELINE_FMT % args.baseline, file=_STD_ERR_STREAM)
+            sys.exit(_EXIT_CODE_REGRESSION)
+
+    raw_tables: Final[dict[str, list[tuple[Any, ...]]]] = _trick_gxds_raw_tables()
+    main_args: Final[list[str]] = shlex.split(args.main_args)
+
+    results_json: Final[dict[str, Any]] = {
+        _RESULTS_PYTHON_FIELD_NAME: platform.python_version(),
+        _RESULTS_PLATFORM_FIELD_NAME: platform.platform(),
+        _RESULTS_TIMESTAMP_FIELD_NAME: datetime.now(timezone.utc).isoformat(),
+        _RESULTS_REPEAT_FIELD_NAME: args.repeat,
+        _RESULTS_SCALES_FIELD_NAME: {}
+    }
+
+    is_success: bool = True
+    for scale in args.scales:
+        scale_results: dict[str, dict[str, Any]] = _benchmark_scale(
+            args.work_path,
+            raw_tables,
+            scale,
+            args.repeat,
+            args.stages,
+            args.mock_latency,
+            main_args
+        )
+
+        for stage_name, stage_result in scale_results.items():
+            print(_INFO_MESSAGE_STAGE_FMT % (
+                stage_name,
+                scale,
+                stage_result[_RESULTS_SECONDS_FIELD_NAME],
+                stage_result[_RESULTS_MEDIAN_SECONDS_FIELD_NAME],
+                stage_result[_RESULTS_SIZE_FIELD_NAME]
+            ), file=_STD_OUT_STREAM)
+
+            if not stage_result[_RESULTS_SUCCESS_FIELD_NAME]:
+                print(_FAILURE_MESSAGE_STAGE_FMT % (stage_name, scale), file=_STD_ERR_STREAM)
+                is_success = False
+
+        results_json[_RESULTS_SCALES_FIELD_NAME][str(scale)] = scale_results
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, _OPEN_FILE_WRITE_FLAG, encoding=_JSON_FILE_ENCODING) as file:
+        json.dump(results_json, file, indent=_JSON_INDENT)
+
+    print(_INFO_MESSAGE_WROTE_RESULTS_FMT % args.output, file=_STD_OUT_STREAM)
+
+    regressions: Final[list[tuple[str, int, float, float]]] = _benchmark_regressions(results_json, baseline_json, args.threshold) \
+        if baseline_json is not None \
+        else []
+
+    for stage_name, scale, seconds, baseline_seconds in regressions:
+        print(_FAILURE_MESSAGE_REGRESSION_FMT % (
+            stage_name,
+            scale,
+            seconds,
+            (seconds / baseline_seconds - 1) * 100,
+            baseline_seconds
+        ), file=_STD_ERR_STREAM)
+
+    if not is_success:
+        sys.exit(_EXIT_CODE_FAILURE)
+
+    if regressions:
+        sys.exit(_EXIT_CODE_REGRESSION)
+
+
+if __name__ == '__main__':
+    _main()
@@ -17,13 +17,22 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Final, Optional, Union, Any, TextIO, Callable
+from typing import Final, Optional, Union, Any, TextIO, Callable, Iterable, Iterator
+from collections import deque
 from types import MappingProxyType as MappingProxy
-from argparse import ArgumentParser, Namespace as ArgumentNamespace
+from argparse import ArgumentParser, ArgumentTypeError, Namespace as ArgumentNamespace
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
 from subprocess import Popen
 from re import RegexFlag
-from datetime import datetime
-from requests import Response
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests import Response, Session, RequestException
+from requests.adapters import HTTPAdapter
+from queue import Queue
+from array import array
+from operator import itemgetter
+from bisect import bisect_left
+from urllib.parse import urlsplit
 
 import sys
 import requests
@@ -33,6 +42,31 @@ import json
 import shutil
 import ciso8601
 import time
+import threading
+import hashlib
+import io
+import gzip
+import lzma
+import sqlite3
+import mmap
+import tracemalloc
+import random
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 
 _TIME_ZONE_OFFSET: Final[int] = time.timezone
@@ -42,9 +76,91 @@ _STD_ERR_STREAM: Final[TextIO] = sys.stderr
 
 _OPEN_FILE_WRITE_FLAG: Final[str] = 'w'
 _OPEN_FILE_READ_FLAG: Final[str] = 'r'
+_OPEN_FILE_WRITE_BINARY_FLAG: Final[str] = 'wb'
+_OPEN_FILE_READ_BINARY_FLAG: Final[str] = 'rb'
+_OPEN_FILE_READ_TEXT_FLAG: Final[str] = 'rt'
 
 _REGEX_MULTILINE_FLAG: Final[RegexFlag] = re.MULTILINE
 
+_SQL_READ_CHUNK_SIZE: Final[int] = 64 * 1024
+
+# Number of characters after a token that can still change it, e.g. `1e` of `1e-5` or `'a'` of `'a''b'`.
+_SQL_TOKEN_LOOKAHEAD: Final[int] = 3
+
+_SQL_TOKEN_COMMENT: Final[str] = 'comment'
+_SQL_TOKEN_ROW: Final[str] = 'row'
+_SQL_TOKEN_STRING: Final[str] = 'string'
+_SQL_TOKEN_NAME: Final[str] = 'name'
+_SQL_TOKEN_NUMBER: Final[str] = 'number'
+_SQL_TOKEN_WORD: Final[str] = 'word'
+_SQL_TOKEN_PARTIAL: Final[str] = 'partial'
+_SQL_TOKEN_SYMBOL: Final[str] = 'symbol'
+
+# language=PythonRegExp
+_SQL_STRING_PATTERN: Final[str] = r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+# language=PythonRegExp
+_SQL_PARTIAL_STRING_PATTERN: Final[str] = r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*\\?"
+# language=PythonRegExp
+_SQL_NAME_PATTERN: Final[str] = r'`[^`]*(?:``[^`]*)*`'
+# language=PythonRegExp
+_SQL_PARTIAL_NAME_PATTERN: Final[str] = r'`[^`]*(?:``[^`]*)*'
+# language=PythonRegExp
+_SQL_NUMBER_PATTERN: Final[str] = r'-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?'
+# language=PythonRegExp
+_SQL_PARTIAL_NUMBER_PATTERN: Final[str] = r'-?\d+(?:\.\d*)?(?:[eE][-+]?\d*)?|-'
+# language=PythonRegExp
+_SQL_WORD_PATTERN: Final[str] = r'\w+'
+# language=PythonRegExp
+_SQL_VALUE_PATTERN: Final[str] = f'{_SQL_STRING_PATTERN}|{_SQL_NUMBER_PATTERN}|{_SQL_WORD_PATTERN}'
+
+# Tokens of MySQL dumps, a whole `(<value>, ...)` row of literals is a single token,
+#   a `partial` token is a string, name, comment or row cut off by the end of the read buffer.
+# language=PythonRegExp
+_SQL_TOKEN_REGEX: Final[re.Pattern] = re.compile(
+    r'\s*(?:'
+    rf'(?P<{_SQL_TOKEN_COMMENT}>--[^\n]*(?:\n|\Z)|#[^\n]*(?:\n|\Z)|/\*.*?\*/)'
+    rf'|(?P<{_SQL_TOKEN_ROW}>\(\s*(?:{_SQL_VALUE_PATTERN})(?:\s*,\s*(?:{_SQL_VALUE_PATTERN}))*\s*\))'
+    rf'|(?P<{_SQL_TOKEN_STRING}>{_SQL_STRING_PATTERN})'
+    rf'|(?P<{_SQL_TOKEN_NAME}>{_SQL_NAME_PATTERN})'
+    rf'|(?P<{_SQL_TOKEN_NUMBER}>{_SQL_NUMBER_PATTERN})'
+    rf'|(?P<{_SQL_TOKEN_WORD}>{_SQL_WORD_PATTERN})'
+    rf'|(?P<{_SQL_TOKEN_PARTIAL}>(?:{_SQL_PARTIAL_STRING_PATTERN}|{_SQL_PARTIAL_NAME_PATTERN}|/\*(?:(?!\*/).)*'
+    rf'|\(\s*(?:(?:{_SQL_VALUE_PATTERN})\s*,\s*)*(?:{_SQL_VALUE_PATTERN}|{_SQL_PARTIAL_STRING_PATTERN}|{_SQL_PARTIAL_NUMBER_PATTERN})?\s*)\Z)'
+    rf'|(?P<{_SQL_TOKEN_SYMBOL}>.)'
+    r')',
+    RegexFlag.DOTALL
+)
+
+# (<string>, <number>, <word>) of every value of a row token, the separators between them are skipped by the search.
+# language=PythonRegExp
+_SQL_VALUE_REGEX: Final[re.Pattern] = re.compile(
+    rf'({_SQL_STRING_PATTERN})|({_SQL_NUMBER_PATTERN})|({_SQL_WORD_PATTERN})',
+    RegexFlag.DOTALL
+)
+
+# language=PythonRegExp
+_SQL_STRING_ESCAPE_REGEX: Final[re.Pattern] = re.compile(r"\\(.)|''", RegexFlag.DOTALL)
+
+_SQL_STRING_ESCAPES: Final[dict[str, str]] = MappingProxy({
+    '0': '\0',
+    'b': '\b',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'Z': '\x1a'
+})
+
+_SQL_KEYWORD_INSERT: Final[str] = 'INSERT'
+_SQL_KEYWORD_INTO: Final[str] = 'INTO'
+_SQL_KEYWORD_VALUES: Final[tuple[str, ...]] = ('VALUES', 'VALUE')
+_SQL_KEYWORD_NULL: Final[str] = 'NULL'
+
+_SQL_SYMBOL_OPEN: Final[str] = '('
+_SQL_SYMBOL_CLOSE: Final[str] = ')'
+_SQL_SYMBOL_SEPARATOR: Final[str] = ','
+_SQL_SYMBOL_DOT: Final[str] = '.'
+_SQL_SYMBOL_END: Final[str] = ';'
+
 # language=PythonRegExp
 _REGEX_WHITESPACE_CHARS: Final[str] = '\\s|\t|\n|\r|\v|\f'
 
@@ -55,12 +171,21 @@ _STRING_ENCODE_ERROR_IGNORE: Final[str] = 'ignore'
 _CURRENT_PATH: Final[str] = os.path.dirname(__file__)
 _PARENT_PATH: Final[str] = os.path.join(_CURRENT_PATH, '..')
 _LICENSE_PATH: Final[str] = os.path.join(_PARENT_PATH, 'COPYING')
+_CACHE_PATH: Final[str] = os.path.join(_PARENT_PATH, '.cache')
+_HTTP_CACHE_PATH: Final[str] = os.path.join(_CACHE_PATH, 'http')
+_JOURNAL_PATH: Final[str] = os.path.join(_CACHE_PATH, 'journal')
+_JSON_MANIFEST_PATH: Final[str] = os.path.join(_CACHE_PATH, 'manifest.json')
+_REPORT_PATH: Final[str] = os.path.join(_CACHE_PATH, 'report.json')
+_STAGING_PATH: Final[str] = os.path.join(_CACHE_PATH, 'staging')
+_TRICK_GXDS_STATE_PATH: Final[str] = os.path.join(_CACHE_PATH, 'trick-gxds-state.json')
 
 
 _TAG_SEPARATOR: Final[str] = ' :: '
 
 _STEP_DUMP_TRICK_GXDS_NAME: Final[str] = 'TrickGxds'
 _STEP_DUMP_TRICK_SURF_NAME: Final[str] = 'TrickSurf'
+_STEP_DUMP_TRICK_SURF_TIERS_NAME: Final[str] = 'TrickSurfTiers'
+_STEP_DUMP_TRICK_GXDS_MATCHES_NAME: Final[str] = 'TrickGxdsMatches'
 
 _SUCCESS_MESSAGE_PREFIX: Final[str] = 'SUCCESS'
 
@@ -69,6 +194,8 @@ _SUCCESS_MESSAGE_DUMP_DATA_FMT: Final[str] = f'{_SUCCESS_MESSAGE_PREFIX}{_TAG_SE
 
 _SUCCESS_MESSAGE_DUMP_TRICK_GXDS_DATA: Final[str] = _SUCCESS_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_GXDS_NAME
 _SUCCESS_MESSAGE_DUMP_TRICK_SURF_DATA: Final[str] = _SUCCESS_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_SURF_NAME
+_SUCCESS_MESSAGE_DUMP_TRICK_SURF_TIERS_DATA: Final[str] = _SUCCESS_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_SURF_TIERS_NAME
+_SUCCESS_MESSAGE_DUMP_TRICK_GXDS_MATCHES_DATA: Final[str] = _SUCCESS_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_GXDS_MATCHES_NAME
 
 _FAILURE_MESSAGE_PREFIX: Final[str] = '-- FAILURE'
 
@@ -77,6 +204,32 @@ _FAILURE_MESSAGE_DUMP_DATA_FMT: Final[str] = f'{_FAILURE_MESSAGE_PREFIX}{_TAG_SE
 
 _FAILURE_MESSAGE_DUMP_TRICK_GXDS_DATA: Final[str] = _FAILURE_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_GXDS_NAME
 _FAILURE_MESSAGE_DUMP_TRICK_SURF_DATA: Final[str] = _FAILURE_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_SURF_NAME
+_FAILURE_MESSAGE_DUMP_TRICK_SURF_TIERS_DATA: Final[str] = _FAILURE_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_SURF_TIERS_NAME
+_FAILURE_MESSAGE_DUMP_TRICK_GXDS_MATCHES_DATA: Final[str] = _FAILURE_MESSAGE_DUMP_DATA_FMT % _STEP_DUMP_TRICK_GXDS_MATCHES_NAME
+
+_FAILURE_MESSAGE_WRITE_FILES: Final[str] = 'Couldn\'t write JSON files: %s'
+_FAILURE_MESSAGE_WRITE_FILES_FMT: Final[str] = f'{_FAILURE_MESSAGE_PREFIX}{_TAG_SEPARATOR}%s{_TAG_SEPARATOR}{_FAILURE_MESSAGE_WRITE_FILES}'
+
+_INTERRUPT_MESSAGE_PREFIX: Final[str] = '-- INTERRUPTED'
+
+_INTERRUPT_MESSAGE_JOURNAL: Final[str] = 'Fetched responses were journaled, rerun w/ --resume to continue'
+_INTERRUPT_MESSAGE_JOURNAL_FMT: Final[str] = f'{_INTERRUPT_MESSAGE_PREFIX}{_TAG_SEPARATOR}%s{_TAG_SEPARATOR}{_INTERRUPT_MESSAGE_JOURNAL}'
+
+_INTERRUPT_MESSAGE_JOURNAL_TRICK_SURF_DATA: Final[str] = _INTERRUPT_MESSAGE_JOURNAL_FMT % _STEP_DUMP_TRICK_SURF_NAME
+
+
+_INFO_MESSAGE_PREFIX: Final[str] = 'INFO'
+
+_INFO_MESSAGE_UNCHANGED_TABLES: Final[str] = 'Local SQL tables & options didn\'t change, kept the previous data dumps'
+_INFO_MESSAGE_UNCHANGED_TABLES_FMT: Final[str] = f'{_INFO_MESSAGE_PREFIX}{_TAG_SEPARATOR}%s{_TAG_SEPARATOR}{_INFO_MESSAGE_UNCHANGED_TABLES}'
+
+_INFO_MESSAGE_WRITTEN_FILES: Final[str] = 'Wrote %d & skipped %d unchanged JSON files'
+_INFO_MESSAGE_WRITTEN_FILES_FMT: Final[str] = f'{_INFO_MESSAGE_PREFIX}{_TAG_SEPARATOR}%s{_TAG_SEPARATOR}{_INFO_MESSAGE_WRITTEN_FILES}'
+
+_STEP_REPORT_NAME: Final[str] = 'Report'
+
+_INFO_MESSAGE_WRITTEN_REPORT: Final[str] = 'Wrote the performance report to %s'
+_INFO_MESSAGE_WRITTEN_REPORT_FMT: Final[str] = f'{_INFO_MESSAGE_PREFIX}{_TAG_SEPARATOR}{_STEP_REPORT_NAME}{_TAG_SEPARATOR}{_INFO_MESSAGE_WRITTEN_REPORT}'
 
 
 _DUMP_UNIFIED_DIRECTORY_NAME: Final[str] = 'unified'
@@ -106,12 +259,55 @@ _DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_TRICK_ID_PATH: Final[str] = os
 # _DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_TRICK_ID_RECORDS_PATH: Final[str] = os.path.join(_DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_TRICK_ID_PATH, 'records')
 
 
+_DUMP_TRICK_SURF_STATE_PATH: Final[str] = os.path.join(_DUMP_TRICK_SURF_PATH, '.state.json')
+
+
 _DUMP_UNIFIED_NAME: Final[str] = 'ski2-gxds-tricks'
 _DUMP_UNIFIED_ORIGINAL_NAME: Final[str] = f'{_DUMP_UNIFIED_NAME}~original'
 _DUMP_UNIFIED_SIFTED_NAME: Final[str] = f'{_DUMP_UNIFIED_NAME}~sifted'
+_DUMP_UNIFIED_MATCHES_NAME: Final[str] = f'{_DUMP_UNIFIED_NAME}~matches'
+_DUMP_UNIFIED_TRICK_SURF_TIERS_NAME: Final[str] = 'trick-surf-tiers'
 
 _DUMP_JSON_FILE_EXT: Final[str] = '.json'
 _DUMP_JSON_FILE_MIN_EXT: Final[str] = f'.min{_DUMP_JSON_FILE_EXT}'
+_DUMP_JSON_FILE_GZ_EXT: Final[str] = f'{_DUMP_JSON_FILE_MIN_EXT}.gz'
+_DUMP_JSON_FILE_XZ_EXT: Final[str] = f'{_DUMP_JSON_FILE_MIN_EXT}.xz'
+
+_DUMP_FORMAT_PRETTY: Final[str] = 'pretty'
+_DUMP_FORMAT_MIN: Final[str] = 'min'
+_DUMP_FORMAT_GZ: Final[str] = 'gz'
+_DUMP_FORMAT_XZ: Final[str] = 'xz'
+
+# Files of a document are written in this order.
+_DUMP_FORMATS: Final[tuple[str, ...]] = (_DUMP_FORMAT_PRETTY, _DUMP_FORMAT_MIN, _DUMP_FORMAT_GZ, _DUMP_FORMAT_XZ)
+
+# Dumped documents are read back from the cheapest format available.
+_DUMP_READ_FORMATS: Final[tuple[str, ...]] = (_DUMP_FORMAT_MIN, _DUMP_FORMAT_PRETTY, _DUMP_FORMAT_GZ, _DUMP_FORMAT_XZ)
+
+_DUMP_FORMAT_FILE_EXTS: Final[dict[str, str]] = MappingProxy({
+    _DUMP_FORMAT_PRETTY: _DUMP_JSON_FILE_EXT,
+    _DUMP_FORMAT_MIN: _DUMP_JSON_FILE_MIN_EXT,
+    _DUMP_FORMAT_GZ: _DUMP_JSON_FILE_GZ_EXT,
+    _DUMP_FORMAT_XZ: _DUMP_JSON_FILE_XZ_EXT
+})
+
+_DUMP_FORMATS_SEPARATOR: Final[str] = ','
+
+# Per-entity documents can be left out for an index of their byte ranges inside the collection's .min.json file.
+_DUMP_INDEX_NAME_SUFFIX: Final[str] = '.index'
+_DUMP_INDEX_FORMATS: Final[tuple[str, ...]] = (_DUMP_FORMAT_MIN,)
+_DUMP_INDEX_FILE_EXT: Final[str] = _DUMP_INDEX_NAME_SUFFIX + _DUMP_JSON_FILE_MIN_EXT
+
+_DUMP_MIN_JSON_ARRAY_START: Final[bytes] = b'['
+_DUMP_MIN_JSON_ARRAY_SEPARATOR: Final[bytes] = b','
+_DUMP_MIN_JSON_ARRAY_END: Final[bytes] = b']'
+_DUMP_MIN_JSON_ARRAY_START_LENGTH: Final[int] = len(_DUMP_MIN_JSON_ARRAY_START)
+_DUMP_MIN_JSON_ARRAY_SEPARATOR_LENGTH: Final[int] = len(_DUMP_MIN_JSON_ARRAY_SEPARATOR)
+
+# Compressed files don't embed a timestamp, so unchanged documents are compressed to the same bytes.
+_DUMP_GZIP_COMPRESS_LEVEL: Final[int] = 9
+_DUMP_GZIP_MTIME: Final[int] = 0
+_DUMP_XZ_PRESET: Final[int] = 6
 _DUMP_JSON_FILE_ENCODING: Final[str] = 'utf-8'
 
 
@@ -134,17 +330,41 @@ _TRICK_GXDS_ROUTE_TABLE_URL: Final[str] = _TRICK_GXDS_TABLE_BASE_URL + _TRICK_GX
 _TRICK_GXDS_TRICK_TABLE_URL: Final[str] = _TRICK_GXDS_TABLE_BASE_URL + _TRICK_GXDS_TRICK_TABLE_FILE_NAME
 _TRICK_GXDS_TRIGGER_TABLE_URL: Final[str] = _TRICK_GXDS_TABLE_BASE_URL + _TRICK_GXDS_TRIGGER_TABLE_FILE_NAME
 
-# language=PythonRegExp
-_TRICK_GXDS_PLAYER_TABLE_ROW_REGEX: Final[str] = r'^.*\((?P<id>\d+),\s?\'(?P<steam_id2>STEAM_[0-5]:[0-1]:\d+)\',\s?\'?(?P<steam_id64>\d{17})\'?,\s?\'(?P<name>.*?)\',\s?(?:\'https://steamcommunity\.com/id/(?P<steam_vanity_url>[a-zA-Z0-9_-]{2,32})/?\'|NULL),\s?(?:\'(?P<avatar_url>.*?)\'|NULL),\s?(?:\'(?P<avatar_custom_url>.*?)\'|NULL),\s?(?:\'(?P<dashboard_url>.*?)\'|NULL),\s?(?:\'(?P<join_date>.*?)\'|NULL),\s?(?:\'(?P<last_site_login_date>.*?)\'|NULL),\s?(?:\'(?P<last_server_login_date>.*?)\'|NULL),\s?(?:\'(?P<role>.*?)\'|NULL)\),?.*$'
+_TRICK_GXDS_TABLE_FILE_NAMES: Final[tuple[str, ...]] = (
+    _TRICK_GXDS_PLAYER_TABLE_FILE_NAME,
+    _TRICK_GXDS_ROUTE_TABLE_FILE_NAME,
+    _TRICK_GXDS_TRICK_TABLE_FILE_NAME,
+    _TRICK_GXDS_TRIGGER_TABLE_FILE_NAME
+)
+
+_TRICK_GXDS_STATE_TABLES_FIELD_NAME: Final[str] = 'tables'
+_TRICK_GXDS_STATE_OPTIONS_FIELD_NAME: Final[str] = 'options'
+_TRICK_GXDS_STATE_SHA256_FIELD_NAME: Final[str] = 'sha256'
+_TRICK_GXDS_STATE_SIZE_FIELD_NAME: Final[str] = 'size'
+_TRICK_GXDS_STATE_MTIME_NS_FIELD_NAME: Final[str] = 'mtime_ns'
+_TRICK_GXDS_STATE_NEW_POINTS_SYSTEM_FIELD_NAME: Final[str] = 'new_points_system'
+_TRICK_GXDS_STATE_TITLE_CASE_TRICK_NAMES_FIELD_NAME: Final[str] = 'title_case_trick_names'
+_TRICK_GXDS_STATE_FORMATS_FIELD_NAME: Final[str] = 'formats'
+
+_TRICK_GXDS_TABLE_FILE_ENCODING: Final[str] = 'utf-8'
+
+# Every table row is filtered like its regex used to, tricks & triggers are only kept for Ski2's map.
+_TRICK_GXDS_MAP_ID: Final[int] = 1
 
 # language=PythonRegExp
-_TRICK_GXDS_ROUTE_TABLE_ROW_REGEX: Final[str] = r'^.*\((?P<id>\d+),\s?(?P<trick_id>\d+),\s?(?P<trigger_id>\d+)\),?.*$'
+_TRICK_GXDS_PLAYER_STEAM_ID2_REGEX: Final[re.Pattern] = re.compile(r'STEAM_[0-5]:[0-1]:\d+')
 
 # language=PythonRegExp
-_TRICK_GXDS_TRICK_TABLE_ROW_REGEX: Final[str] = r'^.*\((?P<id>\d+),\s?\'(?P<name>.*?)\',\s?(?P<points>\d+),\s?(?P<velocity>\d+),\s?(?:\'(?P<create_date>.*?)\'|NULL),\s?(?P<author_id>\d+),\s?1\),?.*$'
+_TRICK_GXDS_PLAYER_STEAM_ID64_REGEX: Final[re.Pattern] = re.compile(r'\d{17}')
 
 # language=PythonRegExp
-_TRICK_GXDS_TRIGGER_TABLE_ROW_REGEX: Final[str] = r'^.*\((?P<id>\d+),\s?\'(?P<name>.*?)\',\s?(?:\'(?P<alt_name>.*?)\'|NULL),\s?(?:(?P<x>-?\d+|-?\d+\.\d+)|NULL),\s?(?:(?P<y>-?\d+|-?\d+\.\d+)|NULL),\s?(?:(?P<z>-?\d+|-?\d+\.\d+)|NULL),\s?1,\s?(?:\'(?P<image_url>.*?)\'|NULL)\),?.*$'
+_TRICK_GXDS_PLAYER_STEAM_VANITY_URL_REGEX: Final[re.Pattern] \
+    = re.compile(r'https://steamcommunity\.com/id/(?P<steam_vanity_url>[a-zA-Z0-9_-]{2,32})/?')
+
+_TRICK_GXDS_PLAYER_TABLE_SQL_COLUMN_COUNT: Final[int] = 12
+_TRICK_GXDS_ROUTE_TABLE_SQL_COLUMN_COUNT: Final[int] = 3
+_TRICK_GXDS_TRICK_TABLE_SQL_COLUMN_COUNT: Final[int] = 7
+_TRICK_GXDS_TRIGGER_TABLE_SQL_COLUMN_COUNT: Final[int] = 8
 
 _TRICK_GXDS_PLAYER_TABLE_ID_COLUMN_INDEX: Final[int] = 0
 _TRICK_GXDS_PLAYER_TABLE_STEAM_ID2_COLUMN_INDEX: Final[int] = 1
@@ -258,6 +478,12 @@ _TRICK_GXDS_TRIGGER_TABLE_COLUMN_TYPES: Final[dict[int, Callable[[Any], Any]]] =
     _TRICK_GXDS_TRIGGER_TABLE_IMAGE_URL_COLUMN_INDEX: str
 })
 
+# Typecodes of the column-oriented table output, columns of any other type are kept in lists.
+_TABLE_COLUMN_ARRAY_TYPECODES: Final[dict[Callable[[Any], Any], str]] = MappingProxy({
+    int: 'q',
+    float: 'd'
+})
+
 _TRICK_GXDS_TRIGGER_NAMES: Final[dict[str, Optional[str]]] = MappingProxy({
     't_spawn': 'T-Spawn (G: 0)',  # @CONFIRMED
     'main_ramp': 'Main Ramp (G: 0)',  # @CONFIRMED
@@ -414,7 +640,6 @@ _TRICK_GXDS_TRIGGER_NAMES: Final[dict[str, Optional[str]]] = MappingProxy({
     'spawn_divide_top': 'Spawn Divide Top (G: 0)',  # @CONFIRMED
     't1_middle_ramp_lower': 'T1 Middle Lower Ramp (G: 0)',  # @CONFIRMED
     't2_big_hole_left': 'T2 Big Left Hole (G: 1)',  # @CONFIRMED
-    '\\nt2_big_hole_left': 'T2 Big Left Hole (G: 1)',  # @CONFIRMED
     't2_big_hole_right': 'T2 Big Right Hole (G: 1)',  # @CONFIRMED
     't2_left_box_1': 'T2 Bottom Left Block (G: 0)',  # @CONFIRMED
     't2_right_box_1': 'T2 Bottom Right Block (G: 0)',  # @CONFIRMED
@@ -541,8 +766,31 @@ _TRICK_SURF_TIER_POINTS_LIMITS_NEW: Final[tuple[int, ...]] = (
 _TRICK_SURF_TIER_POINTS_LIMITS_OLD_LENGTH: Final[int] = len(_TRICK_SURF_TIER_POINTS_LIMITS_OLD)
 _TRICK_SURF_TIER_POINTS_LIMITS_NEW_LENGTH: Final[int] = len(_TRICK_SURF_TIER_POINTS_LIMITS_NEW)
 
+# Tiers returned by TrickSurf's API are the new points system's, each of them is split into subtiers.
+_TRICK_SURF_TIER_COUNT: Final[int] = _TRICK_SURF_TIER_POINTS_LIMITS_NEW_LENGTH
+_TRICK_SURF_SUBTIER_COUNT: Final[int] = 3
+
+# Negated limits are ascending, so the tier of some points is found by a bisection instead of a linear walk.
+_TRICK_SURF_TIER_POINTS_KEYS: Final[dict[tuple[int, ...], tuple[int, ...]]] = MappingProxy({
+    _TRICK_SURF_TIER_POINTS_LIMITS_OLD: tuple(-points_limit for points_limit in _TRICK_SURF_TIER_POINTS_LIMITS_OLD),
+    _TRICK_SURF_TIER_POINTS_LIMITS_NEW: tuple(-points_limit for points_limit in _TRICK_SURF_TIER_POINTS_LIMITS_NEW)
+})
+
+
+# CS:S port of TrickGxds' surf_ski_2 map, its triggers are named like the sifted route paths.
+_TRICK_SURF_SKI2_GAME_ID: Final[int] = 1
+_TRICK_SURF_SKI2_MAP_ID: Final[int] = 8
+
+_TRICK_GXDS_TRIGGER_NAME_ALTERNATIVES_SEPARATOR: Final[str] = '|'
+_TRICK_GXDS_TRIGGER_NAME_GROUP_REGEX: Final[re.Pattern] = re.compile(r'\s*\(G:\s*\d+\)\s*$')
+
+# Key of the tricks whose sequence ends at a trie node, trigger names are the keys of its children.
+_TRIGGER_TRIE_TRICKS_KEY: Final[Optional[str]] = None
+
 
 _TRICK_SURF_API_BASE_URL: Final[str] = 'https://api.trick.surf/'
+_DEFAULT_TRICK_SURF_API_BASE_URL: Final[str] = _TRICK_SURF_API_BASE_URL
+_TRICK_SURF_API_URL_PATH_SEPARATOR: Final[str] = '/'
 
 _TRICK_SURF_API_GAMES_ENDPOINT_NAME: Final[str] = 'games'
 _TRICK_SURF_API_MAPS_ENDPOINT_NAME: Final[str] = 'maps'
@@ -575,11 +823,11 @@ _TRICK_SURF_MAP_JSON_ID_FIELD_NAME: Final[str] = 'id'
 _TRICK_SURF_MAP_JSON_NAME_FIELD_NAME: Final[str] = 'name'
 _TRICK_SURF_MAP_JSON_AUTHOR_NAME_FIELD_NAME: Final[str] = 'author'
 _TRICK_SURF_MAP_JSON_CONNECTIONS_FIELD_NAME: Final[str] = 'connections'
-_TRICK_SURF_MAP_JSON_TIME_FIELD_NAME: Final[str] = 'name'
+_TRICK_SURF_MAP_JSON_TIME_FIELD_NAME: Final[str] = 'time'
 _TRICK_SURF_MAP_JSON_DATE_FIELD_NAME: Final[str] = 'date'
 _TRICK_SURF_MAP_JSON_LAST_CONNECT_FIELD_NAME: Final[str] = 'last_connect'
 _TRICK_SURF_MAP_JSON_IMAGE_URL_FIELD_NAME: Final[str] = 'image_url'
-_TRICK_SURF_MAP_JSON_TRICK_COUNT_FIELD_NAME: Final[str] = 'trick_count'
+_TRICK_SURF_MAP_JSON_TRICK_COUNT_FIELD_NAME: Final[str] = 'tricks_count'
 
 _TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME: Final[str] = 'id'
 _TRICK_SURF_MAP_TRICK_JSON_MAP_ID_FIELD_NAME: Final[str] = 'map_id'
@@ -590,8 +838,10 @@ _TRICK_SURF_MAP_TRICK_JSON_AUTHOR_NAME_FIELD_NAME: Final[str] = 'author'
 _TRICK_SURF_MAP_TRICK_JSON_AUTHOR_ID_FIELD_NAME: Final[str] = 'author_id'
 _TRICK_SURF_MAP_TRICK_JSON_UPDATE_AUTHOR_ID_FIELD_NAME: Final[str] = 'last_updated_author_id'
 _TRICK_SURF_MAP_TRICK_JSON_IS_ACTIVE_FIELD_NAME: Final[str] = 'active'
+_TRICK_SURF_MAP_TRICK_JSON_IS_RANKED_FIELD_NAME: Final[str] = 'ranked'
 _TRICK_SURF_MAP_TRICK_JSON_POINTS_FIELD_NAME: Final[str] = 'points'
 _TRICK_SURF_MAP_TRICK_JSON_TIER_FIELD_NAME: Final[str] = 'tier'
+_TRICK_SURF_MAP_TRICK_JSON_SUBTIER_FIELD_NAME: Final[str] = 'subtier'
 _TRICK_SURF_MAP_TRICK_JSON_MIN_SPEED_FIELD_NAME: Final[str] = 'min_velocity'
 _TRICK_SURF_MAP_TRICK_JSON_MAX_PRE_SPEED_FIELD_NAME: Final[str] = 'max_prestrafe'
 _TRICK_SURF_MAP_TRICK_JSON_MAX_DURATION_FIELD_NAME: Final[str] = 'max_duration'
@@ -599,10 +849,12 @@ _TRICK_SURF_MAP_TRICK_JSON_MAX_JUMP_COUNT_FIELD_NAME: Final[str] = 'max_jumps'
 _TRICK_SURF_MAP_TRICK_JSON_IS_START_JUMP_DISALLOWED_FIELD_NAME: Final[str] = 'no_jump'
 _TRICK_SURF_MAP_TRICK_JSON_IS_HIDDEN_FIELD_NAME: Final[str] = 'hidden'
 _TRICK_SURF_MAP_TRICK_JSON_COMPLETE_COUNT_FIELD_NAME: Final[str] = 'completions'
-_TRICK_SURF_MAP_TRICK_JSON_COMPLETE_PLAYER_COUNT_FIELD_NAME: Final[str] = 'playersCompleted'
-_TRICK_SURF_MAP_TRICK_JSON_TRIGGER_SEQUENCE_FIELD_NAME: Final[str] = 'trick_sequence'
+_TRICK_SURF_MAP_TRICK_JSON_COMPLETE_PLAYER_COUNT_FIELD_NAME: Final[str] = 'players_completed'
+_TRICK_SURF_MAP_TRICK_JSON_AVERAGE_RATING_FIELD_NAME: Final[str] = 'average_rating'
+_TRICK_SURF_MAP_TRICK_JSON_TRIGGER_SEQUENCE_FIELD_NAME: Final[str] = 'sequence'
 
 _TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_ID_FIELD_NAME: Final[str] = 'trigger_id'
+_TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_NAME_FIELD_NAME: Final[str] = 'name'
 _TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_ORDER_FIELD_NAME: Final[str] = 'order'
 _TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_IS_PASSTHROUGH_FIELD_NAME: Final[str] = 'passthrough'
 
@@ -611,7 +863,7 @@ _TRICK_SURF_MAP_TRIGGER_JSON_MAP_ID_FIELD_NAME: Final[str] = 'map_id'
 _TRICK_SURF_MAP_TRIGGER_JSON_NAME_FIELD_NAME: Final[str] = 'name'
 _TRICK_SURF_MAP_TRIGGER_JSON_IS_PASSTHROUGH_FIELD_NAME: Final[str] = 'passthrough'
 _TRICK_SURF_MAP_TRIGGER_JSON_IMAGE_URL_FIELD_NAME: Final[str] = 'image_url'
-_TRICK_SURF_MAP_TRIGGER_JSON_TRICK_COUNT_FIELD_NAME: Final[str] = 'trick_count'
+_TRICK_SURF_MAP_TRIGGER_JSON_TRICK_COUNT_FIELD_NAME: Final[str] = 'tricks_count'
 
 _TRICK_SURF_MAP_TELEPORT_JSON_ID_FIELD_NAME: Final[str] = 'id'
 _TRICK_SURF_MAP_TELEPORT_JSON_MAP_ID_FIELD_NAME: Final[str] = 'map_id'
@@ -629,6 +881,7 @@ _TRICK_SURF_MAP_TELEPORT_JSON_VELOCITY_X_FIELD_NAME: Final[str] = 'velocity_x'
 _TRICK_SURF_MAP_TELEPORT_JSON_VELOCITY_Y_FIELD_NAME: Final[str] = 'velocity_y'
 _TRICK_SURF_MAP_TELEPORT_JSON_VELOCITY_Z_FIELD_NAME: Final[str] = 'velocity_z'
 _TRICK_SURF_MAP_TELEPORT_JSON_IS_ACTIVE_FIELD_NAME: Final[str] = 'active'
+_TRICK_SURF_MAP_TELEPORT_JSON_WHOP_FIELD_NAME: Final[str] = 'whop'
 
 _TRICK_SURF_PLAYER_JSON_ID_FIELD_NAME: Final[str] = 'id'
 _TRICK_SURF_PLAYER_JSON_STEAM_ID2_FIELD_NAME: Final[str] = 'steamid'
@@ -641,7 +894,7 @@ _TRICK_SURF_PLAYER_JSON_VIP_LEVEL_FIELD_NAME: Final[str] = 'vip_level'
 _TRICK_SURF_PLAYER_JSON_FIRST_SERVER_JOIN_DATE_FIELD_NAME: Final[str] = 'first_connect'
 _TRICK_SURF_PLAYER_JSON_LAST_SERVER_JOIN_DATE_FIELD_NAME: Final[str] = 'last_connect'
 _TRICK_SURF_PLAYER_JSON_TIME_ALIVE_FIELD_NAME: Final[str] = 'time_alive'
-_TRICK_SURF_PLAYER_JSON_TIME_SPECTATE_FIELD_NAMED: Final[str] = 'time_spectate'
+_TRICK_SURF_PLAYER_JSON_TIME_SPECTATE_FIELD_NAME: Final[str] = 'time_spectate'
 _TRICK_SURF_PLAYER_JSON_ROLE_FIELD_NAME: Final[str] = 'role'
 
 _TRICK_SURF_SERVER_JSON_ID_FIELD_NAME: Final[str] = 'id'
@@ -677,6 +930,7 @@ _TRICK_SURF_GAME_EVENT_JSON_GOAL_NAME_FIELD_NAME: Final[str] = 'goal_name'
 _TRICK_SURF_GAME_EVENT_JSON_DESCRIPTION_HTML_FIELD_NAME: Final[str] = 'description'
 _TRICK_SURF_GAME_EVENT_JSON_IMAGE_URL_FIELD_NAME: Final[str] = 'image_url'
 _TRICK_SURF_GAME_EVENT_JSON_PROGRESS_FIELD_NAME: Final[str] = 'progress'
+_TRICK_SURF_GAME_EVENT_JSON_IS_ACTIVE_FIELD_NAME: Final[str] = 'active'
 _TRICK_SURF_GAME_EVENT_JSON_PROGRESS_TOP_FIELD_NAME: Final[str] = 'progressTop'
 _TRICK_SURF_GAME_EVENT_JSON_TIME_TOP_FIELD_NAME: Final[str] = 'timeTop'
 _TRICK_SURF_GAME_EVENT_JSON_SPEED_TOP_FIELD_NAME: Final[str] = 'speedTop'
@@ -764,17 +1018,579 @@ _TRICK_SURF_MAP_RANKING_JSON_PLAYER_OBJECT_FIELD_NAME: Final[str] = 'player'
 # _TRICK_SURF_MAP_TRICK_RECORD_JSON_MAP_OBJECT_FIELD_NAME: Final[str] = 'map'
 
 
+_SQLITE_SCHEMA: Final[str] = '''
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    name TEXT
+);
+
+CREATE TABLE IF NOT EXISTS maps (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    date TEXT,
+    author TEXT,
+    last_connect TEXT,
+    connections INTEGER,
+    time REAL,
+    image_url TEXT,
+    tricks_count INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS tricks (
+    game_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    map_id INTEGER NOT NULL,
+    name TEXT,
+    date TEXT,
+    author TEXT,
+    author_id INTEGER,
+    last_updated TEXT,
+    last_updated_author_id INTEGER,
+    active INTEGER,
+    ranked INTEGER,
+    tier INTEGER,
+    subtier INTEGER,
+    max_prestrafe INTEGER,
+    completions INTEGER,
+    players_completed INTEGER,
+    average_rating REAL,
+    PRIMARY KEY (game_id, id)
+);
+
+CREATE INDEX IF NOT EXISTS tricks_map_id_index ON tricks (map_id, game_id);
+CREATE INDEX IF NOT EXISTS tricks_author_id_index ON tricks (author_id);
+CREATE INDEX IF NOT EXISTS tricks_author_index ON tricks (author);
+
+CREATE TABLE IF NOT EXISTS trick_sequence (
+    game_id INTEGER NOT NULL,
+    map_id INTEGER NOT NULL,
+    trick_id INTEGER NOT NULL,
+    "order" INTEGER NOT NULL,
+    trigger_id INTEGER,
+    name TEXT,
+    passthrough INTEGER,
+    PRIMARY KEY (game_id, trick_id, "order")
+);
+
+CREATE INDEX IF NOT EXISTS trick_sequence_map_id_index ON trick_sequence (map_id, game_id);
+CREATE INDEX IF NOT EXISTS trick_sequence_trigger_id_index ON trick_sequence (trigger_id);
+
+CREATE TABLE IF NOT EXISTS triggers (
+    id INTEGER PRIMARY KEY,
+    map_id INTEGER NOT NULL,
+    name TEXT,
+    passthrough INTEGER,
+    image_url TEXT,
+    tricks_count INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS triggers_map_id_index ON triggers (map_id);
+
+CREATE TABLE IF NOT EXISTS teleports (
+    id INTEGER PRIMARY KEY,
+    map_id INTEGER NOT NULL,
+    trigger_id INTEGER,
+    name TEXT,
+    "order" INTEGER,
+    whop INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS teleports_map_id_index ON teleports (map_id);
+
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    steamid TEXT,
+    steamid64 TEXT,
+    avatar_url TEXT,
+    name TEXT,
+    country TEXT,
+    country_code TEXT,
+    vip_level INTEGER,
+    role TEXT
+);
+
+CREATE INDEX IF NOT EXISTS players_steamid64_index ON players (steamid64);
+CREATE INDEX IF NOT EXISTS players_name_index ON players (name);
+
+CREATE TABLE IF NOT EXISTS game_players (
+    game_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    first_connect TEXT,
+    last_connect TEXT,
+    time_alive REAL,
+    time_spectate REAL,
+    PRIMARY KEY (game_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS game_players_player_id_index ON game_players (player_id);
+
+CREATE TABLE IF NOT EXISTS servers (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    server_ip TEXT,
+    map_id INTEGER,
+    game_name TEXT,
+    players_online INTEGER,
+    max_number_of_players INTEGER,
+    number_of_players INTEGER,
+    password_required INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    game_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    event_type_id INTEGER,
+    name TEXT,
+    date TEXT,
+    end_date TEXT,
+    goal INTEGER,
+    goal_name TEXT,
+    progress REAL,
+    description TEXT,
+    image_url TEXT,
+    active INTEGER,
+    PRIMARY KEY (game_id, id)
+);
+
+CREATE TABLE IF NOT EXISTS rankings (
+    game_id INTEGER NOT NULL,
+    map_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    first_connect REAL,
+    last_connect REAL,
+    connections INTEGER,
+    time_alive REAL,
+    time_spectate REAL,
+    jumps INTEGER,
+    sprays INTEGER,
+    style INTEGER,
+    completed_tricks INTEGER,
+    percent_completion REAL,
+    percent_completion_rank INTEGER,
+    points INTEGER,
+    points_rank INTEGER,
+    time_records INTEGER,
+    time_records_rank INTEGER,
+    speed_records INTEGER,
+    speed_records_rank INTEGER,
+    total_records INTEGER,
+    total_records_rank INTEGER,
+    PRIMARY KEY (game_id, map_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS rankings_player_id_index ON rankings (player_id);
+
+CREATE TABLE IF NOT EXISTS gxds_players (
+    id INTEGER PRIMARY KEY,
+    steam_id2 TEXT,
+    steam_id64 TEXT,
+    name TEXT,
+    steam_vanity_url TEXT,
+    avatar_url TEXT,
+    avatar_custom_url TEXT,
+    dashboard_url TEXT,
+    join_date TEXT,
+    last_site_login_date TEXT,
+    last_server_login_date TEXT,
+    role TEXT
+);
+
+CREATE INDEX IF NOT EXISTS gxds_players_steam_id64_index ON gxds_players (steam_id64);
+
+CREATE TABLE IF NOT EXISTS gxds_routes (
+    id INTEGER PRIMARY KEY,
+    trick_id INTEGER,
+    trigger_id INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS gxds_routes_trick_id_index ON gxds_routes (trick_id);
+
+CREATE TABLE IF NOT EXISTS gxds_tricks (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    points INTEGER,
+    is_pre_speed_locked INTEGER,
+    create_date TEXT,
+    author_id INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS gxds_tricks_author_id_index ON gxds_tricks (author_id);
+
+CREATE TABLE IF NOT EXISTS gxds_triggers (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    alt_name TEXT,
+    x REAL,
+    y REAL,
+    z REAL,
+    image_url TEXT
+);
+'''
+
+# Columns of every exported table & the JSON fields they are read from, nested fields are given as paths.
+_SQLITE_GAME_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_GAME_JSON_ID_FIELD_NAME,
+    'name': _TRICK_SURF_GAME_JSON_NAME_FIELD_NAME
+})
+
+_SQLITE_MAP_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_MAP_JSON_ID_FIELD_NAME,
+    'name': _TRICK_SURF_MAP_JSON_NAME_FIELD_NAME,
+    'date': _TRICK_SURF_MAP_JSON_DATE_FIELD_NAME,
+    'author': _TRICK_SURF_MAP_JSON_AUTHOR_NAME_FIELD_NAME,
+    'last_connect': _TRICK_SURF_MAP_JSON_LAST_CONNECT_FIELD_NAME,
+    'connections': _TRICK_SURF_MAP_JSON_CONNECTIONS_FIELD_NAME,
+    'time': _TRICK_SURF_MAP_JSON_TIME_FIELD_NAME,
+    'image_url': _TRICK_SURF_MAP_JSON_IMAGE_URL_FIELD_NAME,
+    'tricks_count': _TRICK_SURF_MAP_JSON_TRICK_COUNT_FIELD_NAME
+})
+
+_SQLITE_TRICK_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME,
+    'name': _TRICK_SURF_MAP_TRICK_JSON_NAME_FIELD_NAME,
+    'date': _TRICK_SURF_MAP_TRICK_JSON_CREATE_DATE_FIELD_NAME,
+    'author': _TRICK_SURF_MAP_TRICK_JSON_AUTHOR_NAME_FIELD_NAME,
+    'author_id': _TRICK_SURF_MAP_TRICK_JSON_AUTHOR_ID_FIELD_NAME,
+    'last_updated': _TRICK_SURF_MAP_TRICK_JSON_UPDATE_DATE_FIELD_NAME,
+    'last_updated_author_id': _TRICK_SURF_MAP_TRICK_JSON_UPDATE_AUTHOR_ID_FIELD_NAME,
+    'active': _TRICK_SURF_MAP_TRICK_JSON_IS_ACTIVE_FIELD_NAME,
+    'ranked': _TRICK_SURF_MAP_TRICK_JSON_IS_RANKED_FIELD_NAME,
+    'tier': _TRICK_SURF_MAP_TRICK_JSON_TIER_FIELD_NAME,
+    'subtier': _TRICK_SURF_MAP_TRICK_JSON_SUBTIER_FIELD_NAME,
+    'max_prestrafe': _TRICK_SURF_MAP_TRICK_JSON_MAX_PRE_SPEED_FIELD_NAME,
+    'completions': _TRICK_SURF_MAP_TRICK_JSON_COMPLETE_COUNT_FIELD_NAME,
+    'players_completed': _TRICK_SURF_MAP_TRICK_JSON_COMPLETE_PLAYER_COUNT_FIELD_NAME,
+    'average_rating': _TRICK_SURF_MAP_TRICK_JSON_AVERAGE_RATING_FIELD_NAME
+})
+
+_SQLITE_TRICK_SEQUENCE_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    '"order"': _TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_ORDER_FIELD_NAME,
+    'trigger_id': _TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_ID_FIELD_NAME,
+    'name': _TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_NAME_FIELD_NAME,
+    'passthrough': _TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_IS_PASSTHROUGH_FIELD_NAME
+})
+
+_SQLITE_TRIGGER_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_MAP_TRIGGER_JSON_ID_FIELD_NAME,
+    'map_id': _TRICK_SURF_MAP_TRIGGER_JSON_MAP_ID_FIELD_NAME,
+    'name': _TRICK_SURF_MAP_TRIGGER_JSON_NAME_FIELD_NAME,
+    'passthrough': _TRICK_SURF_MAP_TRIGGER_JSON_IS_PASSTHROUGH_FIELD_NAME,
+    'image_url': _TRICK_SURF_MAP_TRIGGER_JSON_IMAGE_URL_FIELD_NAME,
+    'tricks_count': _TRICK_SURF_MAP_TRIGGER_JSON_TRICK_COUNT_FIELD_NAME
+})
+
+_SQLITE_TELEPORT_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_MAP_TELEPORT_JSON_ID_FIELD_NAME,
+    'map_id': _TRICK_SURF_MAP_TELEPORT_JSON_MAP_ID_FIELD_NAME,
+    'trigger_id': _TRICK_SURF_MAP_TELEPORT_JSON_TRIGGER_ID_FIELD_NAME,
+    'name': _TRICK_SURF_MAP_TELEPORT_JSON_NAME_FIELD_NAME,
+    '"order"': _TRICK_SURF_MAP_TELEPORT_JSON_ORDER_FIELD_NAME,
+    'whop': _TRICK_SURF_MAP_TELEPORT_JSON_WHOP_FIELD_NAME
+})
+
+_SQLITE_PLAYER_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_PLAYER_JSON_ID_FIELD_NAME,
+    'steamid': _TRICK_SURF_PLAYER_JSON_STEAM_ID2_FIELD_NAME,
+    'steamid64': _TRICK_SURF_PLAYER_JSON_STEAM_ID64_FIELD_NAME,
+    'avatar_url': _TRICK_SURF_PLAYER_JSON_AVATAR_URL_FIELD_NAME,
+    'name': _TRICK_SURF_PLAYER_JSON_NAME_FIELD_NAME,
+    'country': _TRICK_SURF_PLAYER_JSON_COUNTRY_FIELD_NAME,
+    'country_code': _TRICK_SURF_PLAYER_JSON_COUNTRY_CODE_FIELD_NAME,
+    'vip_level': _TRICK_SURF_PLAYER_JSON_VIP_LEVEL_FIELD_NAME,
+    'role': _TRICK_SURF_PLAYER_JSON_ROLE_FIELD_NAME
+})
+
+_SQLITE_GAME_PLAYER_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'player_id': _TRICK_SURF_PLAYER_JSON_ID_FIELD_NAME,
+    'first_connect': _TRICK_SURF_PLAYER_JSON_FIRST_SERVER_JOIN_DATE_FIELD_NAME,
+    'last_connect': _TRICK_SURF_PLAYER_JSON_LAST_SERVER_JOIN_DATE_FIELD_NAME,
+    'time_alive': _TRICK_SURF_PLAYER_JSON_TIME_ALIVE_FIELD_NAME,
+    'time_spectate': _TRICK_SURF_PLAYER_JSON_TIME_SPECTATE_FIELD_NAME
+})
+
+_SQLITE_SERVER_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_SERVER_JSON_ID_FIELD_NAME,
+    'name': _TRICK_SURF_SERVER_JSON_NAME_FIELD_NAME,
+    'server_ip': _TRICK_SURF_SERVER_JSON_IP_FIELD_NAME,
+    'map_id': (_TRICK_SURF_SERVER_JSON_MAP_FIELD_NAME, _TRICK_SURF_SERVER_MAP_JSON_ID_FIELD_NAME),
+    'game_name': _TRICK_SURF_SERVER_JSON_GAME_NAME_FIELD_NAME,
+    'players_online': _TRICK_SURF_SERVER_JSON_ONLINE_PLAYER_COUNT_FIELD_NAME,
+    'max_number_of_players': _TRICK_SURF_SERVER_JSON_PLAYER_COUNT_LIMIT_FIELD_NAME,
+    'number_of_players': _TRICK_SURF_SERVER_JSON_PLAYER_COUNT_FIELD_NAME,
+    'password_required': _TRICK_SURF_SERVER_JSON_IS_PASSWORD_REQUIRED_FIELD_NAME
+})
+
+_SQLITE_EVENT_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'id': _TRICK_SURF_GAME_EVENT_JSON_ID_FIELD_NAME,
+    'event_type_id': _TRICK_SURF_GAME_EVENT_JSON_TYPE_ID_FIELD_NAME,
+    'name': _TRICK_SURF_GAME_EVENT_JSON_NAME_FIELD_NAME,
+    'date': _TRICK_SURF_GAME_EVENT_JSON_START_DATE_FIELD_NAME,
+    'end_date': _TRICK_SURF_GAME_EVENT_JSON_END_DATE_FIELD_NAME,
+    'goal': _TRICK_SURF_GAME_EVENT_JSON_GOAL_COUNT_FIELD_NAME,
+    'goal_name': _TRICK_SURF_GAME_EVENT_JSON_GOAL_NAME_FIELD_NAME,
+    'progress': _TRICK_SURF_GAME_EVENT_JSON_PROGRESS_FIELD_NAME,
+    'description': _TRICK_SURF_GAME_EVENT_JSON_DESCRIPTION_HTML_FIELD_NAME,
+    'image_url': _TRICK_SURF_GAME_EVENT_JSON_IMAGE_URL_FIELD_NAME,
+    'active': _TRICK_SURF_GAME_EVENT_JSON_IS_ACTIVE_FIELD_NAME
+})
+
+_SQLITE_RANKING_COLUMNS: Final[dict[str, Union[str, tuple[str, ...]]]] = MappingProxy({
+    'player_id': _TRICK_SURF_MAP_RANKING_JSON_PLAYER_ID_FIELD_NAME,
+    'first_connect': _TRICK_SURF_MAP_RANKING_JSON_FIRST_CONNECT_TIMESTAMP_FIELD_NAME,
+    'last_connect': _TRICK_SURF_MAP_RANKING_JSON_LAST_CONNECT_TIMESTAMP_FIELD_NAME,
+    'connections': _TRICK_SURF_MAP_RANKING_JSON_CONNECTION_COUNT_FIELD_NAME,
+    'time_alive': _TRICK_SURF_MAP_RANKING_JSON_TIME_ALIVE_FIELD_NAME,
+    'time_spectate': _TRICK_SURF_MAP_RANKING_JSON_TIME_SPECTATE_FIELD_NAME,
+    'jumps': _TRICK_SURF_MAP_RANKING_JSON_JUMP_COUNT_FIELD_NAME,
+    'sprays': _TRICK_SURF_MAP_RANKING_JSON_SPRAY_COUNT_FIELD_NAME,
+    'style': _TRICK_SURF_MAP_RANKING_JSON_STYLE_FIELD_NAME,
+    'completed_tricks': _TRICK_SURF_MAP_RANKING_JSON_COMPLETE_TRICK_COUNT_FIELD_NAME,
+    'percent_completion': _TRICK_SURF_MAP_RANKING_JSON_COMPLETE_PERCENT_FIELD_NAME,
+    'percent_completion_rank': _TRICK_SURF_MAP_RANKING_JSON_COMPLETE_PERCENT_RANK_FIELD_NAME,
+    'points': _TRICK_SURF_MAP_RANKING_JSON_POINT_COUNT_FIELD_NAME,
+    'points_rank': _TRICK_SURF_MAP_RANKING_JSON_POINT_COUNT_RANK_FIELD_NAME,
+    'time_records': _TRICK_SURF_MAP_RANKING_JSON_TIME_RECORD_COUNT_FIELD_NAME,
+    'time_records_rank': _TRICK_SURF_MAP_RANKING_JSON_TIME_RECORD_COUNT_RANK_FIELD_NAME,
+    'speed_records': _TRICK_SURF_MAP_RANKING_JSON_SPEED_RECORD_COUNT_FIELD_NAME,
+    'speed_records_rank': _TRICK_SURF_MAP_RANKING_JSON_SPEED_RECORD_COUNT_RANK_FIELD_NAME,
+    'total_records': _TRICK_SURF_MAP_RANKING_JSON_TOTAL_RECORD_COUNT_FIELD_NAME,
+    'total_records_rank': _TRICK_SURF_MAP_RANKING_JSON_TOTAL_RECORD_COUNT_RANK_FIELD_NAME
+})
+
+_SQLITE_RANKINGS_FIELD_NAME: Final[str] = 'rankings'
+
+_SQLITE_GAME_ID_COLUMN_NAME: Final[str] = 'game_id'
+_SQLITE_MAP_ID_COLUMN_NAME: Final[str] = 'map_id'
+_SQLITE_TRICK_ID_COLUMN_NAME: Final[str] = 'trick_id'
+
+
 _DEFAULT_TRICK_GXDS_SIFT_ENTRIES: Final[bool] = True
 _DEFAULT_TRICK_GXDS_USE_NEW_POINTS_SYSTEM: Final[bool] = False
 _DEFAULT_TRICK_GXDS_TITLE_CASE_NAMES: Final[bool] = False
+_DEFAULT_TRICK_GXDS_USE_REMOTE_SOURCE: Final[bool] = False
+
+_DEFAULT_TRICK_SURF_MAX_CONCURRENCY: Final[int] = 8
+_DEFAULT_TRICK_SURF_INCREMENTAL: Final[bool] = False
+_DEFAULT_TRICK_SURF_STREAM: Final[bool] = False
+_DEFAULT_TRICK_SURF_FULL_REFRESH_DAYS: Final[int] = 28
+
+_DEFAULT_JSON_WRITER_THREADS: Final[int] = 4
+_DEFAULT_JSON_WRITER_QUEUE_SIZE: Final[int] = 256
+_DEFAULT_JSON_WRITER_FSYNC: Final[bool] = False
+_DEFAULT_JSON_WRITER_SKIP_UNCHANGED: Final[bool] = False
+
+_DEFAULT_DUMP_FORMATS: Final[tuple[str, ...]] = (_DUMP_FORMAT_PRETTY, _DUMP_FORMAT_MIN)
+_DEFAULT_DUMP_ENTITY_INDEX: Final[bool] = False
+
+_JSON_MANIFEST_TEMP_FILE_EXT: Final[str] = '.tmp'
+
+_TRICK_SURF_STATE_FULL_REFRESH_TIMESTAMP_FIELD_NAME: Final[str] = 'full_refresh_timestamp'
+
+_SECONDS_PER_DAY: Final[int] = 24 * 60 * 60
+
+
+_HTTP_URL_SCHEMES: Final[tuple[str, ...]] = ('http://', 'https://')
+
+_DEFAULT_HTTP_POOL_CONNECTIONS: Final[int] = 4
+_DEFAULT_HTTP_POOL_MAXSIZE: Final[int] = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
+_DEFAULT_HTTP_TIMEOUT: Final[float] = 60.0
+
+_DEFAULT_HTTP_TEXT_ENCODING: Final[str] = 'utf-8'
+
+_HTTP_STATUS_NO_CONTENT: Final[int] = 204
+_HTTP_STATUS_NOT_MODIFIED: Final[int] = 304
+_HTTP_STATUS_TOO_MANY_REQUESTS: Final[int] = 429
+_HTTP_STATUS_INTERNAL_SERVER_ERROR: Final[int] = 500
+_HTTP_STATUS_BAD_GATEWAY: Final[int] = 502
+_HTTP_STATUS_SERVICE_UNAVAILABLE: Final[int] = 503
+_HTTP_STATUS_GATEWAY_TIMEOUT: Final[int] = 504
+
+# Statuses the server answers w/ when it's overloaded, the request rate backs off on top of the retry.
+_HTTP_STATUSES_THROTTLED: Final[frozenset[int]] = frozenset({
+    _HTTP_STATUS_TOO_MANY_REQUESTS,
+    _HTTP_STATUS_SERVICE_UNAVAILABLE
+})
+
+_HTTP_STATUSES_TRANSIENT: Final[frozenset[int]] = _HTTP_STATUSES_THROTTLED | frozenset({
+    _HTTP_STATUS_INTERNAL_SERVER_ERROR,
+    _HTTP_STATUS_BAD_GATEWAY,
+    _HTTP_STATUS_GATEWAY_TIMEOUT
+})
+
+_HTTP_TRANSIENT_EXCEPTIONS: Final[tuple[type, ...]] = (requests.ConnectionError, requests.Timeout)
+
+_HTTP_HEADER_ETAG: Final[str] = 'ETag'
+_HTTP_HEADER_LAST_MODIFIED: Final[str] = 'Last-Modified'
+_HTTP_HEADER_IF_NONE_MATCH: Final[str] = 'If-None-Match'
+_HTTP_HEADER_IF_MODIFIED_SINCE: Final[str] = 'If-Modified-Since'
+_HTTP_HEADER_RETRY_AFTER: Final[str] = 'Retry-After'
+
+_DEFAULT_HTTP_MAX_RETRIES: Final[int] = 5
+_DEFAULT_HTTP_REQUEST_RATE: Final[Optional[float]] = None  # requests per second
+
+_HTTP_RETRY_AFTER_MAX: Final[float] = 600.0  # seconds
+_HTTP_BACKOFF_BASE: Final[float] = 0.5  # seconds
+_HTTP_BACKOFF_MAX: Final[float] = 30.0  # seconds
+
+_SCHEDULER_THROTTLE_DECREASE: Final[float] = 0.5
+_SCHEDULER_LATENCY_DECREASE: Final[float] = 0.75
+_SCHEDULER_LATENCY_TOLERANCE: Final[float] = 2.0
+_SCHEDULER_LATENCY_SLACK: Final[float] = 0.05  # seconds
+_SCHEDULER_LATENCY_SHORT_WEIGHT: Final[float] = 0.2
+_SCHEDULER_LATENCY_LONG_WEIGHT: Final[float] = 0.02
+_SCHEDULER_MIN_REQUEST_RATE: Final[float] = 1.0  # requests per second
+_SCHEDULER_RATE_WINDOW: Final[float] = 1.0  # seconds
+_SCHEDULER_BUCKET_BURST: Final[float] = 1.0  # seconds worth of tokens
+
+_HTTP_CACHE_META_FILE_EXT: Final[str] = '.json'
+_HTTP_CACHE_BODY_FILE_EXT: Final[str] = '.body'
+_HTTP_CACHE_TEMP_FILE_EXT: Final[str] = '.tmp'
+
+_HTTP_CACHE_META_URL_FIELD_NAME: Final[str] = 'url'
+_HTTP_CACHE_META_ETAG_FIELD_NAME: Final[str] = 'etag'
+_HTTP_CACHE_META_LAST_MODIFIED_FIELD_NAME: Final[str] = 'last_modified'
+_HTTP_CACHE_META_ENCODING_FIELD_NAME: Final[str] = 'encoding'
+_HTTP_CACHE_META_SIZE_FIELD_NAME: Final[str] = 'size'
+
+_BYTES_PER_MEBIBYTE: Final[int] = 1024 * 1024
+
+# Phases are timed in the thread doing them, so their wall & cpu times are summed over the threads running them at once.
+_REPORT_PHASE_FETCH: Final[str] = 'fetch'
+_REPORT_PHASE_PARSE: Final[str] = 'parse'
+_REPORT_PHASE_UNESCAPE: Final[str] = 'unescape'
+_REPORT_PHASE_SERIALIZE: Final[str] = 'serialize'
+_REPORT_PHASE_WRITE: Final[str] = 'write'
+
+_REPORT_PHASES: Final[tuple[str, ...]] = (
+    _REPORT_PHASE_FETCH,
+    _REPORT_PHASE_PARSE,
+    _REPORT_PHASE_UNESCAPE,
+    _REPORT_PHASE_SERIALIZE,
+    _REPORT_PHASE_WRITE
+)
+
+# Upper bounds of the latency histogram's buckets in seconds, the last bucket is unbounded.
+_REPORT_LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_REPORT_LATENCY_BUCKET_UNBOUNDED_NAME: Final[str] = '+Inf'
+
+_REPORT_ENDPOINT_STATUS_ERROR_NAME: Final[str] = 'error'
+_REPORT_URL_PATH_SEPARATOR: Final[str] = '/'
+
+_REPORT_TIMESTAMP_FIELD_NAME: Final[str] = 'timestamp'
+_REPORT_WALL_SECONDS_FIELD_NAME: Final[str] = 'wall_seconds'
+_REPORT_CPU_SECONDS_FIELD_NAME: Final[str] = 'cpu_seconds'
+_REPORT_COUNT_FIELD_NAME: Final[str] = 'count'
+_REPORT_SUCCESS_FIELD_NAME: Final[str] = 'success'
+_REPORT_STEPS_FIELD_NAME: Final[str] = 'steps'
+_REPORT_PHASES_FIELD_NAME: Final[str] = 'phases'
+_REPORT_ENDPOINTS_FIELD_NAME: Final[str] = 'endpoints'
+_REPORT_REQUESTS_FIELD_NAME: Final[str] = 'requests'
+_REPORT_BYTES_FIELD_NAME: Final[str] = 'bytes'
+_REPORT_LATENCY_SECONDS_FIELD_NAME: Final[str] = 'latency_seconds'
+_REPORT_MAX_LATENCY_SECONDS_FIELD_NAME: Final[str] = 'max_latency_seconds'
+_REPORT_LATENCY_HISTOGRAM_FIELD_NAME: Final[str] = 'latency_histogram'
+_REPORT_STATUSES_FIELD_NAME: Final[str] = 'statuses'
+_REPORT_FILES_FIELD_NAME: Final[str] = 'files'
+_REPORT_WRITTEN_FIELD_NAME: Final[str] = 'written'
+_REPORT_SKIPPED_FIELD_NAME: Final[str] = 'skipped'
+_REPORT_SCHEDULER_FIELD_NAME: Final[str] = 'scheduler'
+_REPORT_RETRIES_FIELD_NAME: Final[str] = 'retries'
+_REPORT_THROTTLED_FIELD_NAME: Final[str] = 'throttled'
+_REPORT_CONCURRENCY_LIMIT_FIELD_NAME: Final[str] = 'concurrency_limit'
+_REPORT_MIN_CONCURRENCY_LIMIT_FIELD_NAME: Final[str] = 'min_concurrency_limit'
+_REPORT_REQUEST_RATES_FIELD_NAME: Final[str] = 'request_rates'
+
+_REPORT_SUMMARY_PHASE_HEADER: Final[str] = f'{"phase":<12}{"wall s":>10}{"cpu s":>10}{"count":>10}'
+_REPORT_SUMMARY_PHASE_ROW_FMT: Final[str] = '%-12s%10.3f%10.3f%10d'
+_REPORT_SUMMARY_STEP_HEADER: Final[str] = f'{"step":<18}{"wall s":>10}{"cpu s":>10}  result'
+_REPORT_SUMMARY_STEP_ROW_FMT: Final[str] = '%-18s%10.3f%10.3f  %s'
+_REPORT_SUMMARY_ENDPOINT_HEADER: Final[str] = f'{"endpoint":<14}{"requests":>10}{"MiB":>10}{"avg ms":>10}{"max ms":>10}  statuses'
+_REPORT_SUMMARY_ENDPOINT_ROW_FMT: Final[str] = '%-14s%10d%10.2f%10.1f%10.1f  %s'
+_REPORT_SUMMARY_FILES_FMT: Final[str] = 'files: %d written (%.2f MiB), %d skipped unchanged'
+_REPORT_SUMMARY_SCHEDULER_FMT: Final[str] = 'requests: %d retried, %d throttled, concurrency limit %.1f (lowest %.1f)'
+_REPORT_SUMMARY_STATUS_FMT: Final[str] = '%s:%d'
+_REPORT_SUMMARY_STATUS_SEPARATOR: Final[str] = ' '
+_REPORT_SUMMARY_SUCCESS_NAMES: Final[dict[Optional[bool], str]] = MappingProxy({
+    True: 'success',
+    False: 'failure',
+    None: 'unknown'
+})
+
+_MILLISECONDS_PER_SECOND: Final[int] = 1000
+
+_MEMORY_STAGE_TRICK_SURF_FETCH: Final[str] = f'{_STEP_DUMP_TRICK_SURF_NAME}/fetch'
+_MEMORY_STAGE_TRICK_SURF_WRITE: Final[str] = f'{_STEP_DUMP_TRICK_SURF_NAME}/write'
+
+_MEMORY_SAMPLE_INTERVAL: Final[float] = 0.05  # seconds
+_MEMORY_PROC_STATM_PATH: Final[str] = '/proc/self/statm'
+_MEMORY_PAGE_SIZE: Final[int] = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_MEMORY_MAXRSS_UNIT: Final[int] = 1 if sys.platform == 'darwin' else 1024
+
+_REPORT_MEMORY_FIELD_NAME: Final[str] = 'memory'
+_REPORT_STAGES_FIELD_NAME: Final[str] = 'stages'
+_REPORT_RSS_PEAK_BYTES_FIELD_NAME: Final[str] = 'rss_peak_bytes'
+_REPORT_TRACEMALLOC_PEAK_BYTES_FIELD_NAME: Final[str] = 'tracemalloc_peak_bytes'
+_REPORT_BUDGET_BYTES_FIELD_NAME: Final[str] = 'budget_bytes'
+_REPORT_STAGED_FIELD_NAME: Final[str] = 'staged'
+
+_REPORT_SUMMARY_MEMORY_HEADER: Final[str] = f'{"stage":<18}{"rss MiB":>10}{"heap MiB":>10}'
+_REPORT_SUMMARY_MEMORY_ROW_FMT: Final[str] = '%-18s%10.1f%10.1f'
+_REPORT_SUMMARY_STAGED_FMT: Final[str] = 'staged: %d payloads (%.2f MiB) over the %.0f MiB memory budget'
+
+_STAGING_FILE_EXT: Final[str] = '.json'
+
+_DEFAULT_HTTP_CACHE_SIZE: Final[int] = 1024  # MiB
+
+
+_JOURNAL_FILE_NAME: Final[str] = 'journal.jsonl'
+_JOURNAL_PAYLOAD_FILE_EXT: Final[str] = '.json'
+_JOURNAL_TEMP_FILE_EXT: Final[str] = '.tmp'
+_JOURNAL_FILE_ENCODING: Final[str] = 'utf-8'
+_OPEN_FILE_APPEND_FLAG: Final[str] = 'a'
+
+_JOURNAL_ENTRY_URL_FIELD_NAME: Final[str] = 'url'
+_JOURNAL_ENTRY_PAYLOAD_FIELD_NAME: Final[str] = 'payload'
 
 
 _JSON_INDENT: Final[int] = 4
 _JSON_SEPARATORS: Final[tuple[str, str]] = (',', ':')
-_JSON_ENSURE_ASCII: Final[bool] = False
 
-_ESCAPE_ENCODING: Final[str] = 'unicode-escape'
-_ESCAPE_ENCODING_ERROR: Final[str] = _STRING_ENCODE_ERROR_REPLACE
+_JSON_NULL: Final[str] = 'null'
+_JSON_TRUE: Final[str] = 'true'
+_JSON_FALSE: Final[str] = 'false'
+_JSON_NAN: Final[str] = 'NaN'
+_JSON_INFINITY: Final[str] = 'Infinity'
+_JSON_NEGATIVE_INFINITY: Final[str] = '-Infinity'
+_JSON_EMPTY_LIST: Final[str] = '[]'
+_JSON_EMPTY_DICT: Final[str] = '{}'
+_JSON_ITEM_SEPARATOR: Final[str] = ','
+_JSON_PRETTY_KEY_SEPARATOR: Final[str] = ': '
+_JSON_MIN_KEY_SEPARATOR: Final[str] = ':'
+_JSON_NEWLINE: Final[str] = '\n'
+_JSON_INDENT_UNIT: Final[str] = ' ' * _JSON_INDENT
+_JSON_TEXT_ENCODING: Final[str] = 'utf-8'
+
+# orjson indents with two spaces; each run of them is widened to `_JSON_INDENT` through a marker byte.
+_ORJSON_INDENT: Final[bytes] = b'  '
+_ORJSON_INDENT_MARKER: Final[bytes] = b'\x00'
+_ORJSON_WIDE_INDENT: Final[bytes] = b' ' * _JSON_INDENT
+
+# Floats that `repr()` writes in exponent form or as NaN/Infinity (which orjson writes as null) are formatted
+#   differently by orjson, documents holding any of them fall back to the stdlib-compatible encoder.
+_ORJSON_INCOMPATIBLE_FLOAT_CHARS: Final[frozenset[str]] = frozenset('en')
+
+# Literal `\\uXXXX` sequences left in API & database strings, a surrogate pair is decoded as one character.
+#   Lone surrogates and sequences whose backslash is itself escaped are kept as is.
+_ESCAPED_UNICODE_REGEX: Final[re.Pattern] = re.compile(
+    r'(?<!\\)\\u(?:(d[89ab][0-9a-f]{2})\\u(d[c-f][0-9a-f]{2})|([0-9a-f]{4}))', RegexFlag.IGNORECASE)
+_ESCAPED_UNICODE_MARKER: Final[str] = '\\u'
+_ESCAPED_UNICODE_JSON_MARKER: Final[bytes] = b'\\\\u'
+_ESCAPED_UNICODE_HEX_BASE: Final[int] = 16
+_SURROGATE_MIN: Final[int] = 0xD800
+_SURROGATE_MAX: Final[int] = 0xDFFF
+_SURROGATE_LOW_MIN: Final[int] = 0xDC00
+_SURROGATE_PAIR_BASE: Final[int] = 0x10000
+_SURROGATE_PAIR_SHIFT: Final[int] = 10
 
 
 _ARGUMENT_POINTS_SYSTEM_OLD: Final[str] = 'old'
@@ -785,6 +1601,22 @@ _NEW_POINTS_SYSTEM_BOOL: Final[dict[str, bool]] = MappingProxy({
     _ARGUMENT_POINTS_SYSTEM_NEW: True
 })
 
+_ARGUMENT_ENTITY_LAYOUT_FILES: Final[str] = 'files'
+_ARGUMENT_ENTITY_LAYOUT_INDEX: Final[str] = 'index'
+
+_INDEX_ENTITY_LAYOUT_BOOL: Final[dict[str, bool]] = MappingProxy({
+    _ARGUMENT_ENTITY_LAYOUT_FILES: False,
+    _ARGUMENT_ENTITY_LAYOUT_INDEX: True
+})
+
+_ARGUMENT_TRICK_GXDS_SOURCE_LOCAL: Final[str] = 'local'
+_ARGUMENT_TRICK_GXDS_SOURCE_REMOTE: Final[str] = 'remote'
+
+_REMOTE_TRICK_GXDS_SOURCE_BOOL: Final[dict[str, bool]] = MappingProxy({
+    _ARGUMENT_TRICK_GXDS_SOURCE_LOCAL: False,
+    _ARGUMENT_TRICK_GXDS_SOURCE_REMOTE: True
+})
+
 _BOOL_VALUES: Final[tuple[bool, bool]] = (False, True)
 _BOOL_TRUE_NAMES: Final[tuple[str, ...]] = ('y', 'yes', 't', 'true', 'on', '1')
 _BOOL_FALSE_NAMES: Final[tuple[str, ...]] = ('n', 'no', 'f', 'false', 'off', '0')
@@ -792,299 +1624,2998 @@ _BOOL_FALSE_NAMES: Final[tuple[str, ...]] = ('n', 'no', 'f', 'false', 'off', '0'
 _CHOICES_ARGUMENT_POINTS_SYSTEM: Final[tuple[str, ...]] = (_ARGUMENT_POINTS_SYSTEM_OLD, _ARGUMENT_POINTS_SYSTEM_NEW)
 _CHOICES_ARGUMENT_UNIFIED_POINTS_SYSTEM: Final[tuple[str, ...]] = _CHOICES_ARGUMENT_POINTS_SYSTEM
 _CHOICES_ARGUMENT_UNIFIED_TITLE_NAMES: Final[tuple[bool, ...]] = _BOOL_VALUES
+_CHOICES_ARGUMENT_TRICK_GXDS_SOURCE: Final[tuple[str, ...]] = (_ARGUMENT_TRICK_GXDS_SOURCE_LOCAL, _ARGUMENT_TRICK_GXDS_SOURCE_REMOTE)
+_CHOICES_ARGUMENT_ENTITY_LAYOUT: Final[tuple[str, ...]] = (_ARGUMENT_ENTITY_LAYOUT_FILES, _ARGUMENT_ENTITY_LAYOUT_INDEX)
 
 _DEFAULT_ARGUMENT_LICENSE: Final[bool] = False
 _DEFAULT_ARGUMENT_DUMP_TRICK_GXDS_DATA: Final[bool] = False
 _DEFAULT_ARGUMENT_DUMP_TRICK_SURF_DATA: Final[bool] = False
+_DEFAULT_ARGUMENT_DUMP_TRICK_SURF_TIERS_DATA: Final[bool] = False
+_DEFAULT_ARGUMENT_DUMP_TRICK_GXDS_MATCHES_DATA: Final[bool] = False
 _DEFAULT_ARGUMENT_UNIFIED_POINTS_SYSTEM: Final[Optional[str]] = None
+_DEFAULT_ARGUMENT_TRICK_GXDS_SOURCE: Final[str] = _ARGUMENT_TRICK_GXDS_SOURCE_LOCAL
 _DEFAULT_ARGUMENT_UNIFIED_TITLE_NAMES: Final[bool] = _DEFAULT_TRICK_GXDS_TITLE_CASE_NAMES
+_DEFAULT_ARGUMENT_API_BASE_URL: Final[str] = _DEFAULT_TRICK_SURF_API_BASE_URL
+_DEFAULT_ARGUMENT_MAX_CONCURRENCY: Final[int] = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
+_DEFAULT_ARGUMENT_HTTP_POOL_CONNECTIONS: Final[int] = _DEFAULT_HTTP_POOL_CONNECTIONS
+_DEFAULT_ARGUMENT_HTTP_POOL_MAXSIZE: Final[Optional[int]] = None
+_DEFAULT_ARGUMENT_HTTP_TIMEOUT: Final[float] = _DEFAULT_HTTP_TIMEOUT
+_DEFAULT_ARGUMENT_HTTP_MAX_RETRIES: Final[int] = _DEFAULT_HTTP_MAX_RETRIES
+_DEFAULT_ARGUMENT_HTTP_REQUEST_RATE: Final[Optional[float]] = _DEFAULT_HTTP_REQUEST_RATE
+_DEFAULT_ARGUMENT_HTTP_CACHE: Final[bool] = False
+_DEFAULT_ARGUMENT_HTTP_CACHE_SIZE: Final[int] = _DEFAULT_HTTP_CACHE_SIZE
+_DEFAULT_ARGUMENT_RESUME: Final[bool] = False
+_DEFAULT_ARGUMENT_JOURNAL: Final[bool] = True
+_DEFAULT_ARGUMENT_INCREMENTAL: Final[bool] = _DEFAULT_TRICK_SURF_INCREMENTAL
+_DEFAULT_ARGUMENT_FULL_REFRESH_DAYS: Final[int] = _DEFAULT_TRICK_SURF_FULL_REFRESH_DAYS
+_DEFAULT_ARGUMENT_STREAM: Final[bool] = _DEFAULT_TRICK_SURF_STREAM
+_DEFAULT_ARGUMENT_WRITER_THREADS: Final[int] = _DEFAULT_JSON_WRITER_THREADS
+_DEFAULT_ARGUMENT_WRITER_QUEUE_SIZE: Final[int] = _DEFAULT_JSON_WRITER_QUEUE_SIZE
+_DEFAULT_ARGUMENT_WRITER_FSYNC: Final[bool] = _DEFAULT_JSON_WRITER_FSYNC
+_DEFAULT_ARGUMENT_SKIP_UNCHANGED: Final[bool] = _DEFAULT_JSON_WRITER_SKIP_UNCHANGED
+_DEFAULT_ARGUMENT_FORMATS: Final[tuple[str, ...]] = _DEFAULT_DUMP_FORMATS
+_DEFAULT_ARGUMENT_ENTITY_FORMATS: Final[Optional[tuple[str, ...]]] = None
+_DEFAULT_ARGUMENT_SQLITE_PATH: Final[Optional[str]] = None
+_DEFAULT_ARGUMENT_ENTITY_LAYOUT: Final[str] = _ARGUMENT_ENTITY_LAYOUT_FILES
+_DEFAULT_ARGUMENT_REPORT_PATH: Final[str] = _REPORT_PATH
+_DEFAULT_ARGUMENT_REPORT_SUMMARY: Final[bool] = False
+_DEFAULT_ARGUMENT_MEMORY_PROFILE: Final[bool] = False
+_DEFAULT_ARGUMENT_MEMORY_BUDGET: Final[Optional[int]] = None
 
 _CONST_ARGUMENT_LICENSE: Final[bool] = not _DEFAULT_ARGUMENT_LICENSE
 _CONST_ARGUMENT_DUMP_TRICK_GXDS_DATA: Final[bool] = not _DEFAULT_ARGUMENT_DUMP_TRICK_GXDS_DATA
 _CONST_ARGUMENT_DUMP_TRICK_SURF_DATA: Final[bool] = not _DEFAULT_ARGUMENT_DUMP_TRICK_SURF_DATA
+_CONST_ARGUMENT_DUMP_TRICK_SURF_TIERS_DATA: Final[bool] = not _DEFAULT_ARGUMENT_DUMP_TRICK_SURF_TIERS_DATA
+_CONST_ARGUMENT_DUMP_TRICK_GXDS_MATCHES_DATA: Final[bool] = not _DEFAULT_ARGUMENT_DUMP_TRICK_GXDS_MATCHES_DATA
 _CONST_ARGUMENT_UNIFIED_TITLE_NAMES: Final[bool] = not _DEFAULT_ARGUMENT_UNIFIED_TITLE_NAMES
+_CONST_ARGUMENT_HTTP_CACHE: Final[bool] = not _DEFAULT_ARGUMENT_HTTP_CACHE
+_CONST_ARGUMENT_RESUME: Final[bool] = not _DEFAULT_ARGUMENT_RESUME
+_CONST_ARGUMENT_JOURNAL: Final[bool] = not _DEFAULT_ARGUMENT_JOURNAL
+_CONST_ARGUMENT_INCREMENTAL: Final[bool] = not _DEFAULT_ARGUMENT_INCREMENTAL
+_CONST_ARGUMENT_STREAM: Final[bool] = not _DEFAULT_ARGUMENT_STREAM
+_CONST_ARGUMENT_WRITER_FSYNC: Final[bool] = not _DEFAULT_ARGUMENT_WRITER_FSYNC
+_CONST_ARGUMENT_SKIP_UNCHANGED: Final[bool] = not _DEFAULT_ARGUMENT_SKIP_UNCHANGED
+_CONST_ARGUMENT_REPORT_SUMMARY: Final[bool] = not _DEFAULT_ARGUMENT_REPORT_SUMMARY
+_CONST_ARGUMENT_MEMORY_PROFILE: Final[bool] = not _DEFAULT_ARGUMENT_MEMORY_PROFILE
+
+
+# Shared HTTP session, its connection pools are reused by every request of the run.
+_http_session: Optional[Session] = None
+_http_session_lock: Final[threading.Lock] = threading.Lock()
+_http_timeout: float = _DEFAULT_HTTP_TIMEOUT
+
+# Requests are scheduled by an AIMD concurrency limit shared by every host & a token bucket per host,
+# both back off multiplicatively when the server throttles or slows down & recover additively after.
+_scheduler_condition: Final[threading.Condition] = threading.Condition()
+_scheduler_max_limit: int = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
+_scheduler_limit: float = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
+_scheduler_min_limit: float = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
+_scheduler_in_flight: int = 0
+_scheduler_decrease_clock: float = 0.0
+_scheduler_request_rate: Optional[float] = _DEFAULT_HTTP_REQUEST_RATE
+_scheduler_max_retries: int = _DEFAULT_HTTP_MAX_RETRIES
+_scheduler_hosts: Final[dict[str, list[float]]] = {}  # host -> [tokens, refill clock, rate, paused until]
+_scheduler_latencies: Final[dict[str, list[float]]] = {}  # endpoint family -> [short average, long average, count]
+_scheduler_host_starts: Final[dict[str, deque]] = {}
+_scheduler_counts: Final[list[int]] = [0, 0]  # retried, throttled
+
+# Base URL trick surf api requests are sent to instead of the public one, e.g. a local mock server.
+_trick_surf_api_base_url: str = _DEFAULT_TRICK_SURF_API_BASE_URL
+
+# On-disk HTTP cache, disabled unless its directory is configured.
+_http_cache_path: Optional[str] = None
+_http_cache_lock: Final[threading.Lock] = threading.Lock()
+_http_cache_max_size: int = _DEFAULT_HTTP_CACHE_SIZE * _BYTES_PER_MEBIBYTE
+_http_cache_size: int = 0
+
+# Performance report of the run, written once it ends unless its path isn't configured.
+_report_path: Optional[str] = None
+_report_lock: Final[threading.Lock] = threading.Lock()
+_report_print_summary: bool = False
+_report_clock_start: tuple[float, float] = (0.0, 0.0)
+_report_steps: Final[dict[str, dict[str, Any]]] = {}
+_report_phases: Final[dict[str, list[float]]] = {}
+_report_endpoints: Final[dict[str, dict[str, Any]]] = {}
+_report_files: Final[list[int]] = [0, 0, 0]
+
+# Peak memory of every stage, only sampled once profiling is configured.
+_memory_lock: Final[threading.Lock] = threading.Lock()
+_memory_is_profiling: bool = False
+_memory_stage_name: Optional[str] = None
+_memory_stage_peaks: Final[dict[str, list[int]]] = {}
+_memory_sampler_event: Optional[threading.Event] = None
+
+# Fetched payloads are staged on the disk once the memory budget is exceeded, no budget keeps them all in memory.
+_memory_budget: Optional[int] = None
+_staging_path: Optional[str] = None
+_staging_counts: Final[list[int]] = [0, 0]
+_staging_paths: Final[dict[Any, str]] = {}
+
+# Crawl journal of completed endpoint fetches, disabled unless its directory is configured.
+_journal_path: Optional[str] = None
+_journal_lock: Final[threading.Lock] = threading.Lock()
+_journal_file: Optional[TextIO] = None
+_journal_entries: Final[dict[str, str]] = {}
+
+# Write-behind queues of dumped documents, files are written synchronously unless the writer is configured.
+_json_writer_queues: Final[list[Queue]] = []
+_json_writer_lock: Final[threading.Lock] = threading.Lock()
+_json_writer_fsync: bool = _DEFAULT_JSON_WRITER_FSYNC
+_json_writer_error: Optional[Exception] = None
+_json_writer_written_count: int = 0
+_json_writer_skipped_count: int = 0
+
+# SQLite export of the dumped data, every step is a single transaction committed once it succeeded.
+_sqlite_connection: Optional[sqlite3.Connection] = None
+_sqlite_is_new: bool = False
+
+# Formats of collection documents & of per-entity documents, whose file name is the entity's id.
+_dump_formats: tuple[str, ...] = _DEFAULT_DUMP_FORMATS
+_dump_entity_formats: tuple[str, ...] = _DEFAULT_DUMP_FORMATS
+_dump_entity_index: bool = _DEFAULT_DUMP_ENTITY_INDEX
+
+# Parsed entity indexes by collection path, an index is dropped once its collection is dumped again.
+_dump_entity_index_cache: Final[dict[str, Optional[Any]]] = {}
+
+# Digest, size & modification time of every written file, unchanged files are skipped once it is configured.
+_json_manifest_path: Optional[str] = None
+_json_manifest_lock: Final[threading.Lock] = threading.Lock()
+_json_manifest: Final[dict[str, list[Any]]] = {}
+
+
+def _unescape_match(match: re.Match) -> str:
+    high_surrogate, low_surrogate, code_point = match.groups()
+
+    if code_point is None:
+        return chr(_SURROGATE_PAIR_BASE
+                   + ((int(high_surrogate, _ESCAPED_UNICODE_HEX_BASE) - _SURROGATE_MIN) << _SURROGATE_PAIR_SHIFT)
+                   + (int(low_surrogate, _ESCAPED_UNICODE_HEX_BASE) - _SURROGATE_LOW_MIN))
+
+    code: Final[int] = int(code_point, _ESCAPED_UNICODE_HEX_BASE)
+    if _SURROGATE_MIN <= code <= _SURROGATE_MAX:
+        return match.group(0)
+
+    return chr(code)
+
+
+def _unescape(json_object: Optional[Any]) -> Optional[Any]:
+    # Fix unicode escaped characters, lists & dicts are fixed in place.
+    if isinstance(json_object, str):
+        if _ESCAPED_UNICODE_MARKER not in json_object:
+            return json_object
+
+        return _ESCAPED_UNICODE_REGEX.sub(_unescape_match, json_object)
+
+    if isinstance(json_object, list):
+        for i, value in enumerate(json_object):
+            json_object[i] = _unescape(value)
+    elif isinstance(json_object, dict):
+        for key, value in json_object.items():
+            json_object[key] = _unescape(value)
+
+    return json_object
+
 
+def _json_key(key: Any) -> str:
+    if isinstance(key, str):
+        return key
 
-def _unescape(s: Optional[str]) -> Optional[str]:
-    if not s:
-        return s
+    if key is True:
+        return _JSON_TRUE
+
+    if key is False:
+        return _JSON_FALSE
 
-    # Fix unicode escaped characters.
-    return s.encode(_ESCAPE_ENCODING, errors=_ESCAPE_ENCODING_ERROR) \
-        .replace(b'\\\\u', b'\\u') \
-        .decode(_ESCAPE_ENCODING, errors=_ESCAPE_ENCODING_ERROR)
+    if key is None:
+        return _JSON_NULL
 
+    if isinstance(key, float):
+        return _json_float(key)
 
-def _get_url_response(url: Optional[str]) -> Optional[Response]:
-    if not url:
-        return None
+    if isinstance(key, int):
+        return int.__repr__(key)
 
-    response: Final[Response] = requests.get(url)
-    response.raise_for_status()
+    raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
 
-    if response.status_code == 204:
-        return None
 
-    return response
+def _json_float(value: float) -> str:
+    if value != value:
+        return _JSON_NAN
 
+    if value == float('inf'):
+        return _JSON_INFINITY
 
-def _get_url_text(url: Optional[str]) -> Optional[str]:
-    response: Final[Response] = _get_url_response(url)
-    if response is None:
-        return None
+    if value == -float('inf'):
+        return _JSON_NEGATIVE_INFINITY
 
-    return response.text
+    return float.__repr__(value)
 
 
-def _get_url_json(url: Optional[str]) -> Optional[Any]:
-    response: Final[Response] = _get_url_response(url)
-    if response is None:
-        return None
+def _json_dumps_traverse(json_object: Any) -> tuple[str, str]:
+    pretty_chunks: Final[list[str]] = []
+    min_chunks: Final[list[str]] = []
 
-    return response.json()
+    pretty_append: Final[Callable[[str], None]] = pretty_chunks.append
+    min_append: Final[Callable[[str], None]] = min_chunks.append
 
+    encode_string: Final[Callable[[str], str]] = json.encoder.encode_basestring
 
-def _str_to_bool(
-    val: Optional[Any],
-) -> bool:
-    if val is None:
-        return False
+    def traverse(o: Any, depth: int) -> None:
+        if isinstance(o, str):
+            chunk = encode_string(o)
+        elif o is None:
+            chunk = _JSON_NULL
+        elif o is True:
+            chunk = _JSON_TRUE
+        elif o is False:
+            chunk = _JSON_FALSE
+        elif isinstance(o, int):
+            chunk = int.__repr__(o)
+        elif isinstance(o, float):
+            chunk = _json_float(o)
+        elif isinstance(o, (list, tuple)):
+            if not o:
+                pretty_append(_JSON_EMPTY_LIST)
+                min_append(_JSON_EMPTY_LIST)
+                return
 
-    if isinstance(val, bool):
-        return val
+            indent = _JSON_NEWLINE + _JSON_INDENT_UNIT * (depth + 1)
+            separator = _JSON_ITEM_SEPARATOR + indent
 
-    lower_val = str(val) \
-        .lower()
+            pretty_append('[' + indent)
+            min_append('[')
 
-    if lower_val in _BOOL_TRUE_NAMES:
-        return True
+            for i, value in enumerate(o):
+                if i:
+                    pretty_append(separator)
+                    min_append(_JSON_ITEM_SEPARATOR)
 
-    if lower_val in _BOOL_FALSE_NAMES:
-        return False
+                traverse(value, depth + 1)
 
-    raise ValueError(f'Couldn\'t convert "{val}" to a boolean value')
+            pretty_append(_JSON_NEWLINE + _JSON_INDENT_UNIT * depth + ']')
+            min_append(']')
+            return
+        elif isinstance(o, dict):
+            if not o:
+                pretty_append(_JSON_EMPTY_DICT)
+                min_append(_JSON_EMPTY_DICT)
+                return
 
+            indent = _JSON_NEWLINE + _JSON_INDENT_UNIT * (depth + 1)
+            separator = _JSON_ITEM_SEPARATOR + indent
 
-def _str_to_title(
-    val: Optional[Any]
-) -> Optional[str]:
-    if val is None:
-        return None
+            pretty_append('{' + indent)
+            min_append('{')
 
-    val = str(val)
+            for i, (key, value) in enumerate(o.items()):
+                key = encode_string(_json_key(key))
 
-    words: Final[list[str]] = re.split(_REGEX_WHITESPACE_CHARS, val, flags=_REGEX_MULTILINE_FLAG)
-    if not words:
-        return None
+                if i:
+                    pretty_append(separator)
+                    min_append(_JSON_ITEM_SEPARATOR)
 
-    words_count: Final[int] = len(words)
-    for i in range(words_count):
-        word: str = words[i]
-        if not word:
-            continue
+                pretty_append(key + _JSON_PRETTY_KEY_SEPARATOR)
+                min_append(key + _JSON_MIN_KEY_SEPARATOR)
 
-        word_len: int = len(word)
+                traverse(value, depth + 1)
 
-        word = word[0]
-        if word_len <= 2 \
-                or (not words[i][1].isdigit() and not words[i][1].isupper()):
-            word = word.upper()
+            pretty_append(_JSON_NEWLINE + _JSON_INDENT_UNIT * depth + '}')
+            min_append('}')
+            return
+        else:
+            raise TypeError(f'Object of type {o.__class__.__name__} is not JSON serializable')
 
-        if word_len > 1:
-            word += words[i][1:]
+        pretty_append(chunk)
+        min_append(chunk)
 
-        words[i] = word
+    traverse(json_object, 0)
 
-    return ' '.join(words)
+    return ''.join(pretty_chunks), ''.join(min_chunks)
 
 
-def _table_to_json(
-    table_rows: Optional[list[tuple[Any, ...]]],
-    table_column_names: Optional[dict[int, str]],
-    table_column_types: Optional[dict[int, Callable[[Any], Any]]]
-) -> Optional[Any]:
-    if not table_rows \
-            or not table_column_names \
-            or not table_column_types:
-        return None
+def _json_widen_orjson_indent(data: bytes) -> bytes:
+    data = data.replace(b'\n' + _ORJSON_INDENT, b'\n' + _ORJSON_INDENT_MARKER)
 
-    table_json: Optional[list[dict[str, Any]]] = []
-    for table_row in table_rows:
-        row_json: dict[str, Any] = {}
-        for column_id, column_name in table_column_names.items():
-            column_value: Optional[Any] = str(table_row[column_id]) \
-                .strip()
-
-            if column_value:
-                column_type: Callable[[Any], Any] = table_column_types[column_id]
-                column_value = column_type(column_value)
-            else:
-                column_value = None
+    while True:
+        widened = data.replace(_ORJSON_INDENT_MARKER + _ORJSON_INDENT, _ORJSON_INDENT_MARKER * 2)
+        if len(widened) == len(data):
+            break
 
-            row_json[column_name] = column_value
+        data = widened
 
-        if not row_json:
-            continue
+    return data.replace(_ORJSON_INDENT_MARKER, _ORJSON_WIDE_INDENT)
 
-        table_json.append(row_json)
 
-    if not table_json:
-        return None
+def _json_has_orjson_incompatible_float(json_object: Any) -> bool:
+    pending: Final[list[Any]] = [json_object]
+    while pending:
+        o = pending.pop()
 
-    return table_json
+        if isinstance(o, float):
+            if not _ORJSON_INCOMPATIBLE_FLOAT_CHARS.isdisjoint(float.__repr__(o)):
+                return True
+        elif isinstance(o, dict):
+            pending.extend(o.values())
+        elif isinstance(o, (list, tuple)):
+            pending.extend(o)
 
+    return False
 
-def _dump_json(
-    file_path: Optional[str],
-    file_name: Optional[str],
-    json_object: Optional[Any]
-) -> bool:
-    if file_path is None \
-            or not json_object:
-        return False
 
-    file_path = os.path.normpath(file_path)
+def _json_dumps_orjson(json_object: Any) -> Optional[tuple[str, str]]:
+    if orjson is None:
+        return None
 
-    if not file_name:
-        if not file_path:
-            return False
+    if _json_has_orjson_incompatible_float(json_object):
+        return None
 
-        file_base_name: Final[str] = os.path.basename(file_path)
-        file_split_ext: Final[tuple[str, str]] = os.path.splitext(file_base_name)
+    try:
+        min_data = orjson.dumps(json_object)
+    except TypeError:
+        return None
 
-        file_path = os.path.dirname(file_path)
-        file_name = file_split_ext[0]
+    pretty_data = _json_widen_orjson_indent(orjson.dumps(json_object, option=orjson.OPT_INDENT_2))
 
-    if file_path \
-            and not os.path.exists(file_path):
-        os.makedirs(file_path)
+    return pretty_data.decode(_JSON_TEXT_ENCODING), min_data.decode(_JSON_TEXT_ENCODING)
 
-    dump_path: Final[str] = os.path.join(file_path, file_name)
 
-    with open(dump_path + _DUMP_JSON_FILE_EXT, _OPEN_FILE_WRITE_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
-        file.write(_unescape(json.dumps(json_object, ensure_ascii=_JSON_ENSURE_ASCII, indent=_JSON_INDENT)))
+def _json_dumps(json_object: Any) -> tuple[str, str]:
+    dumped: Final[Optional[tuple[str, str]]] = _json_dumps_orjson(json_object)
+    if dumped is not None:
+        return dumped
 
-    with open(dump_path + _DUMP_JSON_FILE_MIN_EXT, _OPEN_FILE_WRITE_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
-        file.write(_unescape(json.dumps(json_object, ensure_ascii=_JSON_ENSURE_ASCII, separators=_JSON_SEPARATORS)))
+    return _json_dumps_traverse(json_object)
 
-    return True
 
+def _json_dumps_pretty(json_object: Any) -> str:
+    if orjson is not None \
+            and not _json_has_orjson_incompatible_float(json_object):
+        try:
+            pretty_data = orjson.dumps(json_object, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            return _json_widen_orjson_indent(pretty_data).decode(_JSON_TEXT_ENCODING)
 
-def _trick_surf_find_tier(
-    trick_points_limits: Optional[Union[list[int], tuple[int, ...]]],
-    trick_points: Optional[int]
-) -> Optional[int]:
-    if not trick_points_limits \
-            or trick_points is None:
-        return None
+    return _json_dumps_traverse(json_object)[0]
 
-    trick_tier: int = len(trick_points_limits)
-    for points_limit in trick_points_limits:
-        if trick_points >= points_limit:
-            return trick_tier
 
-        trick_tier -= 1
+def _json_dumps_min(json_object: Any) -> str:
+    if orjson is not None \
+            and not _json_has_orjson_incompatible_float(json_object):
+        try:
+            return orjson.dumps(json_object).decode(_JSON_TEXT_ENCODING)
+        except TypeError:
+            pass
 
-    if trick_tier > 0:
-        return trick_tier
+    return _json_dumps_traverse(json_object)[1]
 
-    return None
 
+def _http_configure(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    timeout: Optional[float] = None
+) -> Session:
+    global _http_session, _http_timeout
 
-def _trick_gxds_find_author(
-    player_table_rows: Optional[list[tuple[Any, ...]]],
-    player_id: Optional[int],
-    sift_entries: Optional[bool] = None
-) -> Optional[dict[str, Any]]:
-    if not player_table_rows \
-            or player_id is None:
-        return None
+    if pool_connections is None:
+        pool_connections = _DEFAULT_HTTP_POOL_CONNECTIONS
 
-    if sift_entries is None:
-        sift_entries = _DEFAULT_TRICK_GXDS_SIFT_ENTRIES
+    if pool_maxsize is None:
+        pool_maxsize = _DEFAULT_HTTP_POOL_MAXSIZE
 
-    for player_row in player_table_rows:
-        if player_row[_TRICK_GXDS_PLAYER_TABLE_ID_COLUMN_INDEX] == player_id:
-            player_name: str = player_row[_TRICK_GXDS_PLAYER_TABLE_NAME_COLUMN_INDEX]
-            player_id64: str = player_row[_TRICK_GXDS_PLAYER_TABLE_STEAM_ID64_COLUMN_INDEX]
+    if timeout is None:
+        timeout = _DEFAULT_HTTP_TIMEOUT
 
-            if sift_entries:
-                player_name = _TRICK_GXDS_PLAYER_NAMES.get(player_name, player_name)
-                player_id64 = _TRICK_GXDS_PLAYER_ID64S.get(player_id64, player_id64)
+    # Blocking pools cap the number of connections opened to a single host,
+    # extra requests wait for a free keep-alive connection instead of opening a new one.
+    adapter: Final[HTTPAdapter] = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=True
+    )
 
-            return {
-                'PlayerName': player_name,
-                'ProfileURL': f'https://steamcommunity.com/profiles/{player_id64}'
-            }
+    session: Final[Session] = requests.Session()
+    for url_scheme in _HTTP_URL_SCHEMES:
+        session.mount(url_scheme, adapter)
 
-    return None
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
 
+        _http_session = session
+        _http_timeout = timeout
 
-def _trick_gxds_find_route(
-    route_table_rows: Optional[list[tuple[Any, ...]]],
-    trigger_table_rows: Optional[list[tuple[Any, ...]]],
-    trick_id: Optional[int],
-    sift_entries: Optional[bool] = None
-) -> Optional[list[str]]:
-    if not route_table_rows \
-            or not trigger_table_rows \
-            or trick_id is None:
-        return None
+    return session
 
-    trigger_ids: list[int] = []
-    for route_row in route_table_rows:
-        if route_row[_TRICK_GXDS_ROUTE_TABLE_TRICK_ID_COLUMN_INDEX] != trick_id:
-            continue
 
-        trigger_ids.append(route_row[_TRICK_GXDS_ROUTE_TABLE_TRIGGER_ID_COLUMN_INDEX])
+def _get_http_session() -> Session:
+    with _http_session_lock:
+        session: Optional[Session] = _http_session
 
-    if not trigger_ids:
-        return None
+    if session is None:
+        session = _http_configure()
 
-    if sift_entries is None:
-        sift_entries = _DEFAULT_TRICK_GXDS_SIFT_ENTRIES
+    return session
 
-    trigger_names: list[str] = []
-    for trigger_id in trigger_ids:
-        trigger_name: Optional[str] = None
 
-        for trigger_row in trigger_table_rows:
-            if trigger_row[_TRICK_GXDS_TRIGGER_TABLE_ID_COLUMN_INDEX] == trigger_id:
-                trigger_name = trigger_row[_TRICK_GXDS_TRIGGER_TABLE_NAME_COLUMN_INDEX]
-                if sift_entries:
-                    trigger_name = _TRICK_GXDS_TRIGGER_NAMES.get(trigger_name)
+def _trick_surf_api_configure(base_url: Optional[str] = None) -> None:
+    global _trick_surf_api_base_url
 
-                break
+    if base_url is None:
+        base_url = _DEFAULT_TRICK_SURF_API_BASE_URL
 
-        if not trigger_name:
-            return None
+    if not base_url.endswith(_TRICK_SURF_API_URL_PATH_SEPARATOR):
+        base_url += _TRICK_SURF_API_URL_PATH_SEPARATOR
 
-        trigger_names.append(trigger_name)
+    _trick_surf_api_base_url = base_url
 
-    if not trigger_names:
-        return None
 
-    return trigger_names
+def _trick_surf_api_url(url: str) -> str:
+    if _trick_surf_api_base_url == _TRICK_SURF_API_BASE_URL \
+            or not url.startswith(_TRICK_SURF_API_BASE_URL):
+        return url
 
+    return _trick_surf_api_base_url + url[len(_TRICK_SURF_API_BASE_URL):]
 
-def _trick_gxds_merge_data(
-    player_table_rows: Optional[list[tuple[Any, ...]]],
-    route_table_rows: Optional[list[tuple[Any, ...]]],
-    trick_table_rows: Optional[list[tuple[Any, ...]]],
-    trigger_table_rows: Optional[list[tuple[Any, ...]]],
-    use_new_points_system: Optional[bool] = None,
-    title_case_trick_names: Optional[bool] = None,
-    sift_entries: Optional[bool] = None,
-) -> Optional[Any]:
-    if not player_table_rows \
-            or not route_table_rows \
-            or not trick_table_rows \
-            or not trigger_table_rows:
-        return None
+
+def _report_configure(
+    report_path: Optional[str],
+    print_summary: Optional[bool] = None
+) -> None:
+    global _report_path, _report_print_summary, _report_clock_start
+
+    if print_summary is None:
+        print_summary = _DEFAULT_ARGUMENT_REPORT_SUMMARY
+
+    with _report_lock:
+        _report_path = os.path.normpath(report_path) if report_path else None
+        _report_print_summary = print_summary
+        _report_clock_start = _report_process_clock()
+
+        _report_steps.clear()
+        _report_phases.clear()
+        _report_endpoints.clear()
+        _report_files[:] = [0, 0, 0]
+
+
+def _report_clock() -> tuple[float, float]:
+    return time.perf_counter(), time.thread_time()
+
+
+def _report_process_clock() -> tuple[float, float]:
+    return time.perf_counter(), time.process_time()
+
+
+def _report_phase(
+    phase_name: str,
+    clock_start: tuple[float, float],
+    count: int = 1
+) -> None:
+    wall_time, cpu_time = _report_clock()
+
+    with _report_lock:
+        phase: Optional[list[float]] = _report_phases.get(phase_name)
+        if phase is None:
+            phase = _report_phases[phase_name] = [0.0, 0.0, 0]
+
+        phase[0] += wall_time - clock_start[0]
+        phase[1] += cpu_time - clock_start[1]
+        phase[2] += count
+
+
+def _report_step(
+    step_name: str,
+    clock_start: tuple[float, float],
+    is_success: Optional[bool]
+) -> None:
+    wall_time, cpu_time = _report_process_clock()
+
+    with _report_lock:
+        _report_steps[step_name] = {
+            _REPORT_WALL_SECONDS_FIELD_NAME: wall_time - clock_start[0],
+            _REPORT_CPU_SECONDS_FIELD_NAME: cpu_time - clock_start[1],
+            _REPORT_SUCCESS_FIELD_NAME: is_success
+        }
+
+
+def _report_endpoint_family(url: str) -> str:
+    # Endpoints are grouped by their last path segment that isn't an id, e.g. `tricks` of `/games/1/maps/2/tricks`.
+    url_parts: Final[Any] = urlsplit(url)
+
+    for path_segment in reversed(url_parts.path.split(_REPORT_URL_PATH_SEPARATOR)):
+        if path_segment \
+                and not path_segment.isdigit():
+            return path_segment
+
+    return url_parts.netloc
+
+
+def _report_request(
+    url: str,
+    clock_start: tuple[float, float],
+    status: Union[int, str],
+    size: int
+) -> None:
+    latency: Final[float] = _report_clock()[0] - clock_start[0]
+    _report_phase(_REPORT_PHASE_FETCH, clock_start)
+
+    family: Final[str] = _report_endpoint_family(url)
+    bucket: Final[int] = bisect_left(_REPORT_LATENCY_BUCKETS, latency)
+
+    with _report_lock:
+        endpoint: Optional[dict[str, Any]] = _report_endpoints.get(family)
+        if endpoint is None:
+            endpoint = _report_endpoints[family] = {
+                _REPORT_REQUESTS_FIELD_NAME: 0,
+                _REPORT_BYTES_FIELD_NAME: 0,
+                _REPORT_LATENCY_SECONDS_FIELD_NAME: 0.0,
+                _REPORT_MAX_LATENCY_SECONDS_FIELD_NAME: 0.0,
+                _REPORT_LATENCY_HISTOGRAM_FIELD_NAME: [0] * (len(_REPORT_LATENCY_BUCKETS) + 1),
+                _REPORT_STATUSES_FIELD_NAME: {}
+            }
+
+        endpoint[_REPORT_REQUESTS_FIELD_NAME] += 1
+        endpoint[_REPORT_BYTES_FIELD_NAME] += size
+        endpoint[_REPORT_LATENCY_SECONDS_FIELD_NAME] += latency
+        endpoint[_REPORT_MAX_LATENCY_SECONDS_FIELD_NAME] = max(endpoint[_REPORT_MAX_LATENCY_SECONDS_FIELD_NAME], latency)
+        endpoint[_REPORT_LATENCY_HISTOGRAM_FIELD_NAME][bucket] += 1
+
+        statuses: dict[str, int] = endpoint[_REPORT_STATUSES_FIELD_NAME]
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+
+def _report_file(
+    size: Optional[int] = None
+) -> None:
+    with _report_lock:
+        if size is None:
+            _report_files[2] += 1
+            return
+
+        _report_files[0] += 1
+        _report_files[1] += size
+
+
+def _report_json() -> dict[str, Any]:
+    wall_time, cpu_time = _report_process_clock()
+
+    bucket_names: Final[list[str]] = [str(bucket) for bucket in _REPORT_LATENCY_BUCKETS] \
+        + [_REPORT_LATENCY_BUCKET_UNBOUNDED_NAME]
+
+    with _report_lock:
+        return {
+            _REPORT_TIMESTAMP_FIELD_NAME: datetime.now().astimezone().isoformat(),
+            _REPORT_WALL_SECONDS_FIELD_NAME: wall_time - _report_clock_start[0],
+            _REPORT_CPU_SECONDS_FIELD_NAME: cpu_time - _report_clock_start[1],
+            _REPORT_STEPS_FIELD_NAME: dict(_report_steps),
+            _REPORT_PHASES_FIELD_NAME: {
+                phase_name: {
+                    _REPORT_WALL_SECONDS_FIELD_NAME: _report_phases[phase_name][0],
+                    _REPORT_CPU_SECONDS_FIELD_NAME: _report_phases[phase_name][1],
+                    _REPORT_COUNT_FIELD_NAME: int(_report_phases[phase_name][2])
+                }
+                for phase_name in _REPORT_PHASES
+                if phase_name in _report_phases
+            },
+            _REPORT_ENDPOINTS_FIELD_NAME: {
+                family: {
+                    **endpoint,
+                    _REPORT_LATENCY_HISTOGRAM_FIELD_NAME: dict(zip(bucket_names, endpoint[_REPORT_LATENCY_HISTOGRAM_FIELD_NAME])),
+                    _REPORT_STATUSES_FIELD_NAME: dict(sorted(endpoint[_REPORT_STATUSES_FIELD_NAME].items()))
+                }
+                for family, endpoint in sorted(_report_endpoints.items())
+            },
+            _REPORT_FILES_FIELD_NAME: {
+                _REPORT_WRITTEN_FIELD_NAME: _report_files[0],
+                _REPORT_BYTES_FIELD_NAME: _report_files[1],
+                _REPORT_SKIPPED_FIELD_NAME: _report_files[2]
+            },
+            _REPORT_MEMORY_FIELD_NAME: _memory_json(),
+            _REPORT_SCHEDULER_FIELD_NAME: _scheduler_json()
+        }
+
+
+def _report_print(report_json: dict[str, Any]) -> None:
+    lines: Final[list[str]] = [_REPORT_SUMMARY_STEP_HEADER]
+    for step_name, step in report_json[_REPORT_STEPS_FIELD_NAME].items():
+        lines.append(_REPORT_SUMMARY_STEP_ROW_FMT % (
+            step_name,
+            step[_REPORT_WALL_SECONDS_FIELD_NAME],
+            step[_REPORT_CPU_SECONDS_FIELD_NAME],
+            _REPORT_SUMMARY_SUCCESS_NAMES[step[_REPORT_SUCCESS_FIELD_NAME]]
+        ))
+
+    lines.append(_REPORT_SUMMARY_PHASE_HEADER)
+    for phase_name, phase in report_json[_REPORT_PHASES_FIELD_NAME].items():
+        lines.append(_REPORT_SUMMARY_PHASE_ROW_FMT % (
+            phase_name,
+            phase[_REPORT_WALL_SECONDS_FIELD_NAME],
+            phase[_REPORT_CPU_SECONDS_FIELD_NAME],
+            phase[_REPORT_COUNT_FIELD_NAME]
+        ))
+
+    lines.append(_REPORT_SUMMARY_ENDPOINT_HEADER)
+    for family, endpoint in report_json[_REPORT_ENDPOINTS_FIELD_NAME].items():
+        request_count: int = endpoint[_REPORT_REQUESTS_FIELD_NAME]
+
+        lines.append(_REPORT_SUMMARY_ENDPOINT_ROW_FMT % (
+            family,
+            request_count,
+            endpoint[_REPORT_BYTES_FIELD_NAME] / _BYTES_PER_MEBIBYTE,
+            endpoint[_REPORT_LATENCY_SECONDS_FIELD_NAME] / request_count * _MILLISECONDS_PER_SECOND,
+            endpoint[_REPORT_MAX_LATENCY_SECONDS_FIELD_NAME] * _MILLISECONDS_PER_SECOND,
+            _REPORT_SUMMARY_STATUS_SEPARATOR.join(
+                _REPORT_SUMMARY_STATUS_FMT % status_count
+                for status_count in endpoint[_REPORT_STATUSES_FIELD_NAME].items()
+            )
+        ))
+
+    files: Final[dict[str, int]] = report_json[_REPORT_FILES_FIELD_NAME]
+    lines.append(_REPORT_SUMMARY_FILES_FMT % (
+        files[_REPORT_WRITTEN_FIELD_NAME],
+        files[_REPORT_BYTES_FIELD_NAME] / _BYTES_PER_MEBIBYTE,
+        files[_REPORT_SKIPPED_FIELD_NAME]
+    ))
+
+    scheduler: Final[dict[str, Any]] = report_json[_REPORT_SCHEDULER_FIELD_NAME]
+    lines.append(_REPORT_SUMMARY_SCHEDULER_FMT % (
+        scheduler[_REPORT_RETRIES_FIELD_NAME],
+        scheduler[_REPORT_THROTTLED_FIELD_NAME],
+        scheduler[_REPORT_CONCURRENCY_LIMIT_FIELD_NAME],
+        scheduler[_REPORT_MIN_CONCURRENCY_LIMIT_FIELD_NAME]
+    ))
+
+    memory: Final[dict[str, Any]] = report_json[_REPORT_MEMORY_FIELD_NAME]
+    if memory[_REPORT_STAGES_FIELD_NAME]:
+        lines.append(_REPORT_SUMMARY_MEMORY_HEADER)
+        for stage_name, stage in memory[_REPORT_STAGES_FIELD_NAME].items():
+            lines.append(_REPORT_SUMMARY_MEMORY_ROW_FMT % (
+                stage_name,
+                stage[_REPORT_RSS_PEAK_BYTES_FIELD_NAME] / _BYTES_PER_MEBIBYTE,
+                stage[_REPORT_TRACEMALLOC_PEAK_BYTES_FIELD_NAME] / _BYTES_PER_MEBIBYTE
+            ))
+
+    if memory[_REPORT_BUDGET_BYTES_FIELD_NAME] is not None:
+        staged: dict[str, int] = memory[_REPORT_STAGED_FIELD_NAME]
+        lines.append(_REPORT_SUMMARY_STAGED_FMT % (
+            staged[_REPORT_COUNT_FIELD_NAME],
+            staged[_REPORT_BYTES_FIELD_NAME] / _BYTES_PER_MEBIBYTE,
+            memory[_REPORT_BUDGET_BYTES_FIELD_NAME] / _BYTES_PER_MEBIBYTE
+        ))
+
+    print('\n'.join(lines), file=_STD_OUT_STREAM)
+
+
+def _report_store() -> None:
+    if not _report_path:
+        return
+
+    report_json: Final[dict[str, Any]] = _report_json()
+    if not report_json[_REPORT_STEPS_FIELD_NAME]:
+        return
+
+    report_directory_path: Final[str] = os.path.dirname(_report_path)
+    if report_directory_path:
+        os.makedirs(report_directory_path, exist_ok=True)
+
+    with open(_report_path, _OPEN_FILE_WRITE_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
+        json.dump(report_json, file, indent=_JSON_INDENT)
+
+    if _report_print_summary:
+        _report_print(report_json)
+
+    print(_INFO_MESSAGE_WRITTEN_REPORT_FMT % _report_path, file=_STD_OUT_STREAM)
+
+
+def _memory_configure(
+    is_profiling: Optional[bool] = None,
+    budget: Optional[int] = None,
+    staging_path: Optional[str] = None
+) -> None:
+    global _memory_is_profiling, _memory_sampler_event, _memory_budget, _staging_path
+
+    if is_profiling is None:
+        is_profiling = _DEFAULT_ARGUMENT_MEMORY_PROFILE
+
+    _memory_close()
+
+    with _memory_lock:
+        _memory_is_profiling = is_profiling
+        _memory_stage_peaks.clear()
+
+    _memory_budget = budget * _BYTES_PER_MEBIBYTE if budget is not None else None
+    _staging_path = staging_path if budget is not None else None
+    _staging_counts[:] = [0, 0]
+    _staging_clear()
+
+    if not is_profiling:
+        return
+
+    # Python's own allocations are traced for the heap peak, the RSS of the whole process is sampled next to it.
+    tracemalloc.start()
+
+    _memory_sampler_event = threading.Event()
+    threading.Thread(target=_memory_sampler_work, args=(_memory_sampler_event,), daemon=True).start()
+
+
+def _memory_close() -> None:
+    global _memory_sampler_event
+
+    _memory_stage(None)
+
+    if _memory_sampler_event is not None:
+        _memory_sampler_event.set()
+        _memory_sampler_event = None
+
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def _memory_rss() -> int:
+    # The current RSS is read on Linux, elsewhere the process' peak RSS is the closest there is.
+    try:
+        with open(_MEMORY_PROC_STATM_PATH, _OPEN_FILE_READ_FLAG) as file:
+            return int(file.read().split()[1]) * _MEMORY_PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        return 0
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MEMORY_MAXRSS_UNIT
+
+
+def _memory_sample() -> None:
+    rss: Final[int] = _memory_rss()
+
+    with _memory_lock:
+        if _memory_stage_name is None:
+            return
+
+        stage_peaks: list[int] = _memory_stage_peaks.setdefault(_memory_stage_name, [0, 0])
+        stage_peaks[0] = max(stage_peaks[0], rss)
+
+
+def _memory_sampler_work(event: threading.Event) -> None:
+    while not event.wait(_MEMORY_SAMPLE_INTERVAL):
+        _memory_sample()
+
+
+def _memory_stage(stage_name: Optional[str]) -> None:
+    global _memory_stage_name
+
+    if not _memory_is_profiling:
+        return
+
+    # The heap peak is reset at every switch, so each stage only accounts for what it allocated on top of the others.
+    _memory_sample()
+    heap_peak: Final[int] = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+
+    with _memory_lock:
+        if _memory_stage_name is not None:
+            stage_peaks: list[int] = _memory_stage_peaks.setdefault(_memory_stage_name, [0, 0])
+            stage_peaks[1] = max(stage_peaks[1], heap_peak)
+
+        _memory_stage_name = stage_name
+
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+
+    _memory_sample()
+
+
+def _memory_json() -> dict[str, Any]:
+    with _memory_lock:
+        return {
+            _REPORT_STAGES_FIELD_NAME: {
+                stage_name: {
+                    _REPORT_RSS_PEAK_BYTES_FIELD_NAME: stage_peaks[0],
+                    _REPORT_TRACEMALLOC_PEAK_BYTES_FIELD_NAME: stage_peaks[1]
+                }
+                for stage_name, stage_peaks in _memory_stage_peaks.items()
+            },
+            _REPORT_BUDGET_BYTES_FIELD_NAME: _memory_budget,
+            _REPORT_STAGED_FIELD_NAME: {
+                _REPORT_COUNT_FIELD_NAME: _staging_counts[0],
+                _REPORT_BYTES_FIELD_NAME: _staging_counts[1]
+            }
+        }
+
+
+def _memory_is_over_budget() -> bool:
+    return _memory_budget is not None \
+        and _memory_rss() > _memory_budget
+
+
+def _staging_clear() -> None:
+    _staging_paths.clear()
+
+    if _staging_path:
+        shutil.rmtree(_staging_path, ignore_errors=True)
+
+
+def _staging_store(json_object: Any) -> str:
+    os.makedirs(_staging_path, exist_ok=True)
+
+    staged_bytes: Final[bytes] = json.dumps(json_object, ensure_ascii=False, separators=_JSON_SEPARATORS) \
+        .encode(_DUMP_JSON_FILE_ENCODING)
+
+    staged_file_path: Final[str] = os.path.join(_staging_path, str(_staging_counts[0]) + _STAGING_FILE_EXT)
+    with open(staged_file_path, _OPEN_FILE_WRITE_BINARY_FLAG) as file:
+        file.write(staged_bytes)
+
+    _staging_counts[0] += 1
+    _staging_counts[1] += len(staged_bytes)
+
+    return staged_file_path
+
+
+def _staging_hold(
+    held_jsons: dict[Any, Any],
+    key: Any,
+    json_object: Optional[Any]
+) -> None:
+    # Payloads are held in memory until the budget is exceeded, every held payload is staged on the disk from then on.
+    # A staged payload leaves the held ones, only its file's path is kept by its key.
+    staged_file_path: Final[Optional[str]] = _staging_paths.pop(key, None)
+    if staged_file_path is not None:
+        os.remove(staged_file_path)
+
+    if json_object is None \
+            or not _memory_is_over_budget():
+        held_jsons[key] = json_object
+        return
+
+    held_jsons.pop(key, None)
+    for held_key in [held_key for held_key, held_json in held_jsons.items() if held_json is not None]:
+        _staging_paths[held_key] = _staging_store(held_jsons.pop(held_key))
+
+    _staging_paths[key] = _staging_store(json_object)
+
+
+def _staging_release(
+    held_jsons: dict[Any, Any],
+    key: Any
+) -> Optional[Any]:
+    staged_file_path: Final[Optional[str]] = _staging_paths.pop(key, None)
+    if staged_file_path is None:
+        return held_jsons.pop(key)
+
+    with open(staged_file_path, _OPEN_FILE_READ_BINARY_FLAG) as file:
+        json_object: Final[Any] = json.load(file)
+
+    os.remove(staged_file_path)
+    return json_object
+
+
+def _http_cache_configure(
+    cache_path: Optional[str],
+    max_size: Optional[int] = None
+) -> None:
+    global _http_cache_path, _http_cache_max_size, _http_cache_size
+
+    if max_size is None:
+        max_size = _DEFAULT_HTTP_CACHE_SIZE
+
+    cache_size: int = 0
+    if cache_path:
+        os.makedirs(cache_path, exist_ok=True)
+
+        for entry in os.scandir(cache_path):
+            if entry.name.endswith(_HTTP_CACHE_BODY_FILE_EXT):
+                cache_size += entry.stat().st_size
+
+    with _http_cache_lock:
+        _http_cache_path = cache_path or None
+        _http_cache_max_size = max_size * _BYTES_PER_MEBIBYTE
+        _http_cache_size = cache_size
+
+    _http_cache_evict()
+
+
+def _http_cache_entry_path(
+    cache_path: str,
+    url: str
+) -> str:
+    return os.path.join(cache_path, hashlib.sha256(url.encode(_DEFAULT_HTTP_TEXT_ENCODING)).hexdigest())
+
+
+def _http_cache_load_meta(url: str) -> Optional[dict[str, Any]]:
+    cache_path: Final[Optional[str]] = _http_cache_path
+    if not cache_path:
+        return None
+
+    entry_path: Final[str] = _http_cache_entry_path(cache_path, url)
+    try:
+        with open(entry_path + _HTTP_CACHE_META_FILE_EXT, _OPEN_FILE_READ_FLAG, encoding=_DEFAULT_HTTP_TEXT_ENCODING) as file:
+            meta: Final[Any] = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(meta, dict) \
+            or meta.get(_HTTP_CACHE_META_URL_FIELD_NAME) != url:
+        return None
+
+    return meta
+
+
+def _http_cache_load_body(url: str) -> Optional[bytes]:
+    cache_path: Final[Optional[str]] = _http_cache_path
+    if not cache_path:
+        return None
+
+    body_path: Final[str] = _http_cache_entry_path(cache_path, url) + _HTTP_CACHE_BODY_FILE_EXT
+    try:
+        with open(body_path, _OPEN_FILE_READ_BINARY_FLAG) as file:
+            body: Final[bytes] = file.read()
+
+        # Bump the access time, the least recently used entries are evicted first.
+        os.utime(body_path)
+    except OSError:
+        return None
+
+    return body
+
+
+def _http_cache_store(
+    url: str,
+    response: Response,
+    body: bytes
+) -> None:
+    global _http_cache_size
+
+    cache_path: Final[Optional[str]] = _http_cache_path
+    if not cache_path:
+        return
+
+    etag: Final[Optional[str]] = response.headers.get(_HTTP_HEADER_ETAG)
+    last_modified: Final[Optional[str]] = response.headers.get(_HTTP_HEADER_LAST_MODIFIED)
+
+    # W/o validators the entry could never be revalidated, so there's no point in keeping it.
+    if not etag and not last_modified:
+        return
+
+    body_size: Final[int] = len(body)
+    if body_size > _http_cache_max_size:
+        return
+
+    entry_path: Final[str] = _http_cache_entry_path(cache_path, url)
+    body_path: Final[str] = entry_path + _HTTP_CACHE_BODY_FILE_EXT
+    meta_path: Final[str] = entry_path + _HTTP_CACHE_META_FILE_EXT
+
+    try:
+        previous_size: int = os.path.getsize(body_path)
+    except OSError:
+        previous_size = 0
+
+    # The body is replaced first & the metadata last, so a torn write never pairs stale validators w/ a new body.
+    with open(body_path + _HTTP_CACHE_TEMP_FILE_EXT, _OPEN_FILE_WRITE_BINARY_FLAG) as file:
+        file.write(body)
+
+    os.replace(body_path + _HTTP_CACHE_TEMP_FILE_EXT, body_path)
+
+    with open(meta_path + _HTTP_CACHE_TEMP_FILE_EXT, _OPEN_FILE_WRITE_FLAG, encoding=_DEFAULT_HTTP_TEXT_ENCODING) as file:
+        json.dump({
+            _HTTP_CACHE_META_URL_FIELD_NAME: url,
+            _HTTP_CACHE_META_ETAG_FIELD_NAME: etag,
+            _HTTP_CACHE_META_LAST_MODIFIED_FIELD_NAME: last_modified,
+            _HTTP_CACHE_META_ENCODING_FIELD_NAME: response.encoding,
+            _HTTP_CACHE_META_SIZE_FIELD_NAME: body_size
+        }, file)
+
+    os.replace(meta_path + _HTTP_CACHE_TEMP_FILE_EXT, meta_path)
+
+    with _http_cache_lock:
+        _http_cache_size += body_size - previous_size
+
+    _http_cache_evict()
+
+
+def _http_cache_evict() -> None:
+    global _http_cache_size
+
+    cache_path: Final[Optional[str]] = _http_cache_path
+    if not cache_path:
+        return
+
+    with _http_cache_lock:
+        if _http_cache_size <= _http_cache_max_size:
+            return
+
+        body_entries: Final[list[os.DirEntry]] \
+            = [entry for entry in os.scandir(cache_path) if entry.name.endswith(_HTTP_CACHE_BODY_FILE_EXT)]
+
+        body_entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for body_entry in body_entries:
+            if _http_cache_size <= _http_cache_max_size:
+                break
+
+            entry_path: str = body_entry.path[:-len(_HTTP_CACHE_BODY_FILE_EXT)]
+            body_size: int = body_entry.stat().st_size
+
+            for file_path in (entry_path + _HTTP_CACHE_META_FILE_EXT, body_entry.path):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+
+            _http_cache_size -= body_size
+
+
+def _scheduler_configure(
+    max_concurrency: Optional[int] = None,
+    request_rate: Optional[float] = None,
+    max_retries: Optional[int] = None
+) -> None:
+    global _scheduler_max_limit, _scheduler_limit, _scheduler_min_limit, _scheduler_in_flight, \
+        _scheduler_decrease_clock, _scheduler_request_rate, _scheduler_max_retries
+
+    if max_concurrency is None:
+        max_concurrency = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
+
+    if max_retries is None:
+        max_retries = _DEFAULT_HTTP_MAX_RETRIES
+
+    with _scheduler_condition:
+        _scheduler_max_limit = max_concurrency
+        _scheduler_limit = max_concurrency
+        _scheduler_min_limit = max_concurrency
+        _scheduler_in_flight = 0
+        _scheduler_decrease_clock = 0.0
+        _scheduler_request_rate = request_rate
+        _scheduler_max_retries = max_retries
+
+        _scheduler_hosts.clear()
+        _scheduler_host_starts.clear()
+        _scheduler_latencies.clear()
+        _scheduler_counts[:] = [0, 0]
+
+        _scheduler_condition.notify_all()
+
+
+def _scheduler_bucket_size(request_rate: float) -> float:
+    return max(1.0, request_rate * _SCHEDULER_BUCKET_BURST)
+
+
+def _scheduler_host(url: str) -> tuple[str, list[float]]:
+    host: Final[str] = urlsplit(url).netloc
+
+    # Hosts are unthrottled until they're given a request rate or throttle a request.
+    host_state: Optional[list[float]] = _scheduler_hosts.get(host)
+    if host_state is None:
+        request_rate: Final[float] = _scheduler_request_rate or math.inf
+        host_state = _scheduler_hosts[host] = [
+            _scheduler_bucket_size(request_rate), time.monotonic(), request_rate, 0.0
+        ]
+
+        _scheduler_host_starts[host] = deque()
+
+    return host, host_state
+
+
+def _scheduler_acquire(url: str) -> float:
+    global _scheduler_in_flight
+
+    with _scheduler_condition:
+        host, host_state = _scheduler_host(url)
+
+        while True:
+            clock: float = time.monotonic()
+
+            wait_time: float = host_state[3] - clock
+            if wait_time <= 0 \
+                    and host_state[2] != math.inf:
+                host_state[0] = min(_scheduler_bucket_size(host_state[2]), host_state[0] + (clock - host_state[1]) * host_state[2])
+                host_state[1] = clock
+
+                if host_state[0] < 1:
+                    wait_time = (1 - host_state[0]) / host_state[2]
+
+            if wait_time <= 0 \
+                    and _scheduler_in_flight < int(_scheduler_limit):
+                break
+
+            _scheduler_condition.wait(wait_time if wait_time > 0 else None)
+
+        host_state[0] -= 1
+        _scheduler_in_flight += 1
+
+        host_starts: Final[deque] = _scheduler_host_starts[host]
+        host_starts.append(clock)
+        while host_starts[0] < clock - _SCHEDULER_RATE_WINDOW:
+            host_starts.popleft()
+
+        return clock
+
+
+def _scheduler_decrease(
+    clock_start: float,
+    factor: float
+) -> bool:
+    global _scheduler_limit, _scheduler_min_limit, _scheduler_decrease_clock
+
+    # Responses to requests sent before the last decrease still reflect the load from before it.
+    if clock_start < _scheduler_decrease_clock:
+        return False
+
+    _scheduler_limit = max(1.0, _scheduler_limit * factor)
+    _scheduler_min_limit = min(_scheduler_min_limit, _scheduler_limit)
+    _scheduler_decrease_clock = time.monotonic()
+
+    return True
+
+
+def _scheduler_release(
+    url: str,
+    clock_start: float,
+    status: Optional[int] = None,
+    latency: Optional[float] = None,
+    retry_after: Optional[float] = None
+) -> None:
+    global _scheduler_limit, _scheduler_in_flight
+
+    with _scheduler_condition:
+        host, host_state = _scheduler_host(url)
+        _scheduler_in_flight -= 1
+
+        if status in _HTTP_STATUSES_THROTTLED:
+            _scheduler_counts[1] += 1
+
+            if _scheduler_decrease(clock_start, _SCHEDULER_THROTTLE_DECREASE):
+                measured_rate: float = len(_scheduler_host_starts[host]) / _SCHEDULER_RATE_WINDOW
+                host_state[2] = max(_SCHEDULER_MIN_REQUEST_RATE, min(host_state[2], measured_rate) * _SCHEDULER_THROTTLE_DECREASE)
+                host_state[0] = min(host_state[0], _scheduler_bucket_size(host_state[2]))
+
+            if retry_after is not None:
+                host_state[3] = max(host_state[3], time.monotonic() + retry_after)
+        elif status is not None \
+                and status < _HTTP_STATUS_INTERNAL_SERVER_ERROR \
+                and latency is not None:
+            # Endpoint families differ in their payloads, so each is compared against its own latency.
+            # A short average well above the long one means requests queue up on the server,
+            #   jitter of single responses moves neither of them much.
+            # Both averages are plain means of the first responses, so the first ones can't skew them.
+            endpoint_family: Final[str] = _report_endpoint_family(url)
+
+            family_latency: Optional[list[float]] = _scheduler_latencies.get(endpoint_family)
+            if family_latency is None:
+                family_latency = _scheduler_latencies[endpoint_family] = [0.0, 0.0, 0]
+
+            family_latency[2] += 1
+            family_latency[0] += (latency - family_latency[0]) * max(_SCHEDULER_LATENCY_SHORT_WEIGHT, 1 / family_latency[2])
+            family_latency[1] += (latency - family_latency[1]) * max(_SCHEDULER_LATENCY_LONG_WEIGHT, 1 / family_latency[2])
+
+            if family_latency[0] > family_latency[1] * _SCHEDULER_LATENCY_TOLERANCE \
+                    and family_latency[0] > family_latency[1] + _SCHEDULER_LATENCY_SLACK:
+                _scheduler_decrease(clock_start, _SCHEDULER_LATENCY_DECREASE)
+            else:
+                _scheduler_limit = min(_scheduler_max_limit, _scheduler_limit + 1 / _scheduler_limit)
+
+                if host_state[2] != math.inf:
+                    host_state[2] += 1 / host_state[2]
+
+        _scheduler_condition.notify_all()
+
+
+def _scheduler_json() -> dict[str, Any]:
+    with _scheduler_condition:
+        return {
+            _REPORT_RETRIES_FIELD_NAME: _scheduler_counts[0],
+            _REPORT_THROTTLED_FIELD_NAME: _scheduler_counts[1],
+            _REPORT_CONCURRENCY_LIMIT_FIELD_NAME: _scheduler_limit,
+            _REPORT_MIN_CONCURRENCY_LIMIT_FIELD_NAME: _scheduler_min_limit,
+            _REPORT_REQUEST_RATES_FIELD_NAME: {
+                host: host_state[2] if host_state[2] != math.inf else None
+                for host, host_state in _scheduler_hosts.items()
+            }
+        }
+
+
+def _http_retry_after(response: Response) -> Optional[float]:
+    value: Final[Optional[str]] = response.headers.get(_HTTP_HEADER_RETRY_AFTER)
+    if not value:
+        return None
+
+    # Either a number of seconds or an HTTP date.
+    try:
+        seconds: float = float(value)
+    except ValueError:
+        try:
+            retry_date: datetime = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+        seconds = (retry_date - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(0.0, seconds), _HTTP_RETRY_AFTER_MAX)
+
+
+def _http_backoff(attempt: int) -> float:
+    # Full jitter, so requests that failed together don't retry together.
+    return random.uniform(0.0, min(_HTTP_BACKOFF_MAX, _HTTP_BACKOFF_BASE * 2 ** attempt))
+
+
+def _get_url_response(
+    url: Optional[str],
+    headers: Optional[dict[str, str]] = None
+) -> Optional[Response]:
+    if not url:
+        return None
+
+    attempt: int = 0
+    while True:
+        scheduler_clock_start: float = _scheduler_acquire(url)
+        clock_start: tuple[float, float] = _report_clock()
+
+        try:
+            response: Response = _get_http_session().get(url, headers=headers, timeout=_http_timeout)
+        except RequestException as e:
+            _scheduler_release(url, scheduler_clock_start)
+            _report_request(url, clock_start, _REPORT_ENDPOINT_STATUS_ERROR_NAME, 0)
+
+            if attempt >= _scheduler_max_retries \
+                    or not isinstance(e, _HTTP_TRANSIENT_EXCEPTIONS):
+                raise
+
+            retry_delay: float = _http_backoff(attempt)
+        else:
+            retry_after: Optional[float] = _http_retry_after(response) \
+                if response.status_code in _HTTP_STATUSES_THROTTLED \
+                else None
+
+            _scheduler_release(url, scheduler_clock_start, response.status_code, response.elapsed.total_seconds(), retry_after)
+            _report_request(url, clock_start, response.status_code, len(response.content))
+
+            if attempt >= _scheduler_max_retries \
+                    or response.status_code not in _HTTP_STATUSES_TRANSIENT:
+                break
+
+            retry_delay = retry_after \
+                if retry_after is not None \
+                else _http_backoff(attempt)
+
+        with _scheduler_condition:
+            _scheduler_counts[0] += 1
+
+        attempt += 1
+        time.sleep(retry_delay)
+
+    response.raise_for_status()
+
+    if response.status_code == _HTTP_STATUS_NO_CONTENT:
+        return None
+
+    return response
+
+
+def _get_url_content(url: Optional[str]) -> Optional[tuple[bytes, Optional[str]]]:
+    if not url:
+        return None
+
+    url = _trick_surf_api_url(url)
+
+    cache_meta: Final[Optional[dict[str, Any]]] = _http_cache_load_meta(url)
+
+    cache_headers: Final[dict[str, str]] = {}
+    if cache_meta is not None:
+        etag: Optional[str] = cache_meta.get(_HTTP_CACHE_META_ETAG_FIELD_NAME)
+        if etag:
+            cache_headers[_HTTP_HEADER_IF_NONE_MATCH] = etag
+
+        last_modified: Optional[str] = cache_meta.get(_HTTP_CACHE_META_LAST_MODIFIED_FIELD_NAME)
+        if last_modified:
+            cache_headers[_HTTP_HEADER_IF_MODIFIED_SINCE] = last_modified
+
+    response: Optional[Response] = _get_url_response(url, cache_headers)
+    if response is None:
+        return None
+
+    if response.status_code == _HTTP_STATUS_NOT_MODIFIED:
+        if cache_meta is not None:
+            body: Optional[bytes] = _http_cache_load_body(url)
+            if body is not None:
+                return body, cache_meta.get(_HTTP_CACHE_META_ENCODING_FIELD_NAME)
+
+        # The cached body is gone, so the validators are worthless, re-request the whole thing.
+        response = _get_url_response(url)
+        if response is None:
+            return None
+
+    content: Final[bytes] = response.content
+    _http_cache_store(url, response, content)
+
+    return content, response.encoding
+
+
+def _get_url_text(url: Optional[str]) -> Optional[str]:
+    url_content: Final[Optional[tuple[bytes, Optional[str]]]] = _get_url_content(url)
+    if url_content is None:
+        return None
+
+    content, encoding = url_content
+    return content.decode(encoding or _DEFAULT_HTTP_TEXT_ENCODING, errors=_STRING_ENCODE_ERROR_REPLACE)
+
+
+def _get_url_json(url: Optional[str]) -> Optional[Any]:
+    url_content: Final[Optional[tuple[bytes, Optional[str]]]] = _get_url_content(url)
+    if url_content is None:
+        return None
+
+    content: Final[bytes] = url_content[0]
+
+    clock_start: tuple[float, float] = _report_clock()
+    json_object: Final[Any] = json.loads(content)
+    _report_phase(_REPORT_PHASE_PARSE, clock_start)
+
+    # Only a document that has an escaped backslash followed by `u` can hold escaped unicode characters.
+    if _ESCAPED_UNICODE_JSON_MARKER not in content:
+        return json_object
+
+    clock_start = _report_clock()
+    try:
+        return _unescape(json_object)
+    finally:
+        _report_phase(_REPORT_PHASE_UNESCAPE, clock_start)
+
+
+def _journal_configure(
+    journal_path: Optional[str],
+    resume: Optional[bool] = None
+) -> None:
+    global _journal_path, _journal_file
+
+    _journal_close()
+
+    with _journal_lock:
+        _journal_path = journal_path or None
+        _journal_entries.clear()
+
+        if not _journal_path:
+            return
+
+        # W/o resuming, whatever was left by a previous run is stale.
+        if not resume \
+                and os.path.exists(_journal_path):
+            shutil.rmtree(_journal_path)
+
+        os.makedirs(_journal_path, exist_ok=True)
+
+        journal_file_path: Final[str] = os.path.join(_journal_path, _JOURNAL_FILE_NAME)
+        if os.path.exists(journal_file_path):
+            with open(journal_file_path, _OPEN_FILE_READ_FLAG, encoding=_JOURNAL_FILE_ENCODING) as file:
+                for line in file:
+                    try:
+                        entry: Any = json.loads(line)
+                    except ValueError:
+                        # A torn line left by an interrupted write.
+                        continue
+
+                    url: Optional[str] = entry.get(_JOURNAL_ENTRY_URL_FIELD_NAME)
+                    payload_name: Optional[str] = entry.get(_JOURNAL_ENTRY_PAYLOAD_FIELD_NAME)
+                    if not url \
+                            or not payload_name \
+                            or not os.path.exists(os.path.join(_journal_path, payload_name)):
+                        continue
+
+                    _journal_entries[url] = payload_name
+
+        _journal_file = open(journal_file_path, _OPEN_FILE_APPEND_FLAG, encoding=_JOURNAL_FILE_ENCODING)
+
+
+def _journal_close() -> None:
+    global _journal_file
+
+    with _journal_lock:
+        if _journal_file is not None:
+            _journal_file.close()
+            _journal_file = None
+
+
+def _journal_clear() -> None:
+    global _journal_path
+
+    _journal_close()
+
+    with _journal_lock:
+        if _journal_path \
+                and os.path.exists(_journal_path):
+            shutil.rmtree(_journal_path)
+
+        _journal_path = None
+        _journal_entries.clear()
+
+
+def _journal_load(url: str) -> tuple[bool, Optional[Any]]:
+    with _journal_lock:
+        journal_path: Final[Optional[str]] = _journal_path
+        payload_name: Final[Optional[str]] = _journal_entries.get(url)
+
+    if not journal_path \
+            or not payload_name:
+        return False, None
+
+    with open(os.path.join(journal_path, payload_name), _OPEN_FILE_READ_FLAG, encoding=_JOURNAL_FILE_ENCODING) as file:
+        return True, json.load(file)
+
+
+def _journal_record(
+    url: str,
+    payload: Optional[Any]
+) -> None:
+    journal_path: Final[Optional[str]] = _journal_path
+    if not journal_path:
+        return
+
+    payload_name: Final[str] = hashlib.sha256(url.encode(_JOURNAL_FILE_ENCODING)).hexdigest() + _JOURNAL_PAYLOAD_FILE_EXT
+    payload_path: Final[str] = os.path.join(journal_path, payload_name)
+
+    with open(payload_path + _JOURNAL_TEMP_FILE_EXT, _OPEN_FILE_WRITE_FLAG, encoding=_JOURNAL_FILE_ENCODING) as file:
+        json.dump(payload, file, separators=_JSON_SEPARATORS)
+
+    os.replace(payload_path + _JOURNAL_TEMP_FILE_EXT, payload_path)
+
+    # The entry is appended only after its payload is in place, so every journaled fetch can be replayed.
+    with _journal_lock:
+        if _journal_file is None:
+            return
+
+        _journal_file.write(json.dumps({
+            _JOURNAL_ENTRY_URL_FIELD_NAME: url,
+            _JOURNAL_ENTRY_PAYLOAD_FIELD_NAME: payload_name
+        }) + '\n')
+
+        _journal_file.flush()
+        os.fsync(_journal_file.fileno())
+
+        _journal_entries[url] = payload_name
+
+
+def _get_journaled_url_json(url: Optional[str]) -> Optional[Any]:
+    if not url:
+        return None
+
+    is_journaled, url_json = _journal_load(url)
+    if is_journaled:
+        return url_json
+
+    url_json = _get_url_json(url)
+    _journal_record(url, url_json)
+
+    return url_json
+
+
+def _get_url_json_iter(
+    urls: Optional[Iterable[tuple[Any, str]]],
+    max_concurrency: Optional[int] = None
+) -> Iterator[tuple[Any, Optional[Any]]]:
+    if urls is None:
+        return
+
+    if max_concurrency is None:
+        max_concurrency = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
+
+    url_iter: Final[Iterator[tuple[Any, str]]] = iter(urls)
+
+    # Only up to <max-concurrency> requests are submitted ahead of the consumer,
+    # so finished responses never pile up faster than they're taken.
+    executor: Final[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        futures: Final[dict[Future, Any]] = {}
+        while True:
+            while len(futures) < max_concurrency:
+                next_url: Optional[tuple[Any, str]] = next(url_iter, None)
+                if next_url is None:
+                    break
+
+                key, url = next_url
+                futures[executor.submit(_get_journaled_url_json, url)] = key
+
+            if not futures:
+                break
+
+            done_futures, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                yield futures.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _get_url_json_map(
+    urls: Optional[dict[Any, str]],
+    max_concurrency: Optional[int] = None
+) -> Optional[dict[Any, Optional[Any]]]:
+    if urls is None:
+        return None
+
+    # Results are keyed in the order the URLs were given, not in the order they complete.
+    url_jsons: Final[dict[Any, Optional[Any]]] = dict.fromkeys(urls)
+    for key, url_json in _get_url_json_iter(urls.items(), max_concurrency):
+        url_jsons[key] = url_json
+
+    return url_jsons
+
+
+def _str_to_bool(
+    val: Optional[Any],
+) -> bool:
+    if val is None:
+        return False
+
+    if isinstance(val, bool):
+        return val
+
+    lower_val = str(val) \
+        .lower()
+
+    if lower_val in _BOOL_TRUE_NAMES:
+        return True
+
+    if lower_val in _BOOL_FALSE_NAMES:
+        return False
+
+    raise ValueError(f'Couldn\'t convert "{val}" to a boolean value')
+
+
+def _str_to_positive_int(
+    val: Optional[Any]
+) -> int:
+    try:
+        int_val: Final[int] = int(str(val))
+    except ValueError:
+        raise ArgumentTypeError(f'Couldn\'t convert "{val}" to an integer value')
+
+    if int_val <= 0:
+        raise ArgumentTypeError(f'Expected a positive integer value, got "{val}"')
+
+    return int_val
+
+
+def _str_to_non_negative_int(
+    val: Optional[Any]
+) -> int:
+    try:
+        int_val: Final[int] = int(str(val))
+    except ValueError:
+        raise ArgumentTypeError(f'Couldn\'t convert "{val}" to an integer value')
+
+    if int_val < 0:
+        raise ArgumentTypeError(f'Expected a non-negative integer value, got "{val}"')
+
+    return int_val
+
+
+def _str_to_positive_float(
+    val: Optional[Any]
+) -> float:
+    try:
+        float_val: Final[float] = float(str(val))
+    except ValueError:
+        raise ArgumentTypeError(f'Couldn\'t convert "{val}" to a float value')
+
+    if not float_val > 0:
+        raise ArgumentTypeError(f'Expected a positive float value, got "{val}"')
+
+    return float_val
+
+
+def _str_to_url(
+    val: Optional[Any]
+) -> str:
+    url: Final[str] = str(val).strip()
+
+    if not url.lower().startswith(_HTTP_URL_SCHEMES):
+        raise ArgumentTypeError(f'Expected an http or https url, got "{val}"')
+
+    return url
+
+
+def _str_to_dump_formats(
+    val: Optional[Any]
+) -> tuple[str, ...]:
+    formats: Final[set[str]] = set()
+    for format_name in str(val).split(_DUMP_FORMATS_SEPARATOR):
+        format_name = format_name.strip() \
+            .lower()
+
+        if format_name not in _DUMP_FORMAT_FILE_EXTS:
+            raise ArgumentTypeError(f'Expected formats out of {", ".join(_DUMP_FORMATS)}, got "{val}"')
+
+        formats.add(format_name)
+
+    return tuple(format_name for format_name in _DUMP_FORMATS if format_name in formats)
+
+
+def _str_to_title(
+    val: Optional[Any]
+) -> Optional[str]:
+    if val is None:
+        return None
+
+    val = str(val)
+
+    words: Final[list[str]] = re.split(_REGEX_WHITESPACE_CHARS, val, flags=_REGEX_MULTILINE_FLAG)
+    if not words:
+        return None
+
+    words_count: Final[int] = len(words)
+    for i in range(words_count):
+        word: str = words[i]
+        if not word:
+            continue
+
+        word_len: int = len(word)
+
+        word = word[0]
+        if word_len <= 2 \
+                or (not words[i][1].isdigit() and not words[i][1].isupper()):
+            word = word.upper()
+
+        if word_len > 1:
+            word += words[i][1:]
+
+        words[i] = word
+
+    return ' '.join(words)
+
+
+def _sql_tokens(sql_stream: TextIO) -> Iterator[tuple[str, str]]:
+    # The stream is read in chunks, only the unread tail of the last one is kept between tokens.
+    buffer: str = ''
+    position: int = 0
+    is_eof: bool = False
+
+    while True:
+        match: Optional[re.Match] = _SQL_TOKEN_REGEX.match(buffer, position)
+
+        # A token that ends too close to the end of the buffer might continue in the next chunk.
+        if not is_eof \
+                and (match is None or len(buffer) - match.end() < _SQL_TOKEN_LOOKAHEAD):
+            chunk: str = sql_stream.read(_SQL_READ_CHUNK_SIZE)
+            if not chunk:
+                is_eof = True
+
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        if match is None:
+            return
+
+        token_kind: str = match.lastgroup
+        if token_kind == _SQL_TOKEN_PARTIAL:
+            raise ValueError(f'Unterminated SQL token at "{match.group(token_kind)[:32]}"')
+
+        position = match.end()
+
+        if token_kind != _SQL_TOKEN_COMMENT:
+            yield token_kind, match.group(token_kind)
+
+
+def _sql_unescape_match(match: re.Match) -> str:
+    escaped_char: Final[Optional[str]] = match.group(1)
+    if escaped_char is None:
+        return '\''
+
+    return _SQL_STRING_ESCAPES.get(escaped_char, escaped_char)
+
+
+def _sql_string(token: str) -> str:
+    value: Final[str] = token[1:-1]
+    if '\\' not in value \
+            and '\'' not in value:
+        return value
+
+    return _SQL_STRING_ESCAPE_REGEX.sub(_sql_unescape_match, value)
+
+
+def _sql_number(token: str) -> Union[int, float]:
+    if '.' in token \
+            or 'e' in token \
+            or 'E' in token:
+        return float(token)
+
+    return int(token)
+
+
+def _sql_word(token: str) -> Optional[str]:
+    if token.upper() == _SQL_KEYWORD_NULL:
+        return None
+
+    return token
+
+
+def _sql_row_values(row_token: str) -> tuple[Any, ...]:
+    return tuple([
+        _sql_string(string) if string else _sql_number(number) if number else _sql_word(word)
+        for string, number, word in _SQL_VALUE_REGEX.findall(row_token, 1, len(row_token) - 1)
+    ])
+
+
+def _sql_insert_rows(sql_stream: Optional[TextIO]) -> Iterator[tuple[str, tuple[Any, ...]]]:
+    if sql_stream is None:
+        return
+
+    # Yields (<table-name>, <row-values>) of every `INSERT INTO ... VALUES (...), (...);` statement,
+    # other statements & malformed rows are skipped up to the end of their statement.
+    tokens: Final[Iterator[tuple[str, str]]] = _sql_tokens(sql_stream)
+
+    def skip_statement(token: Optional[tuple[str, str]]) -> None:
+        while token is not None \
+                and token != (_SQL_TOKEN_SYMBOL, _SQL_SYMBOL_END):
+            token = next(tokens, None)
+
+    for token_kind, token in tokens:
+        if token_kind != _SQL_TOKEN_WORD \
+                or token.upper() != _SQL_KEYWORD_INSERT:
+            skip_statement((token_kind, token))
+            continue
+
+        # INSERT [IGNORE] INTO <table-name> [(<column-name>, ...)] VALUES
+        next_token: Optional[tuple[str, str]] = next(tokens, None)
+        while next_token is not None \
+                and next_token[0] == _SQL_TOKEN_WORD \
+                and next_token[1].upper() != _SQL_KEYWORD_INTO:
+            next_token = next(tokens, None)
+
+        table_name: Optional[str] = None
+        next_token = next(tokens, None)
+        while next_token is not None \
+                and next_token[0] in (_SQL_TOKEN_NAME, _SQL_TOKEN_WORD):
+            table_name = next_token[1].strip('`') if next_token[0] == _SQL_TOKEN_NAME else next_token[1]
+
+            next_token = next(tokens, None)
+            if next_token != (_SQL_TOKEN_SYMBOL, _SQL_SYMBOL_DOT):
+                break
+
+            next_token = next(tokens, None)
+
+        # Column names are either quoted or plain words, the latter are read as a row.
+        if next_token is not None \
+                and next_token[0] == _SQL_TOKEN_ROW:
+            next_token = next(tokens, None)
+        elif next_token == (_SQL_TOKEN_SYMBOL, _SQL_SYMBOL_OPEN):
+            while next_token is not None \
+                    and next_token != (_SQL_TOKEN_SYMBOL, _SQL_SYMBOL_CLOSE):
+                next_token = next(tokens, None)
+
+            next_token = next(tokens, None)
+
+        if table_name is None \
+                or next_token is None \
+                or next_token[0] != _SQL_TOKEN_WORD \
+                or next_token[1].upper() not in _SQL_KEYWORD_VALUES:
+            skip_statement(next_token)
+            continue
+
+        # (<value>, ...), (<value>, ...);
+        next_token = next(tokens, None)
+        while next_token is not None \
+                and next_token[0] == _SQL_TOKEN_ROW:
+            yield table_name, _sql_row_values(next_token[1])
+
+            next_token = next(tokens, None)
+            if next_token == (_SQL_TOKEN_SYMBOL, _SQL_SYMBOL_SEPARATOR):
+                next_token = next(tokens, None)
+
+        skip_statement(next_token)
+
+
+def _str_to_stream(val: Optional[str]) -> Optional[TextIO]:
+    if val is None:
+        return None
+
+    return io.StringIO(val)
+
+
+def _sql_is_id(value: Optional[Any]) -> bool:
+    return isinstance(value, int) \
+        and not isinstance(value, bool) \
+        and value >= 0
+
+
+def _sql_is_optional_str(value: Optional[Any]) -> bool:
+    return value is None \
+        or isinstance(value, str)
+
+
+def _sql_is_optional_number(value: Optional[Any]) -> bool:
+    return value is None \
+        or (isinstance(value, (int, float)) and not isinstance(value, bool))
+
+
+def _table_cell_converter(
+    column_type: Callable[[Any], Any]
+) -> Callable[[Optional[Any]], Optional[Any]]:
+    # Cells are stripped & unescaped text, empty ones are nulls, parsed SQL values skip the round trip through str.
+    def convert_cell(cell: Optional[Any]) -> Optional[Any]:
+        if cell is None:
+            return None
+
+        cell = _unescape(str(cell) \
+            .strip())
+
+        if not cell:
+            return None
+
+        return column_type(cell)
+
+    if column_type is str:
+        def convert_str_cell(cell: Optional[Any]) -> Optional[Any]:
+            if cell.__class__ is not str:
+                return convert_cell(cell)
+
+            return _unescape(cell.strip()) or None
+
+        return convert_str_cell
+
+    if column_type is int:
+        def convert_int_cell(cell: Optional[Any]) -> Optional[Any]:
+            if cell.__class__ is not int:
+                return convert_cell(cell)
+
+            return cell
+
+        return convert_int_cell
+
+    if column_type is float:
+        def convert_float_cell(cell: Optional[Any]) -> Optional[Any]:
+            if cell.__class__ is not int \
+                    and cell.__class__ is not float:
+                return convert_cell(cell)
+
+            return float(cell)
+
+        return convert_float_cell
+
+    return convert_cell
+
+
+def _table_row_converter(
+    table_column_names: dict[int, str],
+    table_column_types: dict[int, Callable[[Any], Any]]
+) -> Callable[[tuple[Any, ...]], dict[str, Any]]:
+    # Column lookups are resolved once per table, a row is then a single getter call & a zip.
+    column_ids: Final[tuple[int, ...]] = tuple(table_column_names.keys())
+    column_names: Final[tuple[str, ...]] = tuple(table_column_names.values())
+    column_converters: Final[tuple[Callable[[Optional[Any]], Optional[Any]], ...]] \
+        = tuple(_table_cell_converter(table_column_types[column_id]) for column_id in column_ids)
+
+    column_getter: Final[Callable[[tuple[Any, ...]], Any]] = itemgetter(*column_ids)
+    if len(column_ids) == 1:
+        def get_cells(table_row: tuple[Any, ...]) -> tuple[Any, ...]:
+            return column_getter(table_row),
+    else:
+        get_cells = column_getter
+
+    def convert_row(table_row: tuple[Any, ...]) -> dict[str, Any]:
+        return dict(zip(column_names, [
+            convert_cell(cell) for convert_cell, cell in zip(column_converters, get_cells(table_row))
+        ]))
+
+    return convert_row
+
+
+def _table_to_json(
+    table_rows: Optional[list[tuple[Any, ...]]],
+    table_column_names: Optional[dict[int, str]],
+    table_column_types: Optional[dict[int, Callable[[Any], Any]]]
+) -> Optional[Any]:
+    if not table_rows \
+            or not table_column_names \
+            or not table_column_types:
+        return None
+
+    convert_row: Final[Callable[[tuple[Any, ...]], dict[str, Any]]] \
+        = _table_row_converter(table_column_names, table_column_types)
+
+    table_json: Final[list[dict[str, Any]]] = [convert_row(table_row) for table_row in table_rows]
+    if not table_json:
+        return None
+
+    return table_json
+
+
+def _columns_to_json(
+    table_columns: Optional[dict[str, Union[array, list[Any]]]]
+) -> Optional[Any]:
+    if not table_columns:
+        return None
+
+    # Cells were already converted by the columns, rows are only zipped back together.
+    column_names: Final[tuple[str, ...]] = tuple(table_columns.keys())
+
+    table_json: Final[list[dict[str, Any]]] \
+        = [dict(zip(column_names, row_cells)) for row_cells in zip(*table_columns.values())]
+
+    if not table_json:
+        return None
+
+    return table_json
+
+
+def _table_to_columns(
+    table_rows: Optional[list[tuple[Any, ...]]],
+    table_column_names: Optional[dict[int, str]],
+    table_column_types: Optional[dict[int, Callable[[Any], Any]]]
+) -> Optional[dict[str, Union[array, list[Any]]]]:
+    if not table_rows \
+            or not table_column_names \
+            or not table_column_types:
+        return None
+
+    # Numeric columns w/o nulls are packed into typed arrays, one machine value per cell instead of an object.
+    table_columns: Final[dict[str, Union[array, list[Any]]]] = {}
+    for column_id, column_name in table_column_names.items():
+        column_type: Callable[[Any], Any] = table_column_types[column_id]
+        convert_cell: Callable[[Optional[Any]], Optional[Any]] = _table_cell_converter(column_type)
+
+        column_values: list[Any] = [convert_cell(table_row[column_id]) for table_row in table_rows]
+
+        column_typecode: Optional[str] = _TABLE_COLUMN_ARRAY_TYPECODES.get(column_type)
+        if column_typecode is not None \
+                and None not in column_values:
+            table_columns[column_name] = array(column_typecode, column_values)
+        else:
+            table_columns[column_name] = column_values
+
+    return table_columns
+
+
+def _load_json(file_path: Optional[str]) -> Optional[Any]:
+    if not file_path:
+        return None
+
+    try:
+        with open(file_path, _OPEN_FILE_READ_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _load_dump_json(dump_path: Optional[str]) -> Optional[Any]:
+    # Dumps are read back from whichever format was written, the formats currently configured are tried first.
+    if not dump_path:
+        return None
+
+    dump_path_formats: Final[tuple[str, ...]] = _dump_path_formats(dump_path)
+
+    read_formats: Final[list[str]] = [format_name for format_name in _DUMP_READ_FORMATS if format_name in dump_path_formats]
+    read_formats.extend(format_name for format_name in _DUMP_READ_FORMATS if format_name not in dump_path_formats)
+
+    for format_name in read_formats:
+        file_path: str = dump_path + _DUMP_FORMAT_FILE_EXTS[format_name]
+        if not os.path.exists(file_path):
+            continue
+
+        if format_name == _DUMP_FORMAT_GZ:
+            file_open: Callable[..., Any] = gzip.open
+        elif format_name == _DUMP_FORMAT_XZ:
+            file_open = lzma.open
+        else:
+            return _load_json(file_path)
+
+        try:
+            with file_open(file_path, _OPEN_FILE_READ_TEXT_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
+                return json.load(file)
+        except (OSError, EOFError, ValueError, lzma.LZMAError):
+            return None
+
+    return None
+
+
+def _load_dump_entity_json(
+    dump_path: Optional[str],
+    entity_id: Optional[int]
+) -> Optional[Any]:
+    # Only the entity's byte range of the collection's .min.json file is parsed, the file is mapped instead of read.
+    if not dump_path \
+            or entity_id is None:
+        return None
+
+    index_json: Optional[Any] = _dump_entity_index_cache.get(dump_path)
+    if dump_path not in _dump_entity_index_cache:
+        index_json = _load_json(dump_path + _DUMP_INDEX_FILE_EXT)
+        _dump_entity_index_cache[dump_path] = index_json
+
+    if not isinstance(index_json, dict):
+        return _load_dump_json(os.path.join(dump_path, str(entity_id)))
+
+    entity_range: Final[Optional[Any]] = index_json.get(str(entity_id))
+    if not entity_range:
+        return None
+
+    entity_offset, entity_length = entity_range
+
+    try:
+        with open(dump_path + _DUMP_JSON_FILE_MIN_EXT, _OPEN_FILE_READ_BINARY_FLAG) as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+                return json.loads(file_map[entity_offset:entity_offset + entity_length])
+    except (OSError, ValueError):
+        return None
+
+
+def _has_dump_json(dump_path: str) -> bool:
+    return all(os.path.exists(dump_path + _DUMP_FORMAT_FILE_EXTS[format_name]) for format_name in _dump_path_formats(dump_path))
+
+
+def _json_writer_configure(
+    thread_count: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    fsync: Optional[bool] = None
+) -> None:
+    global _json_writer_fsync
+
+    if thread_count is None:
+        thread_count = _DEFAULT_JSON_WRITER_THREADS
+
+    if queue_size is None:
+        queue_size = _DEFAULT_JSON_WRITER_QUEUE_SIZE
+
+    if fsync is not None:
+        _json_writer_fsync = fsync
+
+    _json_writer_close()
+
+    # Every file always goes through the same queue, so its writes are never reordered.
+    for _ in range(thread_count):
+        queue: Queue = Queue(max(queue_size // thread_count, 1))
+        threading.Thread(target=_json_writer_work, args=(queue,), daemon=True).start()
+
+        _json_writer_queues.append(queue)
+
+
+def _json_writer_work(queue: Queue) -> None:
+    while True:
+        task: Optional[tuple[str, Any]] = queue.get()
+
+        try:
+            if task is None:
+                return
+
+            # Once a write failed the remaining ones are dropped, the error is reported once the step flushes.
+            if not _json_writer_is_failed():
+                _write_json(*task)
+        except Exception as e:
+            _json_writer_fail(e)
+        finally:
+            queue.task_done()
+
+
+def _json_writer_fail(error: Exception) -> None:
+    global _json_writer_error
+
+    with _json_writer_lock:
+        if _json_writer_error is None:
+            _json_writer_error = error
+
+
+def _json_writer_is_failed() -> bool:
+    with _json_writer_lock:
+        return _json_writer_error is not None
+
+
+def _json_writer_flush() -> bool:
+    for queue in _json_writer_queues:
+        queue.join()
+
+    return not _json_writer_is_failed()
+
+
+def _json_writer_step_flush(step_name: str) -> bool:
+    global _json_writer_error
+
+    _json_writer_flush()
+
+    with _json_writer_lock:
+        error: Final[Optional[Exception]] = _json_writer_error
+        _json_writer_error = None
+
+    if error is None:
+        return True
+
+    print(_FAILURE_MESSAGE_WRITE_FILES_FMT % (step_name, error), file=_STD_ERR_STREAM)
+    return False
+
+
+def _json_writer_close() -> None:
+    for queue in _json_writer_queues:
+        queue.put(None)
+
+    for queue in _json_writer_queues:
+        queue.join()
+
+    _json_writer_queues.clear()
+
+
+def _json_writer_counts() -> tuple[int, int]:
+    global _json_writer_written_count, _json_writer_skipped_count
+
+    with _json_writer_lock:
+        counts: Final[tuple[int, int]] = (_json_writer_written_count, _json_writer_skipped_count)
+        _json_writer_written_count = 0
+        _json_writer_skipped_count = 0
+
+    return counts
+
+
+def _json_manifest_configure(manifest_path: Optional[str]) -> None:
+    global _json_manifest_path
+
+    _json_manifest_path = manifest_path
+    _json_manifest.clear()
+
+    if not manifest_path:
+        return
+
+    manifest: Final[Optional[Any]] = _load_json(manifest_path)
+    if isinstance(manifest, dict):
+        _json_manifest.update(manifest)
+
+
+def _json_manifest_key(file_path: str) -> str:
+    return os.path.relpath(file_path, _PARENT_PATH)
+
+
+def _json_manifest_record(
+    file_path: str,
+    file_digest: str
+) -> None:
+    file_stat: Final[os.stat_result] = os.stat(file_path)
+
+    with _json_manifest_lock:
+        _json_manifest[_json_manifest_key(file_path)] = [file_digest, file_stat.st_size, file_stat.st_mtime_ns]
+
+
+def _json_manifest_forget(file_path: str) -> None:
+    with _json_manifest_lock:
+        _json_manifest.pop(_json_manifest_key(file_path), None)
+
+
+def _json_manifest_is_unchanged(
+    file_path: str,
+    file_bytes: bytes,
+    file_digest: str
+) -> bool:
+    try:
+        file_stat: Final[os.stat_result] = os.stat(file_path)
+    except OSError:
+        return False
+
+    with _json_manifest_lock:
+        entry: Final[Optional[list[Any]]] = _json_manifest.get(_json_manifest_key(file_path))
+
+    if entry == [file_digest, file_stat.st_size, file_stat.st_mtime_ns]:
+        return True
+
+    # Files touched outside of the dump (e.g. by a fresh checkout) are compared by their content instead.
+    try:
+        with open(file_path, _OPEN_FILE_READ_BINARY_FLAG) as file:
+            if file.read() != file_bytes:
+                return False
+    except OSError:
+        return False
+
+    _json_manifest_record(file_path, file_digest)
+
+    return True
+
+
+def _json_manifest_store() -> None:
+    if not _json_manifest_path:
+        return
+
+    os.makedirs(os.path.dirname(_json_manifest_path), exist_ok=True)
+
+    temp_path: Final[str] = _json_manifest_path + _JSON_MANIFEST_TEMP_FILE_EXT
+    with _json_manifest_lock:
+        with open(temp_path, _OPEN_FILE_WRITE_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
+            json.dump(_json_manifest, file, separators=_JSON_SEPARATORS)
+
+    os.replace(temp_path, _json_manifest_path)
+
+
+def _dump_formats_configure(
+    formats: Optional[tuple[str, ...]] = None,
+    entity_formats: Optional[tuple[str, ...]] = None,
+    entity_index: Optional[bool] = None
+) -> None:
+    global _dump_formats, _dump_entity_formats, _dump_entity_index
+
+    if formats is None:
+        formats = _DEFAULT_DUMP_FORMATS
+
+    if entity_formats is None:
+        entity_formats = formats
+
+    if entity_index is None:
+        entity_index = _DEFAULT_DUMP_ENTITY_INDEX
+
+    _dump_formats = formats
+    _dump_entity_formats = entity_formats
+    _dump_entity_index = entity_index
+
+
+def _dump_path_formats(dump_path: str) -> tuple[str, ...]:
+    if os.path.basename(dump_path).isdigit():
+        return _dump_entity_formats
+
+    return _dump_formats
+
+
+def _json_encode_formats(
+    json_object: Any,
+    formats: tuple[str, ...],
+    min_bytes: Optional[bytes] = None
+) -> Iterator[tuple[str, bytes]]:
+    # Min bytes that were already encoded are reused, only the pretty document is encoded then.
+    if min_bytes is None:
+        pretty_json, min_json = _json_dumps(json_object)
+
+        # Compressed formats are compressed straight from the encoded min bytes, w/o any temporary file.
+        if formats != (_DUMP_FORMAT_PRETTY,):
+            min_bytes = min_json.encode(_DUMP_JSON_FILE_ENCODING)
+    elif _DUMP_FORMAT_PRETTY in formats:
+        pretty_json = _json_dumps_pretty(json_object)
+
+    for format_name in formats:
+        if format_name == _DUMP_FORMAT_PRETTY:
+            yield _DUMP_JSON_FILE_EXT, pretty_json.encode(_DUMP_JSON_FILE_ENCODING)
+        elif format_name == _DUMP_FORMAT_MIN:
+            yield _DUMP_JSON_FILE_MIN_EXT, min_bytes
+        elif format_name == _DUMP_FORMAT_GZ:
+            yield _DUMP_JSON_FILE_GZ_EXT, gzip.compress(min_bytes, _DUMP_GZIP_COMPRESS_LEVEL, mtime=_DUMP_GZIP_MTIME)
+        elif format_name == _DUMP_FORMAT_XZ:
+            yield _DUMP_JSON_FILE_XZ_EXT, lzma.compress(min_bytes, preset=_DUMP_XZ_PRESET)
+
+
+def _write_json(
+    dump_path: str,
+    json_object: Any,
+    dump_formats: Optional[tuple[str, ...]] = None,
+    min_bytes: Optional[bytes] = None
+) -> None:
+    global _json_writer_written_count, _json_writer_skipped_count
+
+    file_path: Final[str] = os.path.dirname(dump_path)
+    if file_path:
+        os.makedirs(file_path, exist_ok=True)
+
+    if dump_formats is None:
+        dump_formats = _dump_path_formats(dump_path)
+
+    # Every format is encoded right before it's written, so only a single encoded file is held at a time.
+    encoded_files: Final[Iterator[tuple[str, bytes]]] = _json_encode_formats(json_object, dump_formats, min_bytes)
+
+    # The document is counted as serialized once, however many formats it's encoded to.
+    serialize_count: int = 1
+    while True:
+        clock_start: tuple[float, float] = _report_clock()
+        encoded_file: Optional[tuple[str, bytes]] = next(encoded_files, None)
+        _report_phase(_REPORT_PHASE_SERIALIZE, clock_start, serialize_count)
+        serialize_count = 0
+
+        if encoded_file is None:
+            break
+
+        file_ext, file_bytes = encoded_file
+        file_digest: Optional[str] = None
+        if _json_manifest_path:
+            file_digest = hashlib.sha256(file_bytes).hexdigest()
+
+            if _json_manifest_is_unchanged(dump_path + file_ext, file_bytes, file_digest):
+                with _json_writer_lock:
+                    _json_writer_skipped_count += 1
+
+                _report_file()
+                continue
+
+        clock_start = _report_clock()
+        with open(dump_path + file_ext, _OPEN_FILE_WRITE_BINARY_FLAG) as file:
+            file.write(file_bytes)
+
+            if _json_writer_fsync:
+                file.flush()
+                os.fsync(file.fileno())
+
+        _report_phase(_REPORT_PHASE_WRITE, clock_start)
+        _report_file(len(file_bytes))
+
+        if file_digest is not None:
+            _json_manifest_record(dump_path + file_ext, file_digest)
+
+        with _json_writer_lock:
+            _json_writer_written_count += 1
+
+    # Files of formats that are no longer selected would disagree w/ the written ones & be read back in their place.
+    for format_name in _DUMP_FORMATS:
+        if format_name in dump_formats:
+            continue
+
+        stale_file_path: str = dump_path + _DUMP_FORMAT_FILE_EXTS[format_name]
+        try:
+            os.remove(stale_file_path)
+        except FileNotFoundError:
+            continue
+
+        if _json_manifest_path:
+            _json_manifest_forget(stale_file_path)
+
+
+def _dump_json(
+    file_path: Optional[str],
+    file_name: Optional[str],
+    json_object: Optional[Any],
+    dump_formats: Optional[tuple[str, ...]] = None,
+    min_bytes: Optional[bytes] = None
+) -> bool:
+    if file_path is None \
+            or not json_object:
+        return False
+
+    file_path = os.path.normpath(file_path)
+
+    if not file_name:
+        if not file_path:
+            return False
+
+        file_base_name: Final[str] = os.path.basename(file_path)
+        file_split_ext: Final[tuple[str, str]] = os.path.splitext(file_base_name)
+
+        file_path = os.path.dirname(file_path)
+        file_name = file_split_ext[0]
+
+    dump_path: Final[str] = os.path.join(file_path, file_name)
+
+    if not _json_writer_queues:
+        try:
+            _write_json(dump_path, json_object, dump_formats, min_bytes)
+        except Exception as e:
+            _json_writer_fail(e)
+            return False
+
+        return True
+
+    if _json_writer_is_failed():
+        return False
+
+    _json_writer_queues[hash(dump_path) % len(_json_writer_queues)] \
+        .put((dump_path, json_object, dump_formats, min_bytes))
+
+    return True
+
+
+def _sqlite_configure(sqlite_path: Optional[str]) -> None:
+    global _sqlite_connection, _sqlite_is_new
+
+    _sqlite_close()
+
+    if not sqlite_path:
+        return
+
+    sqlite_dir_path: Final[str] = os.path.dirname(sqlite_path)
+    if sqlite_dir_path:
+        os.makedirs(sqlite_dir_path, exist_ok=True)
+
+    _sqlite_is_new = not os.path.exists(sqlite_path)
+
+    # Transactions are managed explicitly, the implicit ones of the module would commit on every schema change.
+    _sqlite_connection = sqlite3.connect(sqlite_path, isolation_level=None)
+    _sqlite_connection.executescript(_SQLITE_SCHEMA)
+    _sqlite_connection.execute('BEGIN')
+
+
+def _sqlite_commit(is_success: Optional[bool]) -> None:
+    if _sqlite_connection is None:
+        return
+
+    _sqlite_connection.execute('COMMIT' if is_success else 'ROLLBACK')
+    _sqlite_connection.execute('BEGIN')
+
+
+def _sqlite_close() -> None:
+    global _sqlite_connection
+
+    if _sqlite_connection is None:
+        return
+
+    if _sqlite_connection.in_transaction:
+        _sqlite_connection.execute('ROLLBACK')
+
+    _sqlite_connection.close()
+    _sqlite_connection = None
+
+
+def _sqlite_field(
+    entity_json: Any,
+    field_name: Union[str, tuple[str, ...]]
+) -> Optional[Any]:
+    if isinstance(field_name, str):
+        return entity_json.get(field_name)
+
+    for field_name_part in field_name:
+        if not isinstance(entity_json, dict):
+            return None
+
+        entity_json = entity_json.get(field_name_part)
+
+    return entity_json
+
+
+def _sqlite_replace(
+    table_name: str,
+    table_columns: dict[str, Union[str, tuple[str, ...]]],
+    entities_json: Optional[Any],
+    scope: Optional[dict[str, Any]] = None
+) -> bool:
+    # Rows of the scope (e.g. tricks of a single map) are replaced as a whole, so deleted entities go away too.
+    #   The first column keys the rows, entities w/o it are left out.
+    if _sqlite_connection is None:
+        return True
+
+    if not isinstance(entities_json, list):
+        return False
+
+    if scope is None:
+        scope = {}
+
+    scope_values: Final[tuple[Any, ...]] = tuple(scope.values())
+    key_field_name: Final[Union[str, tuple[str, ...]]] = next(iter(table_columns.values()))
+    column_names: Final[tuple[str, ...]] = tuple(scope.keys()) + tuple(table_columns.keys())
+
+    delete_sql: str = f'DELETE FROM {table_name}'
+    if scope:
+        delete_sql += ' WHERE ' + ' AND '.join(f'{column_name} = ?' for column_name in scope)
+
+    insert_sql: Final[str] = f'INSERT OR REPLACE INTO {table_name} ({", ".join(column_names)}) ' \
+        f'VALUES ({", ".join("?" * len(column_names))})'
+
+    try:
+        _sqlite_connection.execute(delete_sql, scope_values)
+        _sqlite_connection.executemany(insert_sql, (
+            scope_values + tuple(_sqlite_field(entity_json, field_name) for field_name in table_columns.values())
+            for entity_json in entities_json
+            if isinstance(entity_json, dict)
+            and _sqlite_field(entity_json, key_field_name) is not None
+        ))
+    except sqlite3.Error:
+        return False
+
+    return True
+
+
+def _sqlite_replace_tricks(
+    game_id: int,
+    map_id: int,
+    tricks_json: Optional[Any]
+) -> bool:
+    if _sqlite_connection is None:
+        return True
+
+    if not _sqlite_replace('tricks', _SQLITE_TRICK_COLUMNS, tricks_json, {
+        _SQLITE_GAME_ID_COLUMN_NAME: game_id,
+        _SQLITE_MAP_ID_COLUMN_NAME: map_id
+    }):
+        return False
+
+    # Sequences are deleted per map, each trick then adds its own ones back.
+    try:
+        _sqlite_connection.execute(
+            f'DELETE FROM trick_sequence WHERE {_SQLITE_GAME_ID_COLUMN_NAME} = ? AND {_SQLITE_MAP_ID_COLUMN_NAME} = ?',
+            (game_id, map_id)
+        )
+    except sqlite3.Error:
+        return False
+
+    for trick_json in tricks_json:
+        sequence_json: Optional[Any] = trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_TRIGGER_SEQUENCE_FIELD_NAME)
+        if not sequence_json:
+            continue
+
+        if not _sqlite_replace('trick_sequence', _SQLITE_TRICK_SEQUENCE_COLUMNS, sequence_json, {
+            _SQLITE_GAME_ID_COLUMN_NAME: game_id,
+            _SQLITE_MAP_ID_COLUMN_NAME: map_id,
+            _SQLITE_TRICK_ID_COLUMN_NAME: trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME)
+        }):
+            return False
+
+    return True
+
+
+def _sqlite_export_trick_surf_root_data(
+    games_json: Any,
+    maps_json: Any,
+    players_json: Any,
+    servers_json: Any
+) -> bool:
+    return _sqlite_replace('games', _SQLITE_GAME_COLUMNS, games_json) \
+        and _sqlite_replace('maps', _SQLITE_MAP_COLUMNS, maps_json) \
+        and _sqlite_replace('players', _SQLITE_PLAYER_COLUMNS, players_json) \
+        and _sqlite_replace('servers', _SQLITE_SERVER_COLUMNS, servers_json)
+
+
+def _sqlite_export_trick_surf_endpoint_data(
+    endpoint_key: tuple[Any, ...],
+    endpoint_json: Optional[Any]
+) -> bool:
+    if _sqlite_connection is None:
+        return True
+
+    endpoint_name: Final[str] = endpoint_key[0]
+
+    if endpoint_name == _TRICK_SURF_API_MAP_TRICKS_ENDPOINT_NAME:
+        return _sqlite_replace_tricks(endpoint_key[1], endpoint_key[2], endpoint_json)
+
+    if endpoint_name == _TRICK_SURF_API_MAP_RANKINGS_ENDPOINT_NAME:
+        rankings_json: Final[Optional[Any]] = endpoint_json.get(_SQLITE_RANKINGS_FIELD_NAME) \
+            if isinstance(endpoint_json, dict) \
+            else endpoint_json
+
+        return _sqlite_replace('rankings', _SQLITE_RANKING_COLUMNS, rankings_json, {
+            _SQLITE_GAME_ID_COLUMN_NAME: endpoint_key[1],
+            _SQLITE_MAP_ID_COLUMN_NAME: endpoint_key[2]
+        })
+
+    if endpoint_name == _TRICK_SURF_API_MAP_TRIGGERS_ENDPOINT_NAME:
+        return _sqlite_replace('triggers', _SQLITE_TRIGGER_COLUMNS, endpoint_json, {
+            _SQLITE_MAP_ID_COLUMN_NAME: endpoint_key[1]
+        })
+
+    if endpoint_name == _TRICK_SURF_API_MAP_TELEPORTS_ENDPOINT_NAME:
+        return _sqlite_replace('teleports', _SQLITE_TELEPORT_COLUMNS, endpoint_json, {
+            _SQLITE_MAP_ID_COLUMN_NAME: endpoint_key[1]
+        })
+
+    if endpoint_name == _TRICK_SURF_API_EVENTS_ENDPOINT_NAME:
+        return _sqlite_replace('events', _SQLITE_EVENT_COLUMNS, endpoint_json, {
+            _SQLITE_GAME_ID_COLUMN_NAME: endpoint_key[1]
+        })
+
+    if endpoint_name == _TRICK_SURF_API_PLAYERS_ENDPOINT_NAME:
+        return _sqlite_replace('game_players', _SQLITE_GAME_PLAYER_COLUMNS, endpoint_json, {
+            _SQLITE_GAME_ID_COLUMN_NAME: endpoint_key[1]
+        })
+
+    return False
+
+
+def _sqlite_export_trick_gxds_table(
+    table_name: str,
+    table_json: list[dict[str, Any]],
+    table_column_names: dict[int, str]
+) -> bool:
+    return _sqlite_replace(
+        table_name,
+        {column_name: column_name for column_name in table_column_names.values()},
+        table_json
+    )
+
+
+def _trick_surf_tier_keys(
+    trick_points_limits: Union[list[int], tuple[int, ...]]
+) -> tuple[int, ...]:
+    trick_points_keys: Optional[tuple[int, ...]] = _TRICK_SURF_TIER_POINTS_KEYS.get(tuple(trick_points_limits))
+    if trick_points_keys is None:
+        trick_points_keys = tuple(-points_limit for points_limit in trick_points_limits)
+
+    return trick_points_keys
+
+
+def _trick_surf_find_tiers(
+    trick_points_limits: Optional[Union[list[int], tuple[int, ...]]],
+    trick_points: Optional[Iterable[Union[int, float]]]
+) -> list[int]:
+    # Tiers of a whole batch of points, points below the lowest limit get the tier of 0.
+    if not trick_points_limits \
+            or trick_points is None:
+        return []
+
+    trick_points_keys: Final[tuple[int, ...]] = _trick_surf_tier_keys(trick_points_limits)
+    trick_tier_count: Final[int] = len(trick_points_keys)
+
+    if numpy is not None:
+        trick_points_array: Final[Any] = numpy.fromiter(trick_points, dtype=numpy.float64)
+
+        return (trick_tier_count - numpy.searchsorted(trick_points_keys, -trick_points_array, side='left')) \
+            .tolist()
+
+    return [trick_tier_count - bisect_left(trick_points_keys, -points) for points in trick_points]
+
+
+def _trick_surf_is_tier(
+    trick_tier: Optional[Any],
+    tier_count: int
+) -> bool:
+    return isinstance(trick_tier, int) \
+        and not isinstance(trick_tier, bool) \
+        and 1 <= trick_tier <= tier_count
+
+
+def _trick_surf_tier_histogram(
+    tier_count: int,
+    trick_tiers: Iterable[Optional[Any]]
+) -> list[int]:
+    # Trick count of every tier, indexed by the tier itself, missing or unknown tiers are counted at 0.
+    trick_tier_counts: Final[list[int]] = [0] * (tier_count + 1)
+    for trick_tier in trick_tiers:
+        trick_tier_counts[trick_tier if _trick_surf_is_tier(trick_tier, tier_count) else 0] += 1
+
+    return trick_tier_counts
+
+
+def _trick_gxds_player_row(row_values: tuple[Any, ...]) -> Optional[tuple[Any, ...]]:
+    if len(row_values) != _TRICK_GXDS_PLAYER_TABLE_SQL_COLUMN_COUNT:
+        return None
+
+    player_id, steam_id2, steam_id64, name, profile_url = row_values[:5]
+
+    if not _sql_is_id(player_id) \
+            or not isinstance(steam_id2, str) \
+            or not _TRICK_GXDS_PLAYER_STEAM_ID2_REGEX.fullmatch(steam_id2) \
+            or not isinstance(steam_id64, (str, int)) \
+            or not _TRICK_GXDS_PLAYER_STEAM_ID64_REGEX.fullmatch(str(steam_id64)) \
+            or not isinstance(name, str) \
+            or not all(_sql_is_optional_str(value) for value in row_values[5:]):
+        return None
+
+    # Only vanity profile URLs are kept, any other profile URL drops the player.
+    steam_vanity_url: Optional[str] = None
+    if profile_url is not None:
+        profile_url_match: Optional[re.Match] \
+            = _TRICK_GXDS_PLAYER_STEAM_VANITY_URL_REGEX.fullmatch(profile_url) if isinstance(profile_url, str) else None
+
+        if profile_url_match is None:
+            return None
+
+        steam_vanity_url = profile_url_match.group(1)
+
+    return (player_id, steam_id2, str(steam_id64), name, steam_vanity_url) + row_values[5:]
+
+
+def _trick_gxds_route_row(row_values: tuple[Any, ...]) -> Optional[tuple[Any, ...]]:
+    if len(row_values) != _TRICK_GXDS_ROUTE_TABLE_SQL_COLUMN_COUNT \
+            or not all(_sql_is_id(value) for value in row_values):
+        return None
+
+    return row_values
+
+
+def _trick_gxds_trick_row(row_values: tuple[Any, ...]) -> Optional[tuple[Any, ...]]:
+    if len(row_values) != _TRICK_GXDS_TRICK_TABLE_SQL_COLUMN_COUNT:
+        return None
+
+    trick_id, name, points, velocity, create_date, author_id, map_id = row_values
+
+    if not _sql_is_id(trick_id) \
+            or not isinstance(name, str) \
+            or not _sql_is_id(points) \
+            or not _sql_is_id(velocity) \
+            or not _sql_is_optional_str(create_date) \
+            or not _sql_is_id(author_id) \
+            or map_id != _TRICK_GXDS_MAP_ID:
+        return None
+
+    return row_values[:-1]
+
+
+def _trick_gxds_trigger_row(row_values: tuple[Any, ...]) -> Optional[tuple[Any, ...]]:
+    if len(row_values) != _TRICK_GXDS_TRIGGER_TABLE_SQL_COLUMN_COUNT:
+        return None
+
+    trigger_id, name, alt_name, x, y, z, map_id, image_url = row_values
+
+    if not _sql_is_id(trigger_id) \
+            or not isinstance(name, str) \
+            or not _sql_is_optional_str(alt_name) \
+            or not _sql_is_optional_number(x) \
+            or not _sql_is_optional_number(y) \
+            or not _sql_is_optional_number(z) \
+            or map_id != _TRICK_GXDS_MAP_ID \
+            or not _sql_is_optional_str(image_url):
+        return None
+
+    # Some names are stored w/ a leading newline, they're stripped once here for every table that uses them.
+    return trigger_id, name.strip(), alt_name, x, y, z, image_url
+
+
+def _trick_gxds_table_rows(
+    table_stream: Optional[TextIO],
+    table_name: str,
+    table_row: Callable[[tuple[Any, ...]], Optional[tuple[Any, ...]]]
+) -> list[tuple[Any, ...]]:
+    clock_start: Final[tuple[float, float]] = _report_clock()
+
+    table_rows: Final[list[tuple[Any, ...]]] = []
+    for row_table_name, row_values in _sql_insert_rows(table_stream):
+        if row_table_name != table_name:
+            continue
+
+        row: Optional[tuple[Any, ...]] = table_row(row_values)
+        if row is not None:
+            table_rows.append(row)
+
+    _report_phase(_REPORT_PHASE_PARSE, clock_start)
+    return table_rows
+
+
+def _trick_gxds_table_digest(table_path: str) -> Optional[str]:
+    # Taken over the text w/ LF line endings, so a CRLF checkout has the same digest.
+    table_hash: Final[Any] = hashlib.sha256()
+
+    try:
+        with open(table_path, _OPEN_FILE_READ_FLAG, encoding=_TRICK_GXDS_TABLE_FILE_ENCODING) as file:
+            while True:
+                chunk: str = file.read(_SQL_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                table_hash.update(chunk.encode(_TRICK_GXDS_TABLE_FILE_ENCODING))
+    except (OSError, ValueError):
+        return None
+
+    return table_hash.hexdigest()
+
+
+def _trick_gxds_read_table(
+    table_name: str,
+    table_file_name: str,
+    table_url: str,
+    table_row: Callable[[tuple[Any, ...]], Optional[tuple[Any, ...]]],
+    use_remote_source: Optional[bool] = None
+) -> list[tuple[Any, ...]]:
+    if use_remote_source is None:
+        use_remote_source = _DEFAULT_TRICK_GXDS_USE_REMOTE_SOURCE
+
+    if use_remote_source:
+        return _trick_gxds_table_rows(_str_to_stream(_get_url_text(table_url)), table_name, table_row)
+
+    # Local tables are checked in next to the dumps, they are streamed straight from the disk.
+    table_path: Final[str] = os.path.join(_DUMP_TRICK_GXDS_PATH, table_file_name)
+    try:
+        with open(table_path, _OPEN_FILE_READ_FLAG, encoding=_TRICK_GXDS_TABLE_FILE_ENCODING) as file:
+            return _trick_gxds_table_rows(file, table_name, table_row)
+    except (OSError, ValueError):
+        return []
+
+
+def _trick_gxds_table_state(
+    table_file_name: str,
+    previous_table_state: Optional[Any]
+) -> Optional[dict[str, Any]]:
+    table_path: Final[str] = os.path.join(_DUMP_TRICK_GXDS_PATH, table_file_name)
+
+    try:
+        table_stat: Final[os.stat_result] = os.stat(table_path)
+    except OSError:
+        return None
+
+    # An untouched table keeps its previous digest, only tables whose size or modification time changed are hashed.
+    table_digest: Optional[str] = None
+    if isinstance(previous_table_state, dict) \
+            and previous_table_state.get(_TRICK_GXDS_STATE_SIZE_FIELD_NAME) == table_stat.st_size \
+            and previous_table_state.get(_TRICK_GXDS_STATE_MTIME_NS_FIELD_NAME) == table_stat.st_mtime_ns:
+        table_digest = previous_table_state.get(_TRICK_GXDS_STATE_SHA256_FIELD_NAME)
+
+    if not table_digest:
+        table_digest = _trick_gxds_table_digest(table_path)
+
+    if not table_digest:
+        return None
+
+    return {
+        _TRICK_GXDS_STATE_SHA256_FIELD_NAME: table_digest,
+        _TRICK_GXDS_STATE_SIZE_FIELD_NAME: table_stat.st_size,
+        _TRICK_GXDS_STATE_MTIME_NS_FIELD_NAME: table_stat.st_mtime_ns
+    }
+
+
+def _trick_gxds_state_json(
+    previous_state_json: Optional[Any],
+    use_new_points_system: Optional[bool],
+    title_case_trick_names: Optional[bool]
+) -> Optional[dict[str, Any]]:
+    previous_tables_json: Final[Any] = previous_state_json.get(_TRICK_GXDS_STATE_TABLES_FIELD_NAME) \
+        if isinstance(previous_state_json, dict) \
+        else None
+
+    tables_json: Final[dict[str, Any]] = {}
+    for table_file_name in _TRICK_GXDS_TABLE_FILE_NAMES:
+        table_state: Optional[dict[str, Any]] = _trick_gxds_table_state(
+            table_file_name,
+            previous_tables_json.get(table_file_name) if isinstance(previous_tables_json, dict) else None
+        )
+
+        if table_state is None:
+            return None
+
+        tables_json[table_file_name] = table_state
+
+    return {
+        _TRICK_GXDS_STATE_TABLES_FIELD_NAME: tables_json,
+        _TRICK_GXDS_STATE_OPTIONS_FIELD_NAME: {
+            _TRICK_GXDS_STATE_NEW_POINTS_SYSTEM_FIELD_NAME: bool(use_new_points_system),
+            _TRICK_GXDS_STATE_TITLE_CASE_TRICK_NAMES_FIELD_NAME: bool(title_case_trick_names),
+            _TRICK_GXDS_STATE_FORMATS_FIELD_NAME: list(_dump_formats)
+        }
+    }
+
+
+def _trick_gxds_is_unchanged(
+    previous_state_json: Optional[Any],
+    state_json: dict[str, Any]
+) -> bool:
+    if not isinstance(previous_state_json, dict):
+        return False
+
+    def table_digests(tables_json: Any) -> Optional[dict[str, Any]]:
+        if not isinstance(tables_json, dict):
+            return None
+
+        return {
+            table_file_name: table_state.get(_TRICK_GXDS_STATE_SHA256_FIELD_NAME) if isinstance(table_state, dict) else None
+            for table_file_name, table_state in tables_json.items()
+        }
+
+    if table_digests(previous_state_json.get(_TRICK_GXDS_STATE_TABLES_FIELD_NAME)) \
+            != table_digests(state_json[_TRICK_GXDS_STATE_TABLES_FIELD_NAME]) \
+            or previous_state_json.get(_TRICK_GXDS_STATE_OPTIONS_FIELD_NAME) != state_json[_TRICK_GXDS_STATE_OPTIONS_FIELD_NAME]:
+        return False
+
+    # Dumps removed since, or never written in the current formats, are still regenerated.
+    return all(_has_dump_json(dump_path) for dump_path in (
+        os.path.join(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_PLAYER_TABLE_NAME),
+        os.path.join(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_ROUTE_TABLE_NAME),
+        os.path.join(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_TRICK_TABLE_NAME),
+        os.path.join(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_TRIGGER_TABLE_NAME),
+        os.path.join(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_ORIGINAL_NAME),
+        os.path.join(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_SIFTED_NAME)
+    ))
+
+
+def _trick_gxds_store_state(state_json: Optional[dict[str, Any]]) -> bool:
+    # W/o local tables to vouch for the dumps (e.g. after a remote dump), the next local dump parses them again.
+    try:
+        if state_json is None:
+            if os.path.exists(_TRICK_GXDS_STATE_PATH):
+                os.remove(_TRICK_GXDS_STATE_PATH)
+
+            return True
+
+        os.makedirs(os.path.dirname(_TRICK_GXDS_STATE_PATH), exist_ok=True)
+
+        with open(_TRICK_GXDS_STATE_PATH, _OPEN_FILE_WRITE_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
+            json.dump(state_json, file, indent=_JSON_INDENT)
+    except OSError:
+        return False
+
+    return True
+
+
+def _trick_gxds_index_rows(
+    table_rows: list[tuple[Any, ...]],
+    id_column_index: int
+) -> dict[Any, tuple[Any, ...]]:
+    # The first row of an id wins, same as a linear scan would find it.
+    rows_by_id: Final[dict[Any, tuple[Any, ...]]] = {}
+    for table_row in table_rows:
+        rows_by_id.setdefault(table_row[id_column_index], table_row)
+
+    return rows_by_id
+
+
+def _trick_gxds_index_routes(
+    route_table_columns: dict[str, Union[array, list[Any]]]
+) -> dict[Any, list[Any]]:
+    trick_ids: Final[Union[array, list[Any]]] \
+        = route_table_columns[_TRICK_GXDS_ROUTE_TABLE_COLUMN_NAMES[_TRICK_GXDS_ROUTE_TABLE_TRICK_ID_COLUMN_INDEX]]
+
+    trigger_ids: Final[Union[array, list[Any]]] \
+        = route_table_columns[_TRICK_GXDS_ROUTE_TABLE_COLUMN_NAMES[_TRICK_GXDS_ROUTE_TABLE_TRIGGER_ID_COLUMN_INDEX]]
+
+    # Trigger ids of every trick, in the order of the route table.
+    trigger_ids_by_trick_id: Final[dict[Any, list[Any]]] = {}
+    for trick_id, trigger_id in zip(trick_ids, trigger_ids):
+        trigger_ids_by_trick_id.setdefault(trick_id, []) \
+            .append(trigger_id)
+
+    return trigger_ids_by_trick_id
+
+
+def _trick_gxds_author_json(
+    player_row: Optional[tuple[Any, ...]],
+    sift_entries: Optional[bool] = None
+) -> Optional[dict[str, Any]]:
+    if player_row is None:
+        return None
+
+    if sift_entries is None:
+        sift_entries = _DEFAULT_TRICK_GXDS_SIFT_ENTRIES
+
+    player_name: str = player_row[_TRICK_GXDS_PLAYER_TABLE_NAME_COLUMN_INDEX]
+    player_id64: str = player_row[_TRICK_GXDS_PLAYER_TABLE_STEAM_ID64_COLUMN_INDEX]
+
+    if sift_entries:
+        player_name = _TRICK_GXDS_PLAYER_NAMES.get(player_name, player_name)
+        player_id64 = _TRICK_GXDS_PLAYER_ID64S.get(player_id64, player_id64)
+
+    return {
+        'PlayerName': player_name,
+        'ProfileURL': f'https://steamcommunity.com/profiles/{player_id64}'
+    }
+
+
+def _trick_gxds_find_route(
+    trigger_ids_by_trick_id: Optional[dict[Any, list[Any]]],
+    trigger_rows_by_id: Optional[dict[Any, tuple[Any, ...]]],
+    trick_id: Optional[int],
+    sift_entries: Optional[bool] = None
+) -> Optional[list[str]]:
+    if not trigger_ids_by_trick_id \
+            or not trigger_rows_by_id \
+            or trick_id is None:
+        return None
+
+    trigger_ids: Final[Optional[list[Any]]] = trigger_ids_by_trick_id.get(trick_id)
+    if not trigger_ids:
+        return None
 
     if sift_entries is None:
         sift_entries = _DEFAULT_TRICK_GXDS_SIFT_ENTRIES
 
+    trigger_names: list[str] = []
+    for trigger_id in trigger_ids:
+        trigger_name: Optional[str] = None
+
+        trigger_row: Optional[tuple[Any, ...]] = trigger_rows_by_id.get(trigger_id)
+        if trigger_row is not None:
+            trigger_name = trigger_row[_TRICK_GXDS_TRIGGER_TABLE_NAME_COLUMN_INDEX]
+
+        if not trigger_name:
+            return None
+
+        trigger_names.append(trigger_name)
+
+    if not trigger_names:
+        return None
+
+    if sift_entries:
+        return _trick_gxds_sift_route(trigger_names)
+
+    return trigger_names
+
+
+def _trick_gxds_sift_route(trigger_names: Optional[list[str]]) -> Optional[list[str]]:
+    if not trigger_names:
+        return None
+
+    sifted_trigger_names: list[str] = []
+    for trigger_name in trigger_names:
+        sifted_trigger_name: Optional[str] = _TRICK_GXDS_TRIGGER_NAMES.get(trigger_name)
+        if not sifted_trigger_name:
+            return None
+
+        sifted_trigger_names.append(sifted_trigger_name)
+
+    return sifted_trigger_names
+
+
+def _trick_gxds_merge_data(
+    player_table_rows: Optional[list[tuple[Any, ...]]],
+    route_table_columns: Optional[dict[str, Union[array, list[Any]]]],
+    trick_table_rows: Optional[list[tuple[Any, ...]]],
+    trigger_table_rows: Optional[list[tuple[Any, ...]]],
+    use_new_points_system: Optional[bool] = None,
+    title_case_trick_names: Optional[bool] = None
+) -> Optional[tuple[Optional[Any], Optional[Any]]]:
+    if not player_table_rows \
+            or not route_table_columns \
+            or not trick_table_rows \
+            or not trigger_table_rows:
+        return None
+
     if use_new_points_system is None:
         use_new_points_system = _DEFAULT_TRICK_GXDS_USE_NEW_POINTS_SYSTEM
 
@@ -1114,41 +4645,52 @@ def _trick_gxds_merge_data(
     #       }
     #   ]
 
-    tricks: Final[list[dict[str, Any]]] = []
-    for trick_row in trick_table_rows:
+    # Every lookup goes through an index built once instead of scanning the tables for each trick.
+    player_rows_by_id: Final[dict[Any, tuple[Any, ...]]] \
+        = _trick_gxds_index_rows(player_table_rows, _TRICK_GXDS_PLAYER_TABLE_ID_COLUMN_INDEX)
+
+    trigger_rows_by_id: Final[dict[Any, tuple[Any, ...]]] \
+        = _trick_gxds_index_rows(trigger_table_rows, _TRICK_GXDS_TRIGGER_TABLE_ID_COLUMN_INDEX)
+
+    trigger_ids_by_trick_id: Final[dict[Any, list[Any]]] = _trick_gxds_index_routes(route_table_columns)
+
+    # Tiers of every trick are classified at once, tricks below the lowest limit get the tier of 0.
+    trick_tiers: Final[list[int]] = _trick_surf_find_tiers(
+        _TRICK_SURF_TIER_POINTS_LIMITS_OLD,
+        [int(trick_row[_TRICK_GXDS_TRICK_TABLE_POINTS_COLUMN_INDEX]) for trick_row in trick_table_rows]
+    )
+
+    # Each trick is resolved once, its sifted entry is a projection of the original one.
+    original_tricks: Final[list[dict[str, Any]]] = []
+    sifted_tricks: Final[list[dict[str, Any]]] = []
+    for trick_row, trick_tier in zip(trick_table_rows, trick_tiers):
         trick_route: Optional[list[str]] \
-            = _trick_gxds_find_route(route_table_rows, trigger_table_rows, trick_row[_TRICK_GXDS_TRICK_TABLE_ID_COLUMN_INDEX], sift_entries)
+            = _trick_gxds_find_route(trigger_ids_by_trick_id, trigger_rows_by_id, trick_row[_TRICK_GXDS_TRICK_TABLE_ID_COLUMN_INDEX], sift_entries=False)
 
         if not trick_route:
             continue
 
-        trick_points: int = int(trick_row[_TRICK_GXDS_TRICK_TABLE_POINTS_COLUMN_INDEX])
-        trick_tier: Optional[int] = _trick_surf_find_tier(_TRICK_SURF_TIER_POINTS_LIMITS_OLD, trick_points)
-        if trick_tier is None:
+        if not trick_tier:
             continue
 
+        trick_points: int = int(trick_row[_TRICK_GXDS_TRICK_TABLE_POINTS_COLUMN_INDEX])
+
         if trick_tier > _TRICK_SURF_TIER_POINTS_LIMITS_NEW_LENGTH:
             trick_tier = _TRICK_SURF_TIER_POINTS_LIMITS_NEW_LENGTH
 
-        if sift_entries and use_new_points_system:
-            trick_points = _TRICK_SURF_TIER_POINTS_LIMITS_NEW[_TRICK_SURF_TIER_POINTS_LIMITS_NEW_LENGTH - trick_tier]
-
         trick_name: str = trick_row[_TRICK_GXDS_TRICK_TABLE_NAME_COLUMN_INDEX] \
             .strip()
 
-        if sift_entries and title_case_trick_names:
-            trick_name = _str_to_title(trick_name)
-
         trick_pre_speed_lock: bool = not int(trick_row[_TRICK_GXDS_TRICK_TABLE_VELOCITY_COLUMN_INDEX]) == 1
         trick_date: str = trick_row[_TRICK_GXDS_TRICK_TABLE_CREATE_DATE_COLUMN_INDEX]
 
         trick_datetime: datetime = ciso8601.parse_datetime(trick_date)
         trick_timestamp: int = int(time.mktime(trick_datetime.timetuple())) - _TIME_ZONE_OFFSET
 
-        trick_author: Optional[dict[str, Any]] \
-            = _trick_gxds_find_author(player_table_rows, trick_row[_TRICK_GXDS_TRICK_TABLE_AUTHOR_ID_COLUMN_INDEX], sift_entries)
+        trick_author_row: Optional[tuple[Any, ...]] \
+            = player_rows_by_id.get(trick_row[_TRICK_GXDS_TRICK_TABLE_AUTHOR_ID_COLUMN_INDEX])
 
-        tricks.append({
+        original_trick: dict[str, Any] = {
             'Name': trick_name,
             'Points': trick_points,
             'Tier': trick_tier,
@@ -1157,336 +4699,755 @@ def _trick_gxds_merge_data(
             'UpdateDate': trick_date,
             'CreateTimestamp': trick_timestamp,
             'UpdateTimestamp': trick_timestamp,
-            'Author': trick_author,
+            'Author': _trick_gxds_author_json(trick_author_row, sift_entries=False),
             'RoutePath': trick_route
-        })
+        }
 
-    if not tricks:
-        return None
+        original_tricks.append(original_trick)
+
+        sifted_trick_route: Optional[list[str]] = _trick_gxds_sift_route(trick_route)
+        if not sifted_trick_route:
+            continue
+
+        if use_new_points_system:
+            trick_points = _TRICK_SURF_TIER_POINTS_LIMITS_NEW[_TRICK_SURF_TIER_POINTS_LIMITS_NEW_LENGTH - trick_tier]
+
+        if title_case_trick_names:
+            trick_name = _str_to_title(trick_name)
 
-    return tricks
+        sifted_tricks.append({
+            **original_trick,
+            'Name': trick_name,
+            'Points': trick_points,
+            'Author': _trick_gxds_author_json(trick_author_row, sift_entries=True),
+            'RoutePath': sifted_trick_route
+        })
+
+    return original_tricks or None, sifted_tricks or None
 
 
 def _trick_gxds_dump_data(
     use_new_points_system: Optional[bool] = None,
-    title_case_trick_names: Optional[bool] = None
+    title_case_trick_names: Optional[bool] = None,
+    use_remote_source: Optional[bool] = None
 ) -> bool:
-    # TrickGxds' player table & its rows.
-    player_table_text: Optional[str] \
-        = _get_url_text(_TRICK_GXDS_PLAYER_TABLE_URL)
+    if use_remote_source is None:
+        use_remote_source = _DEFAULT_TRICK_GXDS_USE_REMOTE_SOURCE
+
+    # Local tables that didn't change since the previous dump, w/ the same options, aren't parsed again.
+    #   SQLite exports always need the parsed tables.
+    state_json: Optional[dict[str, Any]] = None
+    if not use_remote_source:
+        previous_state_json: Final[Optional[Any]] = _load_json(_TRICK_GXDS_STATE_PATH)
 
+        state_json = _trick_gxds_state_json(previous_state_json, use_new_points_system, title_case_trick_names)
+        if state_json is None:
+            return False
+
+        if _sqlite_connection is None \
+                and _trick_gxds_is_unchanged(previous_state_json, state_json):
+            print(_INFO_MESSAGE_UNCHANGED_TABLES_FMT % _STEP_DUMP_TRICK_GXDS_NAME, file=_STD_OUT_STREAM)
+            return True
+
+    # TrickGxds' player table & its rows.
     player_table_rows: Final[list[tuple[Any, ...]]] \
-        = re.findall(_TRICK_GXDS_PLAYER_TABLE_ROW_REGEX, player_table_text, _REGEX_MULTILINE_FLAG)
+        = _trick_gxds_read_table(
+            _TRICK_GXDS_PLAYER_TABLE_NAME,
+            _TRICK_GXDS_PLAYER_TABLE_FILE_NAME,
+            _TRICK_GXDS_PLAYER_TABLE_URL,
+            _trick_gxds_player_row,
+            use_remote_source
+        )
 
     if not player_table_rows:
         return False
 
-    # TrickGxds' route table & its rows.
-    route_table_text: Optional[str] \
-        = _get_url_text(_TRICK_GXDS_ROUTE_TABLE_URL)
+    # TrickGxds' route table as typed columns, it's only ever walked by its trick & trigger ids.
+    #   Its rows are dropped right after, the JSON object is zipped back from the columns.
+    route_table_columns: Final[Optional[dict[str, Union[array, list[Any]]]]] \
+        = _table_to_columns(
+            _trick_gxds_read_table(
+                _TRICK_GXDS_ROUTE_TABLE_NAME,
+                _TRICK_GXDS_ROUTE_TABLE_FILE_NAME,
+                _TRICK_GXDS_ROUTE_TABLE_URL,
+                _trick_gxds_route_row,
+                use_remote_source
+            ),
+            _TRICK_GXDS_ROUTE_TABLE_COLUMN_NAMES,
+            _TRICK_GXDS_ROUTE_TABLE_COLUMN_TYPES
+        )
+
+    if not route_table_columns:
+        return False
+
+    # TrickGxds' trick table & its rows.
+    trick_table_rows: Final[list[tuple[Any, ...]]] \
+        = _trick_gxds_read_table(
+            _TRICK_GXDS_TRICK_TABLE_NAME,
+            _TRICK_GXDS_TRICK_TABLE_FILE_NAME,
+            _TRICK_GXDS_TRICK_TABLE_URL,
+            _trick_gxds_trick_row,
+            use_remote_source
+        )
+
+    if not trick_table_rows:
+        return False
+
+    # TrickGxds' trigger table & its rows.
+    trigger_table_rows: Final[list[tuple[Any, ...]]] \
+        = _trick_gxds_read_table(
+            _TRICK_GXDS_TRIGGER_TABLE_NAME,
+            _TRICK_GXDS_TRIGGER_TABLE_FILE_NAME,
+            _TRICK_GXDS_TRIGGER_TABLE_URL,
+            _trick_gxds_trigger_row,
+            use_remote_source
+        )
+
+    if not trigger_table_rows:
+        return False
+
+    # TrickGxds' player table JSON object.
+    player_table_json: Final[Optional[Any]] \
+        = _table_to_json(player_table_rows, _TRICK_GXDS_PLAYER_TABLE_COLUMN_NAMES, _TRICK_GXDS_PLAYER_TABLE_COLUMN_TYPES)
+
+    if not player_table_json:
+        return False
+
+    # TrickGxds' route table JSON object.
+    route_table_json: Final[Optional[Any]] = _columns_to_json(route_table_columns)
+
+    if not route_table_json:
+        return False
+
+    # TrickGxds' trick table JSON object.
+    trick_table_json: Final[Optional[Any]] \
+        = _table_to_json(trick_table_rows, _TRICK_GXDS_TRICK_TABLE_COLUMN_NAMES, _TRICK_GXDS_TRICK_TABLE_COLUMN_TYPES)
+
+    if not trick_table_json:
+        return False
+
+    # TrickGxds' trigger table JSON object.
+    trigger_table_json: Final[Optional[Any]] \
+        = _table_to_json(trigger_table_rows, _TRICK_GXDS_TRIGGER_TABLE_COLUMN_NAMES, _TRICK_GXDS_TRIGGER_TABLE_COLUMN_TYPES)
+
+    if not trigger_table_json:
+        return False
+
+    # TrickGxds' merged JSON w/ original & sifted entries.
+    merged_jsons: Final[Optional[tuple[Optional[Any], Optional[Any]]]] \
+        = _trick_gxds_merge_data(
+            player_table_rows,
+            route_table_columns,
+            trick_table_rows,
+            trigger_table_rows,
+            use_new_points_system,
+            title_case_trick_names
+        )
+
+    if not merged_jsons:
+        return False
+
+    original_json, sifted_json = merged_jsons
+    if not original_json \
+            or not sifted_json:
+        return False
+
+    if not _sqlite_export_trick_gxds_table('gxds_players', player_table_json, _TRICK_GXDS_PLAYER_TABLE_COLUMN_NAMES) \
+            or not _sqlite_export_trick_gxds_table('gxds_routes', route_table_json, _TRICK_GXDS_ROUTE_TABLE_COLUMN_NAMES) \
+            or not _sqlite_export_trick_gxds_table('gxds_tricks', trick_table_json, _TRICK_GXDS_TRICK_TABLE_COLUMN_NAMES) \
+            or not _sqlite_export_trick_gxds_table('gxds_triggers', trigger_table_json, _TRICK_GXDS_TRIGGER_TABLE_COLUMN_NAMES):
+        return False
+
+    if not _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_PLAYER_TABLE_NAME, player_table_json) \
+            or not _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_ROUTE_TABLE_NAME, route_table_json) \
+            or not _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_TRICK_TABLE_NAME, trick_table_json) \
+            or not _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_TRIGGER_TABLE_NAME, trigger_table_json) \
+            or not _dump_json(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_ORIGINAL_NAME, original_json) \
+            or not _dump_json(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_SIFTED_NAME, sifted_json):
+        return False
+
+    # The state is only stored once every queued file made it to the disk.
+    if not _json_writer_flush():
+        return False
+
+    return _trick_gxds_store_state(state_json)
+
+
+def _trick_surf_is_full_refresh_due(
+    full_refresh_days: Optional[int] = None
+) -> bool:
+    if full_refresh_days is None:
+        full_refresh_days = _DEFAULT_TRICK_SURF_FULL_REFRESH_DAYS
+
+    state_json: Final[Optional[Any]] = _load_json(_DUMP_TRICK_SURF_STATE_PATH)
+    if not isinstance(state_json, dict):
+        return True
+
+    full_refresh_timestamp: Final[Optional[Any]] = state_json.get(_TRICK_SURF_STATE_FULL_REFRESH_TIMESTAMP_FIELD_NAME)
+    if not isinstance(full_refresh_timestamp, int):
+        return True
+
+    return time.time() - full_refresh_timestamp >= full_refresh_days * _SECONDS_PER_DAY
+
+
+def _trick_surf_store_full_refresh() -> bool:
+    # Written directly, the state file is a single object that should stay diff-friendly w/o a *.min.json twin.
+    try:
+        with open(_DUMP_TRICK_SURF_STATE_PATH, _OPEN_FILE_WRITE_FLAG, encoding=_DUMP_JSON_FILE_ENCODING) as file:
+            json.dump({
+                _TRICK_SURF_STATE_FULL_REFRESH_TIMESTAMP_FIELD_NAME: int(time.time())
+            }, file, indent=_JSON_INDENT)
+    except OSError:
+        return False
+
+    return True
+
+
+def _trick_surf_has_map_dump(
+    game_ids: Optional[list[int]],
+    map_id: Optional[int]
+) -> bool:
+    if not game_ids \
+            or map_id is None:
+        return False
+
+    dump_paths: Final[list[str]] = [
+        _DUMP_TRICK_SURF_MAPS_MAP_ID_TRIGGERS_PATH % map_id,
+        _DUMP_TRICK_SURF_MAPS_MAP_ID_TELEPORTS_PATH % map_id
+    ]
+
+    for game_id in game_ids:
+        dump_paths.append(_DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_PATH % (game_id, map_id))
+        dump_paths.append(_DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_RANKINGS_PATH % (game_id, map_id))
+
+    return all(_has_dump_json(dump_path) for dump_path in dump_paths)
+
+
+def _trick_surf_map_change_indicators(
+    maps_json: Optional[Any]
+) -> dict[int, tuple[Any, Any]]:
+    if not maps_json:
+        return {}
+
+    return {
+        int(map_json[_TRICK_SURF_MAP_JSON_ID_FIELD_NAME]): (
+            map_json.get(_TRICK_SURF_MAP_JSON_TRICK_COUNT_FIELD_NAME),
+            map_json.get(_TRICK_SURF_MAP_JSON_LAST_CONNECT_FIELD_NAME)
+        ) for map_json in maps_json
+    }
+
+
+def _trick_surf_trick_change_indicators(
+    tricks_jsons: Optional[list[Optional[Any]]]
+) -> Optional[set[tuple[int, Any]]]:
+    if tricks_jsons is None:
+        return None
+
+    trick_indicators: Final[set[tuple[int, Any]]] = set()
+    for tricks_json in tricks_jsons:
+        if not tricks_json:
+            continue
+
+        for trick_json in tricks_json:
+            trick_indicators.add((
+                int(trick_json[_TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME]),
+                trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_UPDATE_DATE_FIELD_NAME)
+            ))
+
+    return trick_indicators
+
+
+def _trick_surf_map_object_urls(map_id: int) -> dict[tuple[Any, ...], str]:
+    return {
+        (_TRICK_SURF_API_MAP_TRIGGERS_ENDPOINT_NAME, map_id): _TRICK_SURF_API_MAP_TRIGGERS_URL % map_id,
+        (_TRICK_SURF_API_MAP_TELEPORTS_ENDPOINT_NAME, map_id): _TRICK_SURF_API_MAP_TELEPORTS_URL % map_id
+    }
+
+
+def _trick_surf_dump_entities(
+    dump_path: str,
+    entities_json: Optional[Any],
+    entity_id_field_name: str
+) -> bool:
+    if _dump_entity_index:
+        return _trick_surf_dump_entity_index(dump_path, entities_json, entity_id_field_name)
+
+    if not _dump_json(dump_path, None, entities_json):
+        return False
+
+    # An index left by a previous index layout dump would be read instead of the entity files written now.
+    _dump_entity_index_cache.pop(dump_path, None)
+
+    index_file_path: Final[str] = dump_path + _DUMP_INDEX_FILE_EXT
+    try:
+        os.remove(index_file_path)
+    except FileNotFoundError:
+        pass
+    else:
+        if _json_manifest_path:
+            _json_manifest_forget(index_file_path)
+
+    for entity_json in entities_json:
+        entity_id: int = int(entity_json[entity_id_field_name])
+        if not _dump_json(dump_path, str(entity_id), entity_json):
+            return False
+
+    return True
+
+
+def _trick_surf_dump_entity_index(
+    dump_path: str,
+    entities_json: Any,
+    entity_id_field_name: str
+) -> bool:
+    if not entities_json:
+        return False
+
+    # The compact collection is its compact entities joined by commas & wrapped in brackets,
+    #   every entity's byte range is recorded as it's encoded, so each entity is encoded once.
+    index_json: Final[dict[str, list[int]]] = {}
+    entity_chunks: Final[list[bytes]] = []
+
+    entity_offset: int = _DUMP_MIN_JSON_ARRAY_START_LENGTH
+    for entity_json in entities_json:
+        entity_id: int = int(entity_json[entity_id_field_name])
+        entity_bytes: bytes = _json_dumps_min(entity_json).encode(_DUMP_JSON_FILE_ENCODING)
+
+        index_json[str(entity_id)] = [entity_offset, len(entity_bytes)]
+        entity_chunks.append(entity_bytes)
+        entity_offset += len(entity_bytes) + _DUMP_MIN_JSON_ARRAY_SEPARATOR_LENGTH
 
-    route_table_rows: Final[list[tuple[Any, ...]]] \
-        = re.findall(_TRICK_GXDS_ROUTE_TABLE_ROW_REGEX, route_table_text, _REGEX_MULTILINE_FLAG)
+    min_bytes: Final[bytes] = _DUMP_MIN_JSON_ARRAY_START \
+        + _DUMP_MIN_JSON_ARRAY_SEPARATOR.join(entity_chunks) \
+        + _DUMP_MIN_JSON_ARRAY_END
 
-    if not route_table_rows:
+    if not _dump_json(dump_path, None, entities_json, None, min_bytes):
         return False
 
-    # TrickGxds' trick table & its rows.
-    trick_table_text: Optional[str] \
-        = _get_url_text(_TRICK_GXDS_TRICK_TABLE_URL)
+    _dump_entity_index_cache.pop(dump_path, None)
 
-    trick_table_rows: Final[list[tuple[Any, ...]]] \
-        = re.findall(_TRICK_GXDS_TRICK_TABLE_ROW_REGEX, trick_table_text, _REGEX_MULTILINE_FLAG)
+    return _dump_json(
+        os.path.dirname(dump_path),
+        os.path.basename(dump_path) + _DUMP_INDEX_NAME_SUFFIX,
+        index_json,
+        _DUMP_INDEX_FORMATS
+    )
 
-    if not trick_table_rows:
-        return False
 
-    # TrickGxds' trigger table & its rows.
-    trigger_table_text: Optional[str] \
-        = _get_url_text(_TRICK_GXDS_TRIGGER_TABLE_URL)
+def _trick_surf_dump_root_data(
+    games_json: Any,
+    maps_json: Any,
+    players_json: Any,
+    servers_json: Any
+) -> bool:
+    return _sqlite_export_trick_surf_root_data(games_json, maps_json, players_json, servers_json) \
+        and _trick_surf_dump_entities(_DUMP_TRICK_SURF_GAMES_PATH, games_json, _TRICK_SURF_GAME_JSON_ID_FIELD_NAME) \
+        and _trick_surf_dump_entities(_DUMP_TRICK_SURF_MAPS_PATH, maps_json, _TRICK_SURF_MAP_JSON_ID_FIELD_NAME) \
+        and _trick_surf_dump_entities(_DUMP_TRICK_SURF_PLAYERS_PATH, players_json, _TRICK_SURF_PLAYER_JSON_ID_FIELD_NAME) \
+        and _trick_surf_dump_entities(_DUMP_TRICK_SURF_SERVERS_PATH, servers_json, _TRICK_SURF_SERVER_JSON_ID_FIELD_NAME)
 
-    trigger_table_rows: Final[list[tuple[Any, ...]]] \
-        = re.findall(_TRICK_GXDS_TRIGGER_TABLE_ROW_REGEX, trigger_table_text, _REGEX_MULTILINE_FLAG)
 
-    if not trigger_table_rows:
-        return False
+def _trick_surf_dump_endpoint_data(
+    endpoint_key: tuple[Any, ...],
+    endpoint_json: Optional[Any]
+) -> bool:
+    endpoint_name: Final[str] = endpoint_key[0]
 
-    # TrickGxds' player table JSON object.
-    player_table_json: Final[Optional[Any]] \
-        = _table_to_json(player_table_rows, _TRICK_GXDS_PLAYER_TABLE_COLUMN_NAMES, _TRICK_GXDS_PLAYER_TABLE_COLUMN_TYPES)
+    # An endpoint that returned nothing fails the dump, same as it always did.
+    if not endpoint_json:
+        endpoint_json = None
 
-    if not player_table_json:
+    if not _sqlite_export_trick_surf_endpoint_data(endpoint_key, endpoint_json):
         return False
 
-    # TrickGxds' route table JSON object.
-    route_table_json: Final[Optional[Any]] \
-        = _table_to_json(route_table_rows, _TRICK_GXDS_ROUTE_TABLE_COLUMN_NAMES, _TRICK_GXDS_ROUTE_TABLE_COLUMN_TYPES)
+    if endpoint_name == _TRICK_SURF_API_MAP_TRICKS_ENDPOINT_NAME:
+        return _trick_surf_dump_entities(
+            _DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_PATH % endpoint_key[1:],
+            endpoint_json,
+            _TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME
+        )
 
-    if not route_table_json:
-        return False
+    # for trick_json in tricks_json:
+    #     trick_id: int = int(trick_json[_TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME])
+    #     dump_path: str = _DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_TRICK_ID_RECORDS_PATH % (game_id, map_id, trick_id)
+    #
+    #     records_json: Optional[Any] = _get_url_json(_TRICK_SURF_API_MAP_TRICK_RECORDS_URL % (game_id, map_id, trick_id))
+    #     is_success = _dump_json(dump_path, None, records_json)
+    #     if not is_success:
+    #         return False
+
+    if endpoint_name == _TRICK_SURF_API_MAP_RANKINGS_ENDPOINT_NAME:
+        return _dump_json(_DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_RANKINGS_PATH % endpoint_key[1:], None, endpoint_json)
+
+    if endpoint_name == _TRICK_SURF_API_MAP_TRIGGERS_ENDPOINT_NAME:
+        return _trick_surf_dump_entities(
+            _DUMP_TRICK_SURF_MAPS_MAP_ID_TRIGGERS_PATH % endpoint_key[1:],
+            endpoint_json,
+            _TRICK_SURF_MAP_TRIGGER_JSON_ID_FIELD_NAME
+        )
 
-    # TrickGxds' trick table JSON object.
-    trick_table_json: Final[Optional[Any]] \
-        = _table_to_json(trick_table_rows, _TRICK_GXDS_TRICK_TABLE_COLUMN_NAMES, _TRICK_GXDS_TRICK_TABLE_COLUMN_TYPES)
+    if endpoint_name == _TRICK_SURF_API_MAP_TELEPORTS_ENDPOINT_NAME:
+        return _trick_surf_dump_entities(
+            _DUMP_TRICK_SURF_MAPS_MAP_ID_TELEPORTS_PATH % endpoint_key[1:],
+            endpoint_json,
+            _TRICK_SURF_MAP_TELEPORT_JSON_ID_FIELD_NAME
+        )
 
-    if not trick_table_json:
-        return False
+    if endpoint_name == _TRICK_SURF_API_EVENTS_ENDPOINT_NAME:
+        return _trick_surf_dump_entities(
+            _DUMP_TRICK_SURF_GAMES_GAME_ID_EVENTS_PATH % endpoint_key[1:],
+            endpoint_json,
+            _TRICK_SURF_GAME_EVENT_JSON_ID_FIELD_NAME
+        )
 
-    # TrickGxds' trigger table JSON object.
-    trigger_table_json: Final[Optional[Any]] \
-        = _table_to_json(trigger_table_rows, _TRICK_GXDS_TRIGGER_TABLE_COLUMN_NAMES, _TRICK_GXDS_TRIGGER_TABLE_COLUMN_TYPES)
+    if endpoint_name == _TRICK_SURF_API_PLAYERS_ENDPOINT_NAME:
+        return _trick_surf_dump_entities(
+            _DUMP_TRICK_SURF_GAMES_GAME_ID_PLAYERS_PATH % endpoint_key[1:],
+            endpoint_json,
+            _TRICK_SURF_PLAYER_JSON_ID_FIELD_NAME
+        )
 
-    if not trigger_table_json:
-        return False
+    return False
 
-    # TrickGxds' merged JSON w/ original entries.
-    original_json: Final[Optional[Any]] \
-        = _trick_gxds_merge_data(
-            player_table_rows,
-            route_table_rows,
-            trick_table_rows,
-            trigger_table_rows,
-            use_new_points_system,
-            title_case_trick_names,
-            sift_entries=False,
-        )
 
-    if not original_json:
-        return False
+def _trick_surf_dump_data(
+    max_concurrency: Optional[int] = None,
+    incremental: Optional[bool] = None,
+    full_refresh_days: Optional[int] = None,
+    stream: Optional[bool] = None
+) -> bool:
+    if max_concurrency is None:
+        max_concurrency = _DEFAULT_TRICK_SURF_MAX_CONCURRENCY
 
-    # TrickGxds' merged JSON w/ sifted entries.
-    sifted_json: Final[Optional[Any]] \
-        = _trick_gxds_merge_data(
-            player_table_rows,
-            route_table_rows,
-            trick_table_rows,
-            trigger_table_rows,
-            use_new_points_system,
-            title_case_trick_names,
-            sift_entries=True
-        )
+    if incremental is None:
+        incremental = _DEFAULT_TRICK_SURF_INCREMENTAL
 
-    if not sifted_json:
-        return False
+    if stream is None:
+        stream = _DEFAULT_TRICK_SURF_STREAM
 
-    return _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_PLAYER_TABLE_NAME, player_table_json) \
-        and _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_ROUTE_TABLE_NAME, route_table_json) \
-        and _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_TRICK_TABLE_NAME, trick_table_json) \
-        and _dump_json(_DUMP_TRICK_GXDS_PATH, _TRICK_GXDS_TRIGGER_TABLE_NAME, trigger_table_json) \
-        and _dump_json(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_ORIGINAL_NAME, original_json) \
-        and _dump_json(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_SIFTED_NAME, sifted_json)
+    # A new SQLite export has nothing to keep, so it gets a full refresh too.
+    is_full_refresh: Final[bool] = not incremental \
+        or _sqlite_is_new \
+        or _trick_surf_is_full_refresh_due(full_refresh_days)
 
+    root_jsons: Final[Optional[dict[str, Optional[Any]]]] \
+        = _get_url_json_map({
+            _TRICK_SURF_API_GAMES_ENDPOINT_NAME: _TRICK_SURF_API_GAMES_URL,
+            _TRICK_SURF_API_MAPS_ENDPOINT_NAME: _TRICK_SURF_API_MAPS_URL,
+            _TRICK_SURF_API_PLAYERS_ENDPOINT_NAME: _TRICK_SURF_API_PLAYERS_URL,
+            _TRICK_SURF_API_SERVERS_ENDPOINT_NAME: _TRICK_SURF_API_SERVERS_URL
+        }, max_concurrency)
 
-def _trick_surf_dump_data() -> bool:
-    games_json: Final[Optional[Any]] \
-        = _get_url_json(_TRICK_SURF_API_GAMES_URL)
+    if not root_jsons:
+        return False
 
+    games_json: Final[Optional[Any]] = root_jsons[_TRICK_SURF_API_GAMES_ENDPOINT_NAME]
     if not games_json:
         return False
 
-    maps_json: Final[Optional[Any]] \
-        = _get_url_json(_TRICK_SURF_API_MAPS_URL)
-
+    maps_json: Final[Optional[Any]] = root_jsons[_TRICK_SURF_API_MAPS_ENDPOINT_NAME]
     if not maps_json:
         return False
 
-    players_json: Final[Optional[Any]] \
-        = _get_url_json(_TRICK_SURF_API_PLAYERS_URL)
-
+    players_json: Final[Optional[Any]] = root_jsons[_TRICK_SURF_API_PLAYERS_ENDPOINT_NAME]
     if not players_json:
         return False
 
-    servers_json: Final[Optional[Any]] \
-        = _get_url_json(_TRICK_SURF_API_SERVERS_URL)
-
+    servers_json: Final[Optional[Any]] = root_jsons[_TRICK_SURF_API_SERVERS_ENDPOINT_NAME]
     if not servers_json:
         return False
 
-    game_map_tricks_json: Final[dict[int, Optional[dict[int, Optional[Any]]]]] = {}
-    game_map_rankings_json: Final[dict[int, Optional[dict[int, Optional[Any]]]]] = {}
-    # game_map_trick_records_json: Final[dict[int, Optional[dict[int, Optional[dict[int, Optional[Any]]]]]]] = {}
-    for game_json in games_json:
-        game_id: int = int(game_json[_TRICK_SURF_GAME_JSON_ID_FIELD_NAME])
+    game_ids: Final[list[int]] = [int(game_json[_TRICK_SURF_GAME_JSON_ID_FIELD_NAME]) for game_json in games_json]
+    map_ids: Final[list[int]] = [int(map_json[_TRICK_SURF_MAP_JSON_ID_FIELD_NAME]) for map_json in maps_json]
+
+    # Maps whose trick count & last connect match the previous dump keep their subtrees untouched,
+    # maps w/ the same trick count only get their triggers & teleports refetched if any of their tricks was updated.
+    changed_map_ids: list[int] = map_ids
+    recheck_map_ids: Final[list[int]] = []
+    if not is_full_refresh:
+        previous_map_indicators: Final[dict[int, tuple[Any, Any]]] \
+            = _trick_surf_map_change_indicators(_load_dump_json(_DUMP_TRICK_SURF_MAPS_PATH))
+
+        map_indicators: Final[dict[int, tuple[Any, Any]]] = _trick_surf_map_change_indicators(maps_json)
+
+        changed_map_ids = []
+        for map_id in map_ids:
+            previous_indicators: Optional[tuple[Any, Any]] = previous_map_indicators.get(map_id)
+            if previous_indicators is None \
+                    or previous_indicators[0] != map_indicators[map_id][0] \
+                    or not _trick_surf_has_map_dump(game_ids, map_id):
+                changed_map_ids.append(map_id)
+            elif previous_indicators[1] != map_indicators[map_id][1]:
+                changed_map_ids.append(map_id)
+                recheck_map_ids.append(map_id)
+
+    # Previous tricks are read up front, a streamed dump overwrites them while fetching.
+    previous_map_trick_indicators: Final[dict[int, Optional[set[tuple[int, Any]]]]] = {}
+    map_trick_indicators: Final[dict[int, set[tuple[int, Any]]]] = {}
+    for map_id in recheck_map_ids:
+        previous_map_trick_indicators[map_id] = _trick_surf_trick_change_indicators([
+            _load_dump_json(_DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_PATH % (game_id, map_id))
+            for game_id in game_ids
+        ])
+
+        map_trick_indicators[map_id] = set()
+
+    # Every per-game & per-map endpoint is independent of the others,
+    # so all of them are scheduled at once & keyed by (<endpoint-name>, <id>...).
+    endpoint_urls: Final[dict[tuple[Any, ...], str]] = {}
+    for game_id in game_ids:
+        for map_id in changed_map_ids:
+            endpoint_urls[(_TRICK_SURF_API_MAP_TRICKS_ENDPOINT_NAME, game_id, map_id)] \
+                = _TRICK_SURF_API_MAP_TRICKS_URL % (game_id, map_id)
+
+            endpoint_urls[(_TRICK_SURF_API_MAP_RANKINGS_ENDPOINT_NAME, game_id, map_id)] \
+                = _TRICK_SURF_API_MAP_RANKINGS_URL % (game_id, map_id)
+
+    for map_id in changed_map_ids:
+        if map_id in map_trick_indicators:
+            continue
 
-        game_map_tricks_json[game_id] = {}
-        game_map_rankings_json[game_id] = {}
-        # game_map_trick_records_json[game_id] = {}
-        for map_json in maps_json:
-            map_id: int = int(map_json[_TRICK_SURF_MAP_JSON_ID_FIELD_NAME])
+        endpoint_urls.update(_trick_surf_map_object_urls(map_id))
 
-            game_map_tricks_json[game_id][map_id] = _get_url_json(_TRICK_SURF_API_MAP_TRICKS_URL % (game_id, map_id))
-            if not game_map_tricks_json[game_id][map_id]:
-                game_map_tricks_json[game_id][map_id] = None
+    for game_id in game_ids:
+        endpoint_urls[(_TRICK_SURF_API_EVENTS_ENDPOINT_NAME, game_id)] \
+            = _TRICK_SURF_API_GAME_EVENTS_URL % game_id
 
-            game_map_rankings_json[game_id][map_id] = _get_url_json(_TRICK_SURF_API_MAP_RANKINGS_URL % (game_id, map_id))
-            if not game_map_rankings_json[game_id][map_id]:
-                game_map_rankings_json[game_id][map_id] = None
+        endpoint_urls[(_TRICK_SURF_API_PLAYERS_ENDPOINT_NAME, game_id)] \
+            = _TRICK_SURF_API_GAME_PLAYERS_URL % game_id
 
-            # game_map_trick_records_json[game_id][map_id] = {}
-            # for trick_json in game_map_tricks_json[game_id][map_id]:
-            #     trick_id: int = int(trick_json[_TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME])
-            #
-            #     game_map_trick_records_json[game_id][map_id][trick_id] = _get_url_json(_TRICK_SURF_API_MAP_TRICK_RECORDS_URL % (game_id, map_id, trick_id))
-            #     if not game_map_trick_records_json[game_id][map_id][trick_id]:
-            #         game_map_trick_records_json[game_id][map_id][trick_id] = None
-            #
-            # if not game_map_trick_records_json[game_id][map_id]:
-            #     game_map_trick_records_json[game_id][map_id] = None
+    # A streamed dump writes the root documents first & then every endpoint as soon as it arrives,
+    # so only the requests in flight are held in memory instead of the whole dump.
+    if stream \
+            and not _trick_surf_dump_root_data(games_json, maps_json, players_json, servers_json):
+        return False
 
-        if not game_map_tricks_json[game_id]:
-            game_map_tricks_json[game_id] = None
+    _memory_stage(_MEMORY_STAGE_TRICK_SURF_FETCH)
 
-        if not game_map_rankings_json[game_id]:
-            game_map_rankings_json[game_id] = None
+    endpoint_jsons: Final[dict[tuple[Any, ...], Optional[Any]]] = {}
+    for endpoint_key, endpoint_json in _get_url_json_iter(endpoint_urls.items(), max_concurrency):
+        if endpoint_key[0] == _TRICK_SURF_API_MAP_TRICKS_ENDPOINT_NAME \
+                and endpoint_key[2] in map_trick_indicators:
+            map_trick_indicators[endpoint_key[2]] |= _trick_surf_trick_change_indicators([endpoint_json])
 
-        # if not game_map_trick_records_json[game_id]:
-        #     game_map_trick_records_json[game_id] = None
+        if not stream:
+            _staging_hold(endpoint_jsons, endpoint_key, endpoint_json)
+        elif not _trick_surf_dump_endpoint_data(endpoint_key, endpoint_json):
+            return False
 
-    map_triggers_json: Final[dict[int, Optional[Any]]] = {}
-    map_teleports_json: Final[dict[int, Optional[Any]]] = {}
-    for map_json in maps_json:
-        map_id: int = int(map_json[_TRICK_SURF_MAP_JSON_ID_FIELD_NAME])
+    # Triggers & teleports of the maps w/ an unchanged trick count depend on tricks' update dates.
+    recheck_endpoint_urls: Final[dict[tuple[Any, ...], str]] = {}
+    for map_id, trick_indicators in map_trick_indicators.items():
+        if previous_map_trick_indicators[map_id] == trick_indicators:
+            continue
 
-        map_triggers_json[map_id] = _get_url_json(_TRICK_SURF_API_MAP_TRIGGERS_URL % map_id)
-        if not map_triggers_json[map_id]:
-            map_triggers_json[map_id] = None
+        recheck_endpoint_urls.update(_trick_surf_map_object_urls(map_id))
 
-        map_teleports_json[map_id] = _get_url_json(_TRICK_SURF_API_MAP_TELEPORTS_URL % map_id)
-        if not map_teleports_json[map_id]:
-            map_teleports_json[map_id] = None
+    for endpoint_key, endpoint_json in _get_url_json_iter(recheck_endpoint_urls.items(), max_concurrency):
+        if not stream:
+            _staging_hold(endpoint_jsons, endpoint_key, endpoint_json)
+        elif not _trick_surf_dump_endpoint_data(endpoint_key, endpoint_json):
+            return False
 
-    game_events_json: Final[dict[int, Optional[Any]]] = {}
-    for game_json in games_json:
-        game_id: int = int(game_json[_TRICK_SURF_GAME_JSON_ID_FIELD_NAME])
+    _memory_stage(_MEMORY_STAGE_TRICK_SURF_WRITE)
 
-        game_events_json[game_id] = _get_url_json(_TRICK_SURF_API_GAME_EVENTS_URL % game_id)
-        if not game_events_json[game_id]:
-            game_events_json[game_id] = None
+    if not stream:
+        if not _trick_surf_dump_root_data(games_json, maps_json, players_json, servers_json):
+            return False
 
-    game_players_json: Final[dict[int, Optional[Any]]] = {}
-    for game_json in games_json:
-        game_id: int = int(game_json[_TRICK_SURF_GAME_JSON_ID_FIELD_NAME])
+        # Written in the order the endpoints were scheduled, not in the order they arrived,
+        # staged payloads are read back one at a time.
+        for endpoint_urls_map in (endpoint_urls, recheck_endpoint_urls):
+            for endpoint_key in endpoint_urls_map:
+                if not _trick_surf_dump_endpoint_data(endpoint_key, _staging_release(endpoint_jsons, endpoint_key)):
+                    return False
 
-        game_players_json[game_id] = _get_url_json(_TRICK_SURF_API_GAME_PLAYERS_URL % game_id)
-        if not game_players_json[game_id]:
-            game_players_json[game_id] = None
+    # The state is only stored once every queued file made it to the disk.
+    if not _json_writer_flush():
+        return False
 
-    is_success: bool = _dump_json(_DUMP_TRICK_SURF_GAMES_PATH, None, games_json) \
-        and _dump_json(_DUMP_TRICK_SURF_MAPS_PATH, None, maps_json) \
-        and _dump_json(_DUMP_TRICK_SURF_PLAYERS_PATH, None, players_json) \
-        and _dump_json(_DUMP_TRICK_SURF_SERVERS_PATH, None, servers_json)
+    if incremental and is_full_refresh:
+        return _trick_surf_store_full_refresh()
 
-    if not is_success:
-        return False
+    return True
 
-    for game_json in games_json:
-        game_id: int = int(game_json[_TRICK_SURF_GAME_JSON_ID_FIELD_NAME])
-        is_success = _dump_json(_DUMP_TRICK_SURF_GAMES_PATH, str(game_id), game_json)
-        if not is_success:
-            return False
 
-    for map_json in maps_json:
-        map_id: int = int(map_json[_TRICK_SURF_MAP_JSON_ID_FIELD_NAME])
-        is_success = _dump_json(_DUMP_TRICK_SURF_MAPS_PATH, str(map_id), map_json)
-        if not is_success:
-            return False
+def _trigger_trie_key(trigger_name: str) -> str:
+    return _TRICK_GXDS_TRIGGER_NAME_GROUP_REGEX.sub('', trigger_name) \
+        .strip() \
+        .casefold()
 
-    for player_json in players_json:
-        player_id: int = int(player_json[_TRICK_SURF_PLAYER_JSON_ID_FIELD_NAME])
-        is_success = _dump_json(_DUMP_TRICK_SURF_PLAYERS_PATH, str(player_id), player_json)
-        if not is_success:
-            return False
 
-    for server_json in servers_json:
-        server_id: int = int(server_json[_TRICK_SURF_SERVER_JSON_ID_FIELD_NAME])
-        is_success = _dump_json(_DUMP_TRICK_SURF_SERVERS_PATH, str(server_id), server_json)
-        if not is_success:
-            return False
+def _trick_surf_sequence_trie(
+    tricks_json: Optional[Any]
+) -> dict[Optional[str], Any]:
+    # Every trick's trigger sequence is inserted once, shared prefixes share their nodes.
+    trigger_trie: Final[dict[Optional[str], Any]] = {}
+    if not isinstance(tricks_json, list):
+        return trigger_trie
 
-    for game_id, map_tricks_json in game_map_tricks_json.items():
-        for map_id, tricks_json in map_tricks_json.items():
-            dump_path: str = _DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_PATH % (game_id, map_id)
+    for trick_json in tricks_json:
+        sequence_json: Optional[Any] = trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_TRIGGER_SEQUENCE_FIELD_NAME)
+        if not sequence_json:
+            continue
 
-            is_success = _dump_json(dump_path, None, tricks_json)
-            if not is_success:
-                return False
+        trie_node: dict[Optional[str], Any] = trigger_trie
+        for trigger_json in sorted(sequence_json, key=itemgetter(_TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_ORDER_FIELD_NAME)):
+            trigger_key: str = _trigger_trie_key(trigger_json[_TRICK_SURF_MAP_TRICK_SEQUENCE_TRIGGER_JSON_NAME_FIELD_NAME])
+            trie_node = trie_node.setdefault(trigger_key, {})
 
-            for trick_json in tricks_json:
-                trick_id: int = int(trick_json[_TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME])
-                is_success = _dump_json(dump_path, str(trick_id), trick_json)
-                if not is_success:
-                    return False
+        trie_node.setdefault(_TRIGGER_TRIE_TRICKS_KEY, []) \
+            .append({
+                'Id': trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_ID_FIELD_NAME),
+                'Name': trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_NAME_FIELD_NAME)
+            })
 
-    for game_id, map_rankings_json in game_map_rankings_json.items():
-        for map_id, rankings_json in map_rankings_json.items():
-            dump_path: str = _DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_RANKINGS_PATH % (game_id, map_id)
+    return trigger_trie
 
-            is_success = _dump_json(dump_path, None, rankings_json)
-            if not is_success:
-                return False
 
-    # for game_id, map_trick_records_json in game_map_trick_records_json.items():
-    #     for map_id, trick_records_json in map_trick_records_json.items():
-    #         for trick_id, records_json in trick_records_json.items():
-    #             dump_path: str = _DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_TRICK_ID_RECORDS_PATH % (game_id, map_id, trick_id)
-    #
-    #             is_success = _dump_json(dump_path, None, records_json)
-    #             if not is_success:
-    #                 return False
+def _trick_gxds_match_route(
+    trigger_trie: dict[Optional[str], Any],
+    route_path: Optional[list[str]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    # Alternatives split the walk, every trie node reachable by the route so far stays active.
+    #   Tricks ending before the route does are prefix matches, the ones ending w/ it are exact matches.
+    exact_matches: Final[list[dict[str, Any]]] = []
+    prefix_matches: Final[list[dict[str, Any]]] = []
+    if not route_path:
+        return exact_matches, prefix_matches
 
-    for map_id, triggers_json in map_triggers_json.items():
-        dump_path: str = _DUMP_TRICK_SURF_MAPS_MAP_ID_TRIGGERS_PATH % map_id
+    trie_nodes: list[dict[Optional[str], Any]] = [trigger_trie]
+    for route_index, trigger_name in enumerate(route_path):
+        next_trie_nodes: dict[int, dict[Optional[str], Any]] = {}
+        for trigger_alternative in trigger_name.split(_TRICK_GXDS_TRIGGER_NAME_ALTERNATIVES_SEPARATOR):
+            trigger_key: str = _trigger_trie_key(trigger_alternative)
 
-        is_success = _dump_json(dump_path, None, triggers_json)
-        if not is_success:
-            return False
+            for trie_node in trie_nodes:
+                next_trie_node: Optional[dict[Optional[str], Any]] = trie_node.get(trigger_key)
+                if next_trie_node is not None:
+                    next_trie_nodes[id(next_trie_node)] = next_trie_node
 
-        for trigger_json in triggers_json:
-            trigger_id: int = int(trigger_json[_TRICK_SURF_MAP_TRIGGER_JSON_ID_FIELD_NAME])
-            is_success = _dump_json(dump_path, str(trigger_id), trigger_json)
-            if not is_success:
-                return False
+        trie_nodes = list(next_trie_nodes.values())
+        if not trie_nodes:
+            break
 
-    for map_id, teleports_json in map_teleports_json.items():
-        dump_path: str = _DUMP_TRICK_SURF_MAPS_MAP_ID_TELEPORTS_PATH % map_id
+        trick_matches: list[dict[str, Any]] = prefix_matches \
+            if route_index < len(route_path) - 1 \
+            else exact_matches
 
-        is_success = _dump_json(dump_path, None, teleports_json)
-        if not is_success:
-            return False
+        for trie_node in trie_nodes:
+            trick_matches.extend(trie_node.get(_TRIGGER_TRIE_TRICKS_KEY, ()))
 
-        for teleport_json in teleports_json:
-            teleport_id: int = int(teleport_json[_TRICK_SURF_MAP_TELEPORT_JSON_ID_FIELD_NAME])
-            is_success = _dump_json(dump_path, str(teleport_id), teleport_json)
-            if not is_success:
-                return False
+    return exact_matches, prefix_matches
 
-    for game_id, events_json in game_events_json.items():
-        dump_path: str = _DUMP_TRICK_SURF_GAMES_GAME_ID_EVENTS_PATH % game_id
 
-        is_success = _dump_json(dump_path, None, events_json)
-        if not is_success:
-            return False
+def _trick_gxds_matches_dump_data() -> bool:
+    # Derived from the dumped files only, the sifted tricks are the ones named after the CS:S map's triggers.
+    sifted_json: Final[Optional[Any]] = _load_dump_json(os.path.join(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_SIFTED_NAME))
+    if not sifted_json:
+        return False
 
-        for event_json in events_json:
-            event_id: int = int(event_json[_TRICK_SURF_GAME_EVENT_JSON_ID_FIELD_NAME])
-            is_success = _dump_json(dump_path, str(event_id), event_json)
-            if not is_success:
-                return False
+    tricks_json: Final[Optional[Any]] \
+        = _load_dump_json(_DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_PATH % (_TRICK_SURF_SKI2_GAME_ID, _TRICK_SURF_SKI2_MAP_ID))
 
-    for game_id, players_json in game_players_json.items():
-        dump_path: str = _DUMP_TRICK_SURF_GAMES_GAME_ID_PLAYERS_PATH % game_id
+    if not tricks_json:
+        return False
 
-        is_success = _dump_json(dump_path, None, players_json)
-        if not is_success:
-            return False
+    trigger_trie: Final[dict[Optional[str], Any]] = _trick_surf_sequence_trie(tricks_json)
+
+    # [
+    #   {
+    #       "Name": "<TRICK-NAME>",
+    #       "RoutePath": ["<TRIGGER-NAME-0>", ..., "<TRIGGER-NAME-N>"],
+    #       "ExactMatches": [{"Id": <TRICK-SURF-TRICK-ID>, "Name": "<TRICK-SURF-TRICK-NAME>"}, ...],
+    #       "PrefixMatches": [{"Id": <TRICK-SURF-TRICK-ID>, "Name": "<TRICK-SURF-TRICK-NAME>"}, ...]
+    #   }
+    # ]
+    matches_json: Final[list[dict[str, Any]]] = []
+    for sifted_trick in sifted_json:
+        route_path: Optional[list[str]] = sifted_trick.get('RoutePath')
+        exact_matches, prefix_matches = _trick_gxds_match_route(trigger_trie, route_path)
+
+        matches_json.append({
+            'Name': sifted_trick.get('Name'),
+            'RoutePath': route_path,
+            'ExactMatches': exact_matches,
+            'PrefixMatches': prefix_matches
+        })
 
-        for player_json in players_json:
-            player_id: int = int(player_json[_TRICK_SURF_PLAYER_JSON_ID_FIELD_NAME])
-            is_success = _dump_json(dump_path, str(player_id), player_json)
-            if not is_success:
-                return False
+    return _dump_json(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_MATCHES_NAME, matches_json)
 
-    return True
+
+def _trick_surf_tiers_dump_data() -> bool:
+    # Derived from the dumped files only, so it also covers maps an incremental dump didn't refetch.
+    games_json: Final[Optional[Any]] = _load_dump_json(_DUMP_TRICK_SURF_GAMES_PATH)
+    if not games_json:
+        return False
+
+    maps_json: Final[Optional[Any]] = _load_dump_json(_DUMP_TRICK_SURF_MAPS_PATH)
+    if not maps_json:
+        return False
+
+    # [
+    #   {
+    #       "GameId": <GAME-ID>,
+    #       "MapId": <MAP-ID>,
+    #       "MapName": "<MAP-NAME>",
+    #       "TrickCount": <TRICK-COUNT>,
+    #       "UntieredCount": <COUNT-OF-TRICKS-W/O-A-KNOWN-TIER>,
+    #       "TierCounts": [<TIER-1-COUNT>, ..., <TIER-N-COUNT>],
+    #       "SubtierCounts": [
+    #           [<TIER-1-SUBTIER-1-COUNT>, ..., <TIER-1-SUBTIER-M-COUNT>],
+    #           ...
+    #           [<TIER-N-SUBTIER-1-COUNT>, ..., <TIER-N-SUBTIER-M-COUNT>]
+    #       ]
+    #   }
+    # ]
+    tiers_json: Final[list[dict[str, Any]]] = []
+    for game_json in games_json:
+        game_id: int = int(game_json[_TRICK_SURF_GAME_JSON_ID_FIELD_NAME])
+
+        for map_json in maps_json:
+            map_id: int = int(map_json[_TRICK_SURF_MAP_JSON_ID_FIELD_NAME])
+
+            tricks_json: Optional[Any] \
+                = _load_dump_json(_DUMP_TRICK_SURF_GAMES_GAME_ID_MAPS_MAP_ID_TRICKS_PATH % (game_id, map_id))
+
+            if not isinstance(tricks_json, list):
+                continue
+
+            trick_tiers: list[Optional[Any]] = []
+            trick_subtiers: list[list[Optional[Any]]] = [[] for _ in range(_TRICK_SURF_TIER_COUNT)]
+            for trick_json in tricks_json:
+                if not isinstance(trick_json, dict):
+                    trick_tiers.append(None)
+                    continue
+
+                trick_tier: Optional[Any] = trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_TIER_FIELD_NAME)
+                trick_tiers.append(trick_tier)
+
+                if _trick_surf_is_tier(trick_tier, _TRICK_SURF_TIER_COUNT):
+                    trick_subtiers[trick_tier - 1].append(trick_json.get(_TRICK_SURF_MAP_TRICK_JSON_SUBTIER_FIELD_NAME))
+
+            trick_tier_counts: list[int] = _trick_surf_tier_histogram(_TRICK_SURF_TIER_COUNT, trick_tiers)
+
+            tiers_json.append({
+                'GameId': game_id,
+                'MapId': map_id,
+                'MapName': map_json.get(_TRICK_SURF_MAP_JSON_NAME_FIELD_NAME),
+                'TrickCount': len(tricks_json),
+                'UntieredCount': trick_tier_counts[0],
+                'TierCounts': trick_tier_counts[1:],
+                'SubtierCounts': [
+                    _trick_surf_tier_histogram(_TRICK_SURF_SUBTIER_COUNT, tier_subtiers)[1:]
+                    for tier_subtiers in trick_subtiers
+                ]
+            })
+
+    if not tiers_json:
+        return False
+
+    return _dump_json(_DUMP_UNIFIED_PATH, _DUMP_UNIFIED_TRICK_SURF_TIERS_NAME, tiers_json)
 
 
 def _main() -> None:
@@ -1520,6 +5481,24 @@ def _main() -> None:
         default=_DEFAULT_ARGUMENT_DUMP_TRICK_SURF_DATA
     )
 
+    arg_parser.add_argument(
+        '--dump-trick-surf-tiers',
+        help='dump per-map tier & subtier histograms of dumped trick surf tricks',
+        dest='is_dump_trick_surf_tiers_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_DUMP_TRICK_SURF_TIERS_DATA,
+        default=_DEFAULT_ARGUMENT_DUMP_TRICK_SURF_TIERS_DATA
+    )
+
+    arg_parser.add_argument(
+        '--dump-trick-gxds-matches',
+        help='dump trick surf tricks matching routes of unified~sifted tricks to json files',
+        dest='is_dump_trick_gxds_matches_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_DUMP_TRICK_GXDS_MATCHES_DATA,
+        default=_DEFAULT_ARGUMENT_DUMP_TRICK_GXDS_MATCHES_DATA
+    )
+
     arg_parser.add_argument(
         '--unified-points-system',
         help='type of points system to use for unified~sifted data dump',
@@ -1538,6 +5517,263 @@ def _main() -> None:
         default=_DEFAULT_ARGUMENT_UNIFIED_TITLE_NAMES
     )
 
+    arg_parser.add_argument(
+        '--trick-gxds-source',
+        help='read trick gxds tables from the local sql files or download them',
+        dest='trick_gxds_source',
+        action='store',
+        choices=_CHOICES_ARGUMENT_TRICK_GXDS_SOURCE,
+        default=_DEFAULT_ARGUMENT_TRICK_GXDS_SOURCE
+    )
+
+    arg_parser.add_argument(
+        '--api-base-url',
+        help='base url of the trick surf api, e.g. of a local mock server',
+        dest='api_base_url',
+        action='store',
+        type=_str_to_url,
+        metavar='<url>',
+        default=_DEFAULT_ARGUMENT_API_BASE_URL
+    )
+
+    arg_parser.add_argument(
+        '--max-concurrency',
+        help='maximum number of trick surf api requests in flight at once',
+        dest='max_concurrency',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<count>',
+        default=_DEFAULT_ARGUMENT_MAX_CONCURRENCY
+    )
+
+    arg_parser.add_argument(
+        '--http-pool-connections',
+        help='number of per-host connection pools kept by the shared http session',
+        dest='http_pool_connections',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<count>',
+        default=_DEFAULT_ARGUMENT_HTTP_POOL_CONNECTIONS
+    )
+
+    arg_parser.add_argument(
+        '--http-pool-maxsize',
+        help='maximum number of keep-alive connections per host (defaults to --max-concurrency)',
+        dest='http_pool_maxsize',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<count>',
+        default=_DEFAULT_ARGUMENT_HTTP_POOL_MAXSIZE
+    )
+
+    arg_parser.add_argument(
+        '--http-timeout',
+        help='connect & read timeout of a single http request in seconds',
+        dest='http_timeout',
+        action='store',
+        type=_str_to_positive_float,
+        metavar='<seconds>',
+        default=_DEFAULT_ARGUMENT_HTTP_TIMEOUT
+    )
+
+    arg_parser.add_argument(
+        '--http-max-retries',
+        help='number of times a request failing w/ a transient error or a throttled request is retried',
+        dest='http_max_retries',
+        action='store',
+        type=_str_to_non_negative_int,
+        metavar='<count>',
+        default=_DEFAULT_ARGUMENT_HTTP_MAX_RETRIES
+    )
+
+    arg_parser.add_argument(
+        '--http-request-rate',
+        help='initial per-host cap of requests per second, adapted to the server afterwards (unlimited by default)',
+        dest='http_request_rate',
+        action='store',
+        type=_str_to_positive_float,
+        metavar='<requests>',
+        default=_DEFAULT_ARGUMENT_HTTP_REQUEST_RATE
+    )
+
+    arg_parser.add_argument(
+        '--http-cache',
+        help='keep api responses in an on-disk cache & revalidate them w/ conditional requests',
+        dest='is_http_cache_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_HTTP_CACHE,
+        default=_DEFAULT_ARGUMENT_HTTP_CACHE
+    )
+
+    arg_parser.add_argument(
+        '--http-cache-size',
+        help='maximum size of the on-disk http cache in mebibytes',
+        dest='http_cache_size',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<mebibytes>',
+        default=_DEFAULT_ARGUMENT_HTTP_CACHE_SIZE
+    )
+
+    arg_parser.add_argument(
+        '--resume',
+        help='resume an interrupted trick surf dump, only endpoints missing from its journal are fetched',
+        dest='is_resume_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_RESUME,
+        default=_DEFAULT_ARGUMENT_RESUME
+    )
+
+    arg_parser.add_argument(
+        '--no-journal',
+        help='don\'t journal fetched trick surf endpoints, an interrupted dump then can\'t be resumed',
+        dest='is_journal_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_JOURNAL,
+        default=_DEFAULT_ARGUMENT_JOURNAL
+    )
+
+    arg_parser.add_argument(
+        '--incremental',
+        help='only refetch & rewrite trick surf maps that changed since the previous dump',
+        dest='is_incremental_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_INCREMENTAL,
+        default=_DEFAULT_ARGUMENT_INCREMENTAL
+    )
+
+    arg_parser.add_argument(
+        '--full-refresh-days',
+        help='number of days after which an incremental dump refetches everything',
+        dest='full_refresh_days',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<days>',
+        default=_DEFAULT_ARGUMENT_FULL_REFRESH_DAYS
+    )
+
+    arg_parser.add_argument(
+        '--stream',
+        help='write every trick surf endpoint as soon as it arrives instead of after all of them were fetched',
+        dest='is_stream_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_STREAM,
+        default=_DEFAULT_ARGUMENT_STREAM
+    )
+
+    arg_parser.add_argument(
+        '--memory-profile',
+        help='trace python allocations & sample the rss to report the peak memory of every stage',
+        dest='is_memory_profile_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_MEMORY_PROFILE,
+        default=_DEFAULT_ARGUMENT_MEMORY_PROFILE
+    )
+
+    arg_parser.add_argument(
+        '--memory-budget',
+        help='rss in mebibytes above which fetched trick surf payloads are staged on the disk until they are written',
+        dest='memory_budget',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<mebibytes>',
+        default=_DEFAULT_ARGUMENT_MEMORY_BUDGET
+    )
+
+    arg_parser.add_argument(
+        '--writer-threads',
+        help='number of background threads writing dumped json files',
+        dest='writer_threads',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<count>',
+        default=_DEFAULT_ARGUMENT_WRITER_THREADS
+    )
+
+    arg_parser.add_argument(
+        '--writer-queue-size',
+        help='maximum number of dumped documents waiting to be written',
+        dest='writer_queue_size',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<count>',
+        default=_DEFAULT_ARGUMENT_WRITER_QUEUE_SIZE
+    )
+
+    arg_parser.add_argument(
+        '--writer-fsync',
+        help='fsync every dumped json file before it counts as written',
+        dest='is_writer_fsync_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_WRITER_FSYNC,
+        default=_DEFAULT_ARGUMENT_WRITER_FSYNC
+    )
+
+    arg_parser.add_argument(
+        '--skip-unchanged',
+        help='don\'t rewrite dumped json files whose content didn\'t change',
+        dest='is_skip_unchanged_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_SKIP_UNCHANGED,
+        default=_DEFAULT_ARGUMENT_SKIP_UNCHANGED
+    )
+
+    arg_parser.add_argument(
+        '--formats',
+        help='comma separated formats of dumped json files, out of pretty, min, gz & xz',
+        dest='formats',
+        action='store',
+        type=_str_to_dump_formats,
+        metavar='<formats>',
+        default=_DEFAULT_ARGUMENT_FORMATS
+    )
+
+    arg_parser.add_argument(
+        '--entity-formats',
+        help='comma separated formats of dumped per-entity json files (defaults to --formats)',
+        dest='entity_formats',
+        action='store',
+        type=_str_to_dump_formats,
+        metavar='<formats>',
+        default=_DEFAULT_ARGUMENT_ENTITY_FORMATS
+    )
+
+    arg_parser.add_argument(
+        '--entity-layout',
+        help='dump every entity to its own json files or index their byte ranges in the collection\'s min json file',
+        dest='entity_layout',
+        action='store',
+        choices=_CHOICES_ARGUMENT_ENTITY_LAYOUT,
+        default=_DEFAULT_ARGUMENT_ENTITY_LAYOUT
+    )
+
+    arg_parser.add_argument(
+        '--report',
+        help='json file to write the per-step, per-phase & per-endpoint performance report of the run to',
+        dest='report_path',
+        action='store',
+        metavar='<path>',
+        default=_DEFAULT_ARGUMENT_REPORT_PATH
+    )
+
+    arg_parser.add_argument(
+        '--report-summary',
+        help='also print the performance report as a summary table',
+        dest='is_report_summary_flag',
+        action='store_const',
+        const=_CONST_ARGUMENT_REPORT_SUMMARY,
+        default=_DEFAULT_ARGUMENT_REPORT_SUMMARY
+    )
+
+    arg_parser.add_argument(
+        '--sqlite',
+        help='also export dumped data to an sqlite database file, updated in place by later dumps',
+        dest='sqlite_path',
+        action='store',
+        metavar='<path>',
+        default=_DEFAULT_ARGUMENT_SQLITE_PATH
+    )
+
     args: Final[ArgumentNamespace] = arg_parser.parse_args()
 
     if args.is_license_flag:
@@ -1555,27 +5791,133 @@ def _main() -> None:
 
     use_new_points_system: Final[Optional[bool]] = _NEW_POINTS_SYSTEM_BOOL.get(args.unified_points_system)
     title_case_trick_names: Final[Optional[bool]] = args.is_unified_title_names_flag
+    use_remote_trick_gxds_source: Final[Optional[bool]] = _REMOTE_TRICK_GXDS_SOURCE_BOOL.get(args.trick_gxds_source)
+
+    if args.is_resume_flag \
+            and not args.is_journal_flag:
+        arg_parser.error('argument --resume: not allowed with argument --no-journal')
+
+    http_pool_maxsize: Final[int] = args.http_pool_maxsize \
+        if args.http_pool_maxsize is not None \
+        else args.max_concurrency
+
+    _http_configure(args.http_pool_connections, http_pool_maxsize, args.http_timeout)
+    _scheduler_configure(args.max_concurrency, args.http_request_rate, args.http_max_retries)
+    _trick_surf_api_configure(args.api_base_url)
+    _report_configure(args.report_path, args.is_report_summary_flag)
+    _memory_configure(args.is_memory_profile_flag, args.memory_budget, _STAGING_PATH)
+
+    if args.is_http_cache_flag:
+        _http_cache_configure(_HTTP_CACHE_PATH, args.http_cache_size)
+
+    _json_writer_configure(args.writer_threads, args.writer_queue_size, args.is_writer_fsync_flag)
+
+    use_entity_index: Final[Optional[bool]] = _INDEX_ENTITY_LAYOUT_BOOL.get(args.entity_layout)
+    if use_entity_index \
+            and _DUMP_FORMAT_MIN not in args.formats:
+        arg_parser.error('argument --entity-layout: index layout requires the min format in --formats')
+
+    _dump_formats_configure(args.formats, args.entity_formats, use_entity_index)
+    _sqlite_configure(args.sqlite_path)
+
+    if args.is_skip_unchanged_flag:
+        _json_manifest_configure(_JSON_MANIFEST_PATH)
 
     # noinspection PyUnusedLocal
     is_success: Optional[bool] = None
 
+    # noinspection PyUnusedLocal
+    step_clock_start: Optional[tuple[float, float]] = None
+
     if args.is_dump_trick_gxds_flag:
-        is_success = _trick_gxds_dump_data(use_new_points_system, title_case_trick_names)
+        step_clock_start = _report_process_clock()
+        _memory_stage(_STEP_DUMP_TRICK_GXDS_NAME)
+        is_success = _trick_gxds_dump_data(use_new_points_system, title_case_trick_names, use_remote_trick_gxds_source)
+        is_success = _json_writer_step_flush(_STEP_DUMP_TRICK_GXDS_NAME) and is_success
+        _report_step(_STEP_DUMP_TRICK_GXDS_NAME, step_clock_start, is_success)
+        _memory_stage(None)
+        _json_manifest_store()
+        _sqlite_commit(is_success)
+
+        if args.is_skip_unchanged_flag:
+            print(_INFO_MESSAGE_WRITTEN_FILES_FMT % ((_STEP_DUMP_TRICK_GXDS_NAME,) + _json_writer_counts()), file=_STD_OUT_STREAM)
+
         if is_success:
             print(_SUCCESS_MESSAGE_DUMP_TRICK_GXDS_DATA, file=_STD_OUT_STREAM)
         else:
             print(_FAILURE_MESSAGE_DUMP_TRICK_GXDS_DATA, file=_STD_ERR_STREAM)
 
     if args.is_dump_trick_surf_flag:
-        is_success = _trick_surf_dump_data()
+        if args.is_journal_flag:
+            _journal_configure(_JOURNAL_PATH, args.is_resume_flag)
+
+        step_clock_start = _report_process_clock()
+        _memory_stage(_STEP_DUMP_TRICK_SURF_NAME)
+        is_success = _trick_surf_dump_data(
+            args.max_concurrency,
+            args.is_incremental_flag,
+            args.full_refresh_days,
+            args.is_stream_flag
+        )
+        is_success = _json_writer_step_flush(_STEP_DUMP_TRICK_SURF_NAME) and is_success
+        _report_step(_STEP_DUMP_TRICK_SURF_NAME, step_clock_start, is_success)
+        _memory_stage(None)
+        _json_manifest_store()
+        _sqlite_commit(is_success)
+
+        if args.is_skip_unchanged_flag:
+            print(_INFO_MESSAGE_WRITTEN_FILES_FMT % ((_STEP_DUMP_TRICK_SURF_NAME,) + _json_writer_counts()), file=_STD_OUT_STREAM)
+
         if is_success:
+            _journal_clear()
             print(_SUCCESS_MESSAGE_DUMP_TRICK_SURF_DATA, file=_STD_OUT_STREAM)
         else:
             print(_FAILURE_MESSAGE_DUMP_TRICK_SURF_DATA, file=_STD_ERR_STREAM)
 
+    if args.is_dump_trick_surf_tiers_flag:
+        step_clock_start = _report_process_clock()
+        _memory_stage(_STEP_DUMP_TRICK_SURF_TIERS_NAME)
+        is_success = _trick_surf_tiers_dump_data()
+        is_success = _json_writer_step_flush(_STEP_DUMP_TRICK_SURF_TIERS_NAME) and is_success
+        _report_step(_STEP_DUMP_TRICK_SURF_TIERS_NAME, step_clock_start, is_success)
+        _memory_stage(None)
+        _json_manifest_store()
+
+        if args.is_skip_unchanged_flag:
+            print(_INFO_MESSAGE_WRITTEN_FILES_FMT % ((_STEP_DUMP_TRICK_SURF_TIERS_NAME,) + _json_writer_counts()), file=_STD_OUT_STREAM)
+
+        if is_success:
+            print(_SUCCESS_MESSAGE_DUMP_TRICK_SURF_TIERS_DATA, file=_STD_OUT_STREAM)
+        else:
+            print(_FAILURE_MESSAGE_DUMP_TRICK_SURF_TIERS_DATA, file=_STD_ERR_STREAM)
+
+    if args.is_dump_trick_gxds_matches_flag:
+        step_clock_start = _report_process_clock()
+        _memory_stage(_STEP_DUMP_TRICK_GXDS_MATCHES_NAME)
+        is_success = _trick_gxds_matches_dump_data()
+        is_success = _json_writer_step_flush(_STEP_DUMP_TRICK_GXDS_MATCHES_NAME) and is_success
+        _report_step(_STEP_DUMP_TRICK_GXDS_MATCHES_NAME, step_clock_start, is_success)
+        _memory_stage(None)
+        _json_manifest_store()
+
+        if args.is_skip_unchanged_flag:
+            print(_INFO_MESSAGE_WRITTEN_FILES_FMT % ((_STEP_DUMP_TRICK_GXDS_MATCHES_NAME,) + _json_writer_counts()), file=_STD_OUT_STREAM)
+
+        if is_success:
+            print(_SUCCESS_MESSAGE_DUMP_TRICK_GXDS_MATCHES_DATA, file=_STD_OUT_STREAM)
+        else:
+            print(_FAILURE_MESSAGE_DUMP_TRICK_GXDS_MATCHES_DATA, file=_STD_ERR_STREAM)
+
 
 if __name__ == '__main__':
     try:
         _main()
     except KeyboardInterrupt:
-        pass
+        if _journal_path:
+            print(_INTERRUPT_MESSAGE_JOURNAL_TRICK_SURF_DATA, file=_STD_ERR_STREAM)
+    finally:
+        _journal_close()
+        _sqlite_close()
+        _memory_close()
+        _report_store()
+        _staging_clear()
@@ -0,0 +1,606 @@
+#!python3.9
+
+#  Trick Surf Data Dump
+#
+#  Copyright (C) 2024  anominy
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Final, Optional, Any, TextIO
+from types import MappingProxyType as MappingProxy
+from argparse import ArgumentParser, ArgumentTypeError, Namespace as ArgumentNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, unquote
+
+import sys
+import os
+import json
+import time
+import random
+import threading
+import hashlib
+import gzip
+import lzma
+
+
+_STD_OUT_STREAM: Final[TextIO] = sys.stdout
+
+_OPEN_FILE_READ_BINARY_FLAG: Final[str] = 'rb'
+
+_CURRENT_PATH: Final[str] = os.path.dirname(__file__)
+_PARENT_PATH: Final[str] = os.path.join(_CURRENT_PATH, '..')
+_DUMP_TRICK_SURF_PATH: Final[str] = os.path.join(_PARENT_PATH, 'trick-surf')
+
+_URL_PATH_SEPARATOR: Final[str] = '/'
+
+# Dumped files mirror the api's endpoint paths, compact files are served first as they are what the api returns.
+_DUMP_JSON_FILE_MIN_EXT: Final[str] = '.min.json'
+_DUMP_JSON_FILE_EXT: Final[str] = '.json'
+_DUMP_JSON_FILE_GZ_EXT: Final[str] = '.min.json.gz'
+_DUMP_JSON_FILE_XZ_EXT: Final[str] = '.min.json.xz'
+
+_DUMP_JSON_FILE_OPENERS: Final[dict[str, Any]] = MappingProxy({
+    _DUMP_JSON_FILE_MIN_EXT: open,
+    _DUMP_JSON_FILE_EXT: open,
+    _DUMP_JSON_FILE_GZ_EXT: gzip.open,
+    _DUMP_JSON_FILE_XZ_EXT: lzma.open
+})
+
+_DUMP_JSON_FILE_EXTS: Final[tuple[str, ...]] = (
+    _DUMP_JSON_FILE_MIN_EXT,
+    _DUMP_JSON_FILE_EXT,
+    _DUMP_JSON_FILE_GZ_EXT,
+    _DUMP_JSON_FILE_XZ_EXT
+)
+
+_JSON_SEPARATORS: Final[tuple[str, str]] = (',', ':')
+
+_TRICK_SURF_GAMES_NAME: Final[str] = 'games'
+_TRICK_SURF_MAPS_NAME: Final[str] = 'maps'
+_TRICK_SURF_RANKINGS_NAME: Final[str] = 'rankings'
+
+_TRICK_SURF_ID_FIELD_NAME: Final[str] = 'id'
+_TRICK_SURF_RANKINGS_MAP_FIELD_NAME: Final[str] = 'map'
+_TRICK_SURF_RANKINGS_FIELD_NAME: Final[str] = 'rankings'
+_TRICK_SURF_RANKINGS_STYLE_ID_FIELD_NAME: Final[str] = 'style_id'
+
+_MOCK_STATS_PATH: Final[str] = '/_mock/stats'
+
+_HTTP_PROTOCOL_VERSION: Final[str] = 'HTTP/1.1'
+
+_HTTP_STATUS_OK: Final[int] = 200
+_HTTP_STATUS_NO_CONTENT: Final[int] = 204
+_HTTP_STATUS_NOT_MODIFIED: Final[int] = 304
+_HTTP_STATUS_NOT_FOUND: Final[int] = 404
+_HTTP_STATUS_TOO_MANY_REQUESTS: Final[int] = 429
+_HTTP_STATUS_SERVER_ERRORS: Final[tuple[int, ...]] = (500, 502, 503)
+
+_HTTP_HEADER_CONTENT_TYPE: Final[str] = 'Content-Type'
+_HTTP_HEADER_CONTENT_LENGTH: Final[str] = 'Content-Length'
+_HTTP_HEADER_ETAG: Final[str] = 'ETag'
+_HTTP_HEADER_IF_NONE_MATCH: Final[str] = 'If-None-Match'
+_HTTP_HEADER_RETRY_AFTER: Final[str] = 'Retry-After'
+
+_HTTP_CONTENT_TYPE_JSON: Final[str] = 'application/json; charset=utf-8'
+
+_HTTP_ETAG_FMT: Final[str] = '"%s"'
+_HTTP_ETAG_SEPARATOR: Final[str] = ','
+
+_BANDWIDTH_CHUNK_SIZE: Final[int] = 16 * 1024
+_KIBIBYTE_SIZE: Final[int] = 1024
+
+_STATS_REQUESTS_FIELD_NAME: Final[str] = 'requests'
+_STATS_BYTES_FIELD_NAME: Final[str] = 'bytes'
+_STATS_STATUSES_FIELD_NAME: Final[str] = 'statuses'
+
+_INFO_MESSAGE_SERVING_FMT: Final[str] = 'INFO :: MockServer :: Serving %s at http://%s:%d/'
+
+_DEFAULT_MOCK_HOST: Final[str] = '127.0.0.1'
+_DEFAULT_MOCK_PORT: Final[int] = 8080
+_DEFAULT_MOCK_LATENCY: Final[float] = 0.0
+_DEFAULT_MOCK_LATENCY_JITTER: Final[float] = 0.0
+_DEFAULT_MOCK_BANDWIDTH: Final[Optional[int]] = None
+_DEFAULT_MOCK_ERROR_RATE: Final[float] = 0.0
+_DEFAULT_MOCK_RATE_LIMIT_RATE: Final[float] = 0.0
+_DEFAULT_MOCK_RETRY_AFTER: Final[int] = 1
+_DEFAULT_MOCK_SEED: Final[Optional[int]] = None
+
+_DEFAULT_ARGUMENT_ROOT: Final[str] = _DUMP_TRICK_SURF_PATH
+_DEFAULT_ARGUMENT_HOST: Final[str] = _DEFAULT_MOCK_HOST
+_DEFAULT_ARGUMENT_PORT: Final[int] = _DEFAULT_MOCK_PORT
+_DEFAULT_ARGUMENT_LATENCY: Final[float] = _DEFAULT_MOCK_LATENCY
+_DEFAULT_ARGUMENT_LATENCY_JITTER: Final[float] = _DEFAULT_MOCK_LATENCY_JITTER
+_DEFAULT_ARGUMENT_BANDWIDTH: Final[Optional[int]] = _DEFAULT_MOCK_BANDWIDTH
+_DEFAULT_ARGUMENT_ERROR_RATE: Final[float] = _DEFAULT_MOCK_ERROR_RATE
+_DEFAULT_ARGUMENT_RATE_LIMIT_RATE: Final[float] = _DEFAULT_MOCK_RATE_LIMIT_RATE
+_DEFAULT_ARGUMENT_RETRY_AFTER: Final[int] = _DEFAULT_MOCK_RETRY_AFTER
+_DEFAULT_ARGUMENT_SEED: Final[Optional[int]] = _DEFAULT_MOCK_SEED
+
+
+# Behaviour of the mock server, set once before it starts serving.
+_mock_root_path: str = _DUMP_TRICK_SURF_PATH
+_mock_latency: float = _DEFAULT_MOCK_LATENCY
+_mock_latency_jitter: float = _DEFAULT_MOCK_LATENCY_JITTER
+_mock_bandwidth: Optional[int] = _DEFAULT_MOCK_BANDWIDTH
+_mock_error_rate: float = _DEFAULT_MOCK_ERROR_RATE
+_mock_rate_limit_rate: float = _DEFAULT_MOCK_RATE_LIMIT_RATE
+_mock_retry_after: int = _DEFAULT_MOCK_RETRY_AFTER
+_mock_random: random.Random = random.Random(_DEFAULT_MOCK_SEED)
+_mock_random_lock: Final[threading.Lock] = threading.Lock()
+
+_mock_stats_lock: Final[threading.Lock] = threading.Lock()
+_mock_stats_requests: int = 0
+_mock_stats_bytes: int = 0
+_mock_stats_statuses: Final[dict[int, int]] = {}
+
+
+def _mock_configure(
+    root_path: Optional[str] = None,
+    latency: Optional[float] = None,
+    latency_jitter: Optional[float] = None,
+    bandwidth: Optional[int] = None,
+    error_rate: Optional[float] = None,
+    rate_limit_rate: Optional[float] = None,
+    retry_after: Optional[int] = None,
+    seed: Optional[int] = None
+) -> None:
+    global _mock_root_path, _mock_latency, _mock_latency_jitter, _mock_bandwidth, \
+        _mock_error_rate, _mock_rate_limit_rate, _mock_retry_after, _mock_random
+
+    if root_path is None:
+        root_path = _DUMP_TRICK_SURF_PATH
+
+    if latency is None:
+        latency = _DEFAULT_MOCK_LATENCY
+
+    if latency_jitter is None:
+        latency_jitter = _DEFAULT_MOCK_LATENCY_JITTER
+
+    if error_rate is None:
+        error_rate = _DEFAULT_MOCK_ERROR_RATE
+
+    if rate_limit_rate is None:
+        rate_limit_rate = _DEFAULT_MOCK_RATE_LIMIT_RATE
+
+    if retry_after is None:
+        retry_after = _DEFAULT_MOCK_RETRY_AFTER
+
+    _mock_root_path = os.path.realpath(root_path)
+    _mock_latency = latency
+    _mock_latency_jitter = latency_jitter
+    _mock_bandwidth = bandwidth
+    _mock_error_rate = error_rate
+    _mock_rate_limit_rate = rate_limit_rate
+    _mock_retry_after = retry_after
+    _mock_random = random.Random(seed)
+
+
+def _mock_stats_record(
+    status_code: int,
+    body_size: int
+) -> None:
+    global _mock_stats_requests, _mock_stats_bytes
+
+    with _mock_stats_lock:
+        _mock_stats_requests += 1
+        _mock_stats_bytes += body_size
+        _mock_stats_statuses[status_code] = _mock_stats_statuses.get(status_code, 0) + 1
+
+
+def _mock_stats_json() -> dict[str, Any]:
+    with _mock_stats_lock:
+        return {
+            _STATS_REQUESTS_FIELD_NAME: _mock_stats_requests,
+            _STATS_BYTES_FIELD_NAME: _mock_stats_bytes,
+            _STATS_STATUSES_FIELD_NAME: {str(status_code): count for status_code, count in sorted(_mock_stats_statuses.items())}
+        }
+
+
+def _mock_random_float() -> float:
+    with _mock_random_lock:
+        return _mock_random.random()
+
+
+def _mock_injected_status() -> Optional[int]:
+    # A single draw decides between both kinds of failures, so their rates add up instead of shadowing each other.
+    draw: Final[float] = _mock_random_float()
+
+    if draw < _mock_rate_limit_rate:
+        return _HTTP_STATUS_TOO_MANY_REQUESTS
+
+    if draw < _mock_rate_limit_rate + _mock_error_rate:
+        with _mock_random_lock:
+            return _mock_random.choice(_HTTP_STATUS_SERVER_ERRORS)
+
+    return None
+
+
+def _mock_delay() -> None:
+    delay: Final[float] = _mock_latency + _mock_latency_jitter * _mock_random_float()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _mock_dump_file_path(url_path: str) -> Optional[str]:
+    relative_path: Final[str] = unquote(urlsplit(url_path).path) \
+        .strip(_URL_PATH_SEPARATOR)
+
+    if not relative_path:
+        return None
+
+    file_path: Final[str] = os.path.realpath(os.path.join(_mock_root_path, *relative_path.split(_URL_PATH_SEPARATOR)))
+    if os.path.commonpath((file_path, _mock_root_path)) != _mock_root_path:
+        return None
+
+    return file_path
+
+
+def _mock_load_body(file_path: str) -> Optional[bytes]:
+    for file_ext in _DUMP_JSON_FILE_EXTS:
+        try:
+            with _DUMP_JSON_FILE_OPENERS[file_ext](file_path + file_ext, _OPEN_FILE_READ_BINARY_FLAG) as file:
+                body: bytes = file.read()
+        except (OSError, EOFError, lzma.LZMAError):
+            continue
+
+        if file_ext == _DUMP_JSON_FILE_EXT:
+            body = _mock_dump_body(json.loads(body))
+
+        return body
+
+    return None
+
+
+def _mock_dump_body(json_object: Any) -> bytes:
+    return json.dumps(json_object, ensure_ascii=False, separators=_JSON_SEPARATORS) \
+        .encode()
+
+
+def _mock_has_map_dump(map_id: Any) -> bool:
+    return os.path.isdir(os.path.join(_mock_root_path, _TRICK_SURF_MAPS_NAME, str(map_id)))
+
+
+def _mock_endpoint_body(file_path: str) -> Optional[bytes]:
+    body: Final[Optional[bytes]] = _mock_load_body(file_path)
+    endpoint_names: Final[list[str]] = os.path.relpath(file_path, _mock_root_path) \
+        .split(os.sep)
+
+    # Maps listed by the api after the tree was dumped have no subtree to replay, so they aren't listed either.
+    if body is not None \
+            and endpoint_names == [_TRICK_SURF_MAPS_NAME]:
+        return _mock_dump_body([
+            map_json
+            for map_json in json.loads(body)
+            if _mock_has_map_dump(map_json[_TRICK_SURF_ID_FIELD_NAME])
+        ])
+
+    # Maps nobody ranked on aren't always dumped w/ rankings, the api answers them w/ an empty envelope.
+    if body is None \
+            and len(endpoint_names) == 5 \
+            and endpoint_names[0] == _TRICK_SURF_GAMES_NAME \
+            and endpoint_names[2] == _TRICK_SURF_MAPS_NAME \
+            and endpoint_names[4] == _TRICK_SURF_RANKINGS_NAME \
+            and _mock_has_map_dump(endpoint_names[3]):
+        maps_body: Final[Optional[bytes]] = _mock_load_body(os.path.join(_mock_root_path, _TRICK_SURF_MAPS_NAME))
+        for map_json in json.loads(maps_body) if maps_body is not None else []:
+            if str(map_json[_TRICK_SURF_ID_FIELD_NAME]) == endpoint_names[3]:
+                return _mock_dump_body({
+                    _TRICK_SURF_RANKINGS_MAP_FIELD_NAME: map_json,
+                    _TRICK_SURF_RANKINGS_FIELD_NAME: [],
+                    _TRICK_SURF_RANKINGS_STYLE_ID_FIELD_NAME: None
+                })
+
+    return body
+
+
+def _mock_etag(body: bytes) -> str:
+    return _HTTP_ETAG_FMT % hashlib.sha256(body).hexdigest()
+
+
+def _mock_is_etag_matched(
+    etag: str,
+    if_none_match: Optional[str]
+) -> bool:
+    if not if_none_match:
+        return False
+
+    return etag in (value.strip() for value in if_none_match.split(_HTTP_ETAG_SEPARATOR))
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = _HTTP_PROTOCOL_VERSION
+
+    # noinspection PyShadowingBuiltins
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path == _MOCK_STATS_PATH:
+            self._send_body(_HTTP_STATUS_OK, json.dumps(_mock_stats_json()).encode(), record_stats=False)
+            return
+
+        _mock_delay()
+
+        injected_status: Final[Optional[int]] = _mock_injected_status()
+        if injected_status is not None:
+            headers: Final[dict[str, str]] = {}
+            if injected_status == _HTTP_STATUS_TOO_MANY_REQUESTS:
+                headers[_HTTP_HEADER_RETRY_AFTER] = str(_mock_retry_after)
+
+            self._send_body(injected_status, b'', headers)
+            return
+
+        file_path: Final[Optional[str]] = _mock_dump_file_path(self.path)
+        if file_path is None:
+            self._send_body(_HTTP_STATUS_NOT_FOUND, b'')
+            return
+
+        # Empty responses aren't dumped at all, so endpoints missing from the tree are answered w/o content.
+        body: Final[Optional[bytes]] = _mock_endpoint_body(file_path)
+        if body is None:
+            self._send_body(_HTTP_STATUS_NO_CONTENT, b'')
+            return
+
+        etag: Final[str] = _mock_etag(body)
+        if _mock_is_etag_matched(etag, self.headers.get(_HTTP_HEADER_IF_NONE_MATCH)):
+            self._send_body(_HTTP_STATUS_NOT_MODIFIED, b'', {_HTTP_HEADER_ETAG: etag})
+            return
+
+        self._send_body(_HTTP_STATUS_OK, body, {_HTTP_HEADER_ETAG: etag})
+
+    def _send_body(
+        self,
+        status_code: int,
+        body: bytes,
+        headers: Optional[dict[str, str]] = None,
+        record_stats: bool = True
+    ) -> None:
+        self.send_response(status_code)
+
+        if body:
+            self.send_header(_HTTP_HEADER_CONTENT_TYPE, _HTTP_CONTENT_TYPE_JSON)
+
+        self.send_header(_HTTP_HEADER_CONTENT_LENGTH, str(len(body)))
+        for header_name, header_value in (headers or {}).items():
+            self.send_header(header_name, header_value)
+
+        self.end_headers()
+
+        if record_stats:
+            _mock_stats_record(status_code, len(body))
+
+        if _mock_bandwidth is None:
+            self.wfile.write(body)
+            return
+
+        # Bodies are sent in chunks paced to the configured bandwidth of a single response.
+        bytes_per_second: Final[int] = _mock_bandwidth * _KIBIBYTE_SIZE
+        for chunk_offset in range(0, len(body), _BANDWIDTH_CHUNK_SIZE):
+            chunk: bytes = body[chunk_offset:chunk_offset + _BANDWIDTH_CHUNK_SIZE]
+            time.sleep(len(chunk) / bytes_per_second)
+            self.wfile.write(chunk)
+
+
+def _mock_server(
+    host: Optional[str] = None,
+    port: Optional[int] = None
+) -> ThreadingHTTPServer:
+    if host is None:
+        host = _DEFAULT_MOCK_HOST
+
+    if port is None:
+        port = _DEFAULT_MOCK_PORT
+
+    server: Final[ThreadingHTTPServer] = ThreadingHTTPServer((host, port), _MockRequestHandler)
+    server.daemon_threads = True
+
+    return server
+
+
+def _mock_server_start(
+    host: Optional[str] = None,
+    port: Optional[int] = None
+) -> ThreadingHTTPServer:
+    # Serves from a background thread, e.g. for a benchmark running the dump in the same process.
+    server: Final[ThreadingHTTPServer] = _mock_server(host, port)
+
+    thread: Final[threading.Thread] = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server
+
+
+def _str_to_non_negative_float(
+    val: Optional[Any]
+) -> float:
+    try:
+        float_val: Final[float] = float(str(val))
+    except ValueError:
+        raise ArgumentTypeError(f'Couldn\'t convert "{val}" to a float value')
+
+    if not float_val >= 0:
+        raise ArgumentTypeError(f'Expected a non-negative float value, got "{val}"')
+
+    return float_val
+
+
+def _str_to_ratio(
+    val: Optional[Any]
+) -> float:
+    float_val: Final[float] = _str_to_non_negative_float(val)
+
+    if float_val > 1:
+        raise ArgumentTypeError(f'Expected a value between 0 & 1, got "{val}"')
+
+    return float_val
+
+
+def _str_to_non_negative_int(
+    val: Optional[Any]
+) -> int:
+    try:
+        int_val: Final[int] = int(str(val))
+    except ValueError:
+        raise ArgumentTypeError(f'Couldn\'t convert "{val}" to an integer value')
+
+    if int_val < 0:
+        raise ArgumentTypeError(f'Expected a non-negative integer value, got "{val}"')
+
+    return int_val
+
+
+def _str_to_positive_int(
+    val: Optional[Any]
+) -> int:
+    try:
+        int_val: Final[int] = int(str(val))
+    except ValueError:
+        raise ArgumentTypeError(f'Couldn\'t convert "{val}" to an integer value')
+
+    if int_val <= 0:
+        raise ArgumentTypeError(f'Expected a positive integer value, got "{val}"')
+
+    return int_val
+
+
+def _main() -> None:
+    arg_parser: Final[ArgumentParser] = ArgumentParser(
+        description='serve a dumped trick surf tree as a local stand-in of the trick surf api'
+    )
+
+    arg_parser.add_argument(
+        '--root',
+        help='directory of the dumped trick surf data to serve',
+        dest='root',
+        action='store',
+        metavar='<path>',
+        default=_DEFAULT_ARGUMENT_ROOT
+    )
+
+    arg_parser.add_argument(
+        '--host',
+        help='address to listen on',
+        dest='host',
+        action='store',
+        metavar='<host>',
+        default=_DEFAULT_ARGUMENT_HOST
+    )
+
+    arg_parser.add_argument(
+        '--port',
+        help='port to listen on, 0 picks a free one',
+        dest='port',
+        action='store',
+        type=_str_to_non_negative_int,
+        metavar='<port>',
+        default=_DEFAULT_ARGUMENT_PORT
+    )
+
+    arg_parser.add_argument(
+        '--latency',
+        help='delay of every response in seconds',
+        dest='latency',
+        action='store',
+        type=_str_to_non_negative_float,
+        metavar='<seconds>',
+        default=_DEFAULT_ARGUMENT_LATENCY
+    )
+
+    arg_parser.add_argument(
+        '--latency-jitter',
+        help='maximum random delay in seconds added on top of --latency',
+        dest='latency_jitter',
+        action='store',
+        type=_str_to_non_negative_float,
+        metavar='<seconds>',
+        default=_DEFAULT_ARGUMENT_LATENCY_JITTER
+    )
+
+    arg_parser.add_argument(
+        '--bandwidth',
+        help='maximum transfer rate of a single response in kibibytes per second',
+        dest='bandwidth',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<kibibytes>',
+        default=_DEFAULT_ARGUMENT_BANDWIDTH
+    )
+
+    arg_parser.add_argument(
+        '--error-rate',
+        help='ratio of requests answered w/ a 500, 502 or 503 status',
+        dest='error_rate',
+        action='store',
+        type=_str_to_ratio,
+        metavar='<ratio>',
+        default=_DEFAULT_ARGUMENT_ERROR_RATE
+    )
+
+    arg_parser.add_argument(
+        '--rate-limit-rate',
+        help='ratio of requests answered w/ a 429 status',
+        dest='rate_limit_rate',
+        action='store',
+        type=_str_to_ratio,
+        metavar='<ratio>',
+        default=_DEFAULT_ARGUMENT_RATE_LIMIT_RATE
+    )
+
+    arg_parser.add_argument(
+        '--retry-after',
+        help='seconds sent in the retry-after header of 429 responses',
+        dest='retry_after',
+        action='store',
+        type=_str_to_positive_int,
+        metavar='<seconds>',
+        default=_DEFAULT_ARGUMENT_RETRY_AFTER
+    )
+
+    arg_parser.add_argument(
+        '--seed',
+        help='seed of the random latency jitter & injected failures',
+        dest='seed',
+        action='store',
+        type=int,
+        metavar='<seed>',
+        default=_DEFAULT_ARGUMENT_SEED
+    )
+
+    args: Final[ArgumentNamespace] = arg_parser.parse_args()
+
+    _mock_configure(
+        args.root,
+        args.latency,
+        args.latency_jitter,
+        args.bandwidth,
+        args.error_rate,
+        args.rate_limit_rate,
+        args.retry_after,
+        args.seed
+    )
+
+    server: Final[ThreadingHTTPServer] = _mock_server(args.host, args.port)
+    print(_INFO_MESSAGE_SERVING_FMT % (_mock_root_path, args.host, server.server_address[1]), file=_STD_OUT_STREAM)
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    try:
+        _main()
+    except KeyboardInterrupt:
+        pass